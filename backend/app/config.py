@@ -3,7 +3,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,11 +34,46 @@ class Settings(BaseSettings):
     # GitHub Repository settings (for pipeline)
     github_repo_owner: str = os.getenv("GITHUB_REPO_OWNER", "PROACTIVA-US")
     github_repo_name: str = os.getenv("GITHUB_REPO_NAME", "CC4")
+    github_api_url: str = os.getenv("GITHUB_API_URL", "https://api.github.com")  # Point at a fake server in tests
+    github_max_connections: int = 10  # Keep-alive pool of the shared GitHub client
     default_branch: str = "main"
 
     # Repository path (for pipeline execution)
     repo_path: str = str(Path(__file__).parent.parent.parent)  # Project root
 
+    # Worktree pool (parallel execution)
+    worktree_provision_concurrency: int = 4  # Worktrees built at the same time on startup
+    worktree_pool_min_size: int = 3  # Autoscaling floor (pool starts at this size)
+    worktree_pool_max_size: int = 8  # Autoscaling ceiling; set equal to min for a fixed pool
+    worktree_scale_down_idle_seconds: float = 600.0  # Retire worktrees idle this long
+    worktree_pool_persistent: bool = False  # Opt in: reuse worktrees across restarts instead of rebuilding
+    worktree_sparse_checkout: bool = False  # Check out only the directories of each task's files
+    worktree_sparse_always_include: List[str] = []  # Extra dirs in every sparse cone (top-level files always are)
+    worktree_dependency_cache: bool = False  # Opt in: share venv/node_modules across worktrees, keyed by lockfile hash
+    worktree_dependency_cache_link_mode: str = "hardlink"  # "hardlink" or "reflink" (cp --reflink=auto)
+    worktree_affinity_wait_seconds: float = 2.0  # Max wait for a warm matching worktree before taking any
+    worktree_lease_ttl_seconds: float = 300.0  # Leases not renewed by a heartbeat for this long are reaped
+    worktree_max_lease_seconds: float = 3600.0  # Hard cap on any lease, heartbeats or not
+    worktree_reserved_for_interactive: int = 0  # Free worktrees held back for interactive acquires (opt in)
+    worktree_priority_aging_seconds: float = 30.0  # Waiting this long promotes a waiter one priority class
+    worktree_max_total: int = 16  # Cap on worktrees across all project pools
+    worktree_max_total_disk_gb: Optional[float] = None  # Cap on disk used by all pools (None = no cap)
+    worktree_pool_idle_evict_seconds: float = 1800.0  # Evict a project's pool after this long unused
+    worktree_clone_mode: Optional[str] = None  # "auto" or "reflink" to reflink from a template (checkout where unsupported); None = git checkout
+    parallel_num_workers: int = 8  # Workers per parallel session; extra workers queue on the pool
+
+    # Claude CLI
+    claude_timeout_seconds: float = 1800.0  # A CLI run is killed (with its whole process group) after this
+    claude_log_dir: str = "../CC4-logs"  # Full CLI output per task, streamed as it runs
+    claude_max_concurrent: int = 4  # CLI processes allowed at once across all sessions
+    claude_rate_per_minute: Optional[float] = None  # CLI runs started per minute (None = unlimited)
+    claude_rate_burst: Optional[int] = None  # Runs that may start back to back (None = claude_max_concurrent)
+    claude_session_max_concurrent: Optional[int] = None  # CLI processes allowed at once per session
+
+    # Git
+    git_push_window_seconds: float = 0.2  # Branches ready within this window are pushed together
+    git_push_max_batch: int = 32  # Refspecs per coalesced git push
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8001
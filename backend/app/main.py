@@ -21,10 +21,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database import init_db
 from app.routers.autonomous import router as autonomous_router
+from app.routers.pool import router as pool_router
 from app.services.parallel_execution_runner import (
     initialize_global_worktree_pool,
     cleanup_global_worktree_pool,
 )
+from app.services.github_client import close_github_clients
 
 # Configure logging
 logging.basicConfig(
@@ -43,7 +45,32 @@ async def lifespan(app: FastAPI):
     logger.info("Database initialized")
 
     logger.info("Initializing worktree pool for parallel execution...")
-    await initialize_global_worktree_pool(pool_size=3, base_dir="../CC4-worktrees")
+    await initialize_global_worktree_pool(
+        pool_size=settings.worktree_pool_min_size,
+        base_dir="../CC4-worktrees",
+        provision_concurrency=settings.worktree_provision_concurrency,
+        min_ready=1,  # Serve as soon as one worktree exists; the rest build in background
+        min_size=settings.worktree_pool_min_size,
+        max_size=settings.worktree_pool_max_size,
+        scale_down_idle_seconds=settings.worktree_scale_down_idle_seconds,
+        persistent=settings.worktree_pool_persistent,
+        sparse_checkout=settings.worktree_sparse_checkout,
+        sparse_always_include=settings.worktree_sparse_always_include,
+        dependency_cache=settings.worktree_dependency_cache,
+        dependency_cache_link_mode=settings.worktree_dependency_cache_link_mode,
+        affinity_wait_seconds=settings.worktree_affinity_wait_seconds,
+        lease_ttl_seconds=settings.worktree_lease_ttl_seconds,
+        max_lease_seconds=settings.worktree_max_lease_seconds,
+        reserved_worktrees=settings.worktree_reserved_for_interactive,
+        priority_aging_seconds=settings.worktree_priority_aging_seconds,
+        max_total_worktrees=settings.worktree_max_total,
+        max_total_disk_bytes=(
+            int(settings.worktree_max_total_disk_gb * 1024**3)
+            if settings.worktree_max_total_disk_gb else None
+        ),
+        pool_idle_evict_seconds=settings.worktree_pool_idle_evict_seconds,
+        clone_mode=settings.worktree_clone_mode,
+    )
     logger.info("Worktree pool ready")
 
     logger.info(f"CC4 backend starting on {settings.host}:{settings.port}")
@@ -55,6 +82,7 @@ async def lifespan(app: FastAPI):
     logger.info("Cleaning up worktree pool...")
     await cleanup_global_worktree_pool()
     logger.info("Worktree pool cleaned up")
+    await close_github_clients()
 
 
 app = FastAPI(
@@ -75,6 +103,7 @@ app.add_middleware(
 
 # Include routers
 app.include_router(autonomous_router)
+app.include_router(pool_router)
 
 
 @app.get("/")
@@ -1,3 +1,4 @@
 from app.routers.autonomous import router as autonomous_router
+from app.routers.pool import router as pool_router
 
-__all__ = ["autonomous_router"]
+__all__ = ["autonomous_router", "pool_router"]
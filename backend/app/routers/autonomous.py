@@ -1,28 +1,54 @@
 """API endpoints for autonomous batch execution."""
 
+import asyncio
+import codecs
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+import uuid
+from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
+from app.config import settings
+from app.database import async_session, get_db
 from app.schemas.autonomous import (
+    PhaseStatsResponse,
     StartAutonomousRequest,
     StartAutonomousResponse,
     AutonomousStatusResponse,
     BatchExecutionResponse,
     TaskExecutionResponse,
+    TaskLogResponse,
 )
 from app.services.batch_orchestrator import BatchOrchestrator, OrchestratorError
 from app.services.execution_runner import start_background_execution
 from app.services.parallel_execution_runner import start_parallel_execution
-from app.models.autonomous import BatchExecution, TaskExecution
+from app.services.phase_timing import aggregate_phases
+from app.services.task_logs import (
+    is_being_written,
+    read_log_range,
+    task_log_path,
+    wait_for_output,
+)
+from app.services.worktree_pool import LeasePriority
+from app.services.worktree_pool_registry import WorktreePoolCapacityExceeded
+from app.models.autonomous import BatchExecution, TaskExecution, TaskStatus
+from app.models.projects import Project
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/autonomous", tags=["autonomous"])
 
+# Task log streaming
+LOG_MAX_RANGE_BYTES = 1024 * 1024  # Largest range one non-follow request may read
+LOG_STREAM_CHUNK_BYTES = 16 * 1024  # Bytes per SSE event; bounds memory per subscriber
+LOG_POLL_SECONDS = 1.0  # Re-check for output written by another process
+LOG_HEARTBEAT_SECONDS = 15.0  # Keep idle SSE connections open through proxies
+
 
 @router.post("/start", response_model=StartAutonomousResponse)
 async def start_autonomous_execution(
@@ -33,7 +59,21 @@ async def start_autonomous_execution(
     Start a new autonomous execution session.
 
     Parses the plan, creates execution structure, and begins orchestration.
+    With project_id set, parallel execution runs in that project's repository.
     """
+    repo_path = None
+    if request.project_id:
+        try:
+            project = await db.get(Project, uuid.UUID(request.project_id))
+        except ValueError:
+            project = None
+        if project is None or not project.repo_path:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Project {request.project_id} not found or has no repo_path",
+            )
+        repo_path = project.repo_path
+
     try:
         orchestrator = BatchOrchestrator(db)
 
@@ -54,7 +94,12 @@ async def start_autonomous_execution(
         else:
             # Use parallel execution for "parallel" or "dagger" mode
             logger.info(f"Started execution {session.id}, triggering parallel execution...")
-            await start_parallel_execution(session.id, num_workers=3)
+            await start_parallel_execution(
+                session.id,
+                num_workers=settings.parallel_num_workers,
+                priority=LeasePriority[request.priority.upper()],
+                repo_path=repo_path,
+            )
 
         return StartAutonomousResponse(
             execution_id=session.id,
@@ -68,6 +113,12 @@ async def start_autonomous_execution(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except WorktreePoolCapacityExceeded as e:
+        logger.error(f"No worktree capacity: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Unexpected error starting execution: {e}")
         raise HTTPException(
@@ -182,3 +233,166 @@ async def get_task(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get task",
         )
+
+
+@router.get(
+    "/{execution_id}/tasks/{task_number}/logs",
+    response_model=TaskLogResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def get_task_logs(
+    execution_id: str,
+    task_number: str,
+    request: Request,
+    offset: int = Query(0, description="Byte offset to start at; negative counts from the end"),
+    limit: int = Query(64 * 1024, ge=1, le=LOG_MAX_RANGE_BYTES),
+    follow: bool = Query(False, description="Stream new output as server-sent events"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Read a task's Claude CLI output, or follow it live.
+
+    Without follow, returns one byte range of the log. With follow, streams
+    the log from offset as server-sent events until the task finishes; each
+    event's id is the byte offset to resume from, and a reconnecting client's
+    Last-Event-ID header takes precedence over offset.
+    """
+    try:
+        result = await db.execute(
+            select(TaskExecution).where(
+                TaskExecution.id.like(f"{execution_id}%"),
+                TaskExecution.task_number == task_number,
+            )
+        )
+        task = result.scalars().first()
+
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task {task_number} not found in execution {execution_id}",
+            )
+
+        path = task_log_path(execution_id, task_number)
+
+        if follow:
+            last_event_id = request.headers.get("last-event-id")
+            if last_event_id and last_event_id.isdigit():
+                offset = int(last_event_id)
+            return StreamingResponse(
+                _stream_task_log(request, task.id, path, offset),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
+        data, next_offset, size = await asyncio.to_thread(read_log_range, path, offset, limit)
+        finished = not is_being_written(path) and not _task_running(task.status)
+        return TaskLogResponse(
+            offset=next_offset - len(data),
+            next_offset=next_offset,
+            size=size,
+            data=data.decode(errors="replace"),
+            complete=finished and next_offset >= size,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting task logs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get task logs",
+        )
+
+
+@router.get("/phases", response_model=PhaseStatsResponse)
+async def get_phase_stats(
+    execution_id: Optional[str] = Query(None, description="Only tasks of this execution"),
+    limit: int = Query(500, ge=1, le=10000, description="Most recently completed tasks to include"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get p50/p95 durations of each execution phase across completed tasks.
+
+    Phases come from the timeline TaskExecutor records for every task
+    (setup, Claude queue and run, staging and commit, push, PR create,
+    mergeability wait, merge), so the slowest step stands out directly.
+    """
+    try:
+        query = (
+            select(TaskExecution.extra_data)
+            .where(TaskExecution.completed_at.is_not(None))
+            .order_by(TaskExecution.completed_at.desc())
+            .limit(limit)
+        )
+        if execution_id:
+            query = query.where(TaskExecution.id.like(f"{execution_id}%"))
+        result = await db.execute(query)
+
+        timelines = [
+            extra["phases"] for extra in result.scalars()
+            if extra and extra.get("phases")
+        ]
+        return PhaseStatsResponse(tasks=len(timelines), phases=aggregate_phases(timelines))
+
+    except Exception as e:
+        logger.error(f"Error getting phase stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get phase stats",
+        )
+
+
+def _task_running(task_status: str) -> bool:
+    return task_status in (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value)
+
+
+async def _task_finished(task_id: str) -> bool:
+    async with async_session() as db:
+        result = await db.execute(
+            select(TaskExecution.status).where(TaskExecution.id == task_id)
+        )
+        task_status = result.scalar_one_or_none()
+    return task_status is None or not _task_running(task_status)
+
+
+def _sse_event(event: str, data: str, event_id: int) -> str:
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"id: {event_id}\nevent: {event}\n{lines}\n"
+
+
+async def _stream_task_log(request: Request, task_id: str, path: Path, offset: int):
+    """
+    Yield a task log as SSE events from offset until the task finishes.
+
+    Each subscriber holds one chunk at a time and reads the spill file
+    directly, so any number of readers can follow the same task.
+    """
+    # A chunk may end mid-character; the decoder carries the bytes over
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    heartbeat_due = time.monotonic() + LOG_HEARTBEAT_SECONDS
+
+    while True:
+        data, offset, _ = await asyncio.to_thread(
+            read_log_range, path, offset, LOG_STREAM_CHUNK_BYTES
+        )
+        if await request.is_disconnected():
+            return
+        if data:
+            text = decoder.decode(data)
+            if text:
+                resume_at = offset - len(decoder.getstate()[0])
+                yield _sse_event("log", text, resume_at)
+                heartbeat_due = time.monotonic() + LOG_HEARTBEAT_SECONDS
+            continue
+
+        if not is_being_written(path) and await _task_finished(task_id):
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield _sse_event("log", tail, offset)
+            yield _sse_event("end", json.dumps({"offset": offset}), offset)
+            return
+
+        if time.monotonic() >= heartbeat_due:
+            yield ": keepalive\n\n"
+            heartbeat_due = time.monotonic() + LOG_HEARTBEAT_SECONDS
+        await wait_for_output(path, LOG_POLL_SECONDS)
@@ -0,0 +1,74 @@
+"""API endpoints for worktree pool and Claude CLI governor telemetry."""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.services.claude_governor import get_claude_governor
+from app.services.github_client import get_github_status
+from app.services.parallel_execution_runner import get_worktree_pool_registry
+from app.services.pool_telemetry import render_prometheus
+from app.services.push_coordinator import get_push_status
+
+router = APIRouter(prefix="/api/v1/pool", tags=["pool"])
+
+
+async def _pools():
+    registry = await get_worktree_pool_registry()
+    if registry is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Worktree pool not initialized",
+        )
+    return registry.get_pools()
+
+
+@router.get("/telemetry")
+async def get_pool_telemetry():
+    """
+    Get counters, latency histograms and utilization timelines of every pool.
+
+    Keyed by repository path.
+    """
+    pools = await _pools()
+    return {repo_path: pool.get_telemetry() for repo_path, pool in pools.items()}
+
+
+@router.get("/details")
+async def get_pool_details():
+    """
+    Get autoscaling, base, sparse, affinity, priority, provisioning, lease,
+    git helper and dependency cache state of every pool.
+
+    Keyed by repository path.
+    """
+    pools = await _pools()
+    return {repo_path: pool.get_pool_status() for repo_path, pool in pools.items()}
+
+
+@router.get("/claude")
+async def get_claude_governor_status():
+    """Get Claude CLI concurrency, rate limit, queue depth and wait times."""
+    return get_claude_governor().get_status()
+
+
+@router.get("/push")
+async def get_push_coordinator_status():
+    """Get coalesced git push statistics per repository."""
+    return get_push_status()
+
+
+@router.get("/github")
+async def get_github_client_status():
+    """Get GitHub API request counts, conditional-request hits and rate-limit budget."""
+    return get_github_status()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_pool_metrics():
+    """Pool and Claude CLI governor telemetry in the Prometheus text exposition format."""
+    pools = await _pools()
+    body = render_prometheus({
+        repo_path: (pool.telemetry, pool.get_gauges())
+        for repo_path, pool in pools.items()
+    }) + get_claude_governor().render_prometheus()
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, List, Optional
 
 
 class StartAutonomousRequest(BaseModel):
@@ -12,6 +12,14 @@ class StartAutonomousRequest(BaseModel):
     end_batch: int = Field(6, ge=1, description="Last batch to execute")
     execution_mode: str = Field("local", description="Execution mode: local")
     auto_merge: bool = Field(True, description="Automatically merge approved PRs")
+    priority: str = Field(
+        "normal",
+        pattern="^(interactive|normal|background)$",
+        description="Worktree priority class: interactive, normal or background",
+    )
+    project_id: Optional[str] = Field(
+        None, description="Project whose repository to run in (default: this repository)"
+    )
 
 
 class TaskExecutionResponse(BaseModel):
@@ -69,3 +77,27 @@ class StartAutonomousResponse(BaseModel):
     execution_id: str
     status: str
     batches_scheduled: List[int]
+
+
+class TaskLogResponse(BaseModel):
+    """A byte range of a task's Claude CLI output."""
+    offset: int = Field(..., description="Byte offset the range starts at")
+    next_offset: int = Field(..., description="Offset to request next")
+    size: int = Field(..., description="Current size of the log in bytes")
+    data: str
+    complete: bool = Field(..., description="Task finished and the whole log has been read")
+
+
+class PhaseSummary(BaseModel):
+    """Duration distribution of one execution phase."""
+    count: int
+    p50_seconds: Optional[float] = None
+    p95_seconds: Optional[float] = None
+    max_seconds: Optional[float] = None
+    total_seconds: float
+
+
+class PhaseStatsResponse(BaseModel):
+    """Per-phase timing across completed tasks."""
+    tasks: int = Field(..., description="Tasks with a recorded phase timeline")
+    phases: Dict[str, PhaseSummary] = {}
@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from typing import Optional
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .worktree_pool import WorktreePool, WorktreeInfo, WorktreeAcquisitionTimeout
+from .worktree_pool import AffinityHint, LeasePriority, WorktreePool, WorktreeInfo, WorktreeAcquisitionTimeout
 from .task_executor import TaskExecutor
+from .task_logs import task_log_path
 from app.database import async_session
 from app.models.autonomous import AutonomousSession, BatchExecution, TaskExecution, TaskStatus
 from sqlalchemy import select
@@ -32,6 +34,7 @@ class AutonomousTaskWorker:
         task_timeout_seconds: float = 1800.0,  # 30 minutes default
         worktree_acquire_timeout: float = 300.0,  # 5 minutes default
         skip_github_ops: bool = False,  # For benchmarking/testing
+        priority: LeasePriority = LeasePriority.NORMAL,
     ):
         """
         Initialize autonomous task worker.
@@ -43,6 +46,7 @@ class AutonomousTaskWorker:
             task_timeout_seconds: Maximum time for a single task (default: 30 min)
             worktree_acquire_timeout: Maximum time to wait for a worktree (default: 5 min)
             skip_github_ops: If True, skip push/PR/merge operations (for local testing)
+            priority: Priority class for worktree acquisition
         """
         self.worker_id = worker_id
         self.execution_id = execution_id
@@ -50,8 +54,10 @@ class AutonomousTaskWorker:
         self.task_timeout_seconds = task_timeout_seconds
         self.worktree_acquire_timeout = worktree_acquire_timeout
         self.skip_github_ops = skip_github_ops
+        self.priority = priority
         self.is_running = False
         self.current_task: Optional[TaskExecution] = None
+        self._last_worktree_id: Optional[str] = None  # Affinity hint for the next lease
 
     async def run(self):
         """Main worker loop - continuously process tasks until session is complete."""
@@ -140,9 +146,11 @@ class AutonomousTaskWorker:
                 logger.debug(f"[{self.worker_id}] Task {task_id} was claimed by another worker")
                 return None
 
-            # Fetch the task we just claimed
+            # Fetch the task we just claimed, with its batch for the batch number
             result = await session.execute(
-                select(TaskExecution).where(TaskExecution.id == task_id)
+                select(TaskExecution)
+                .options(selectinload(TaskExecution.batch))
+                .where(TaskExecution.id == task_id)
             )
             task = result.scalar_one()
             logger.info(f"[{self.worker_id}] Successfully claimed task {task_id}")
@@ -153,16 +161,35 @@ class AutonomousTaskWorker:
         """Execute a single task in an isolated worktree."""
         self.current_task = task
         worktree: Optional[WorktreeInfo] = None
+        lease_id: Optional[int] = None
+        heartbeat = AsyncExitStack()
 
         try:
             logger.info(f"[{self.worker_id}] Executing task {task.id} (batch {task.batch_execution_id})")
 
             # Acquire worktree from pool
             try:
+                # Scope a sparse worktree to the task's declared files (full checkout if none)
+                # and prefer a tree that is already warm for this batch or these files
+                extra = task.extra_data or {}
+                files = extra.get("files") or None
+                affinity = AffinityHint(
+                    batch=task.batch.batch_number,
+                    files=files,
+                    worktree_id=self._last_worktree_id,
+                )
                 worktree = await asyncio.wait_for(
-                    self.pool.acquire(test_name=str(task.id)),
+                    self.pool.acquire(
+                        test_name=str(task.id),
+                        files=files,
+                        affinity=affinity,
+                        priority=self.priority,
+                    ),
                     timeout=self.worktree_acquire_timeout
                 )
+                self._last_worktree_id = worktree.id
+                # Renew the lease while we work so the reaper leaves it alone
+                lease_id = await heartbeat.enter_async_context(self.pool.keep_alive(worktree))
                 logger.info(f"[{self.worker_id}] Acquired {worktree.id} for task {task.id}")
             except asyncio.TimeoutError:
                 raise WorktreeAcquisitionTimeout(
@@ -170,8 +197,16 @@ class AutonomousTaskWorker:
                 )
 
             # Execute task using TaskExecutor
+            # The CLI's process group is tied to the lease, so the reaper can kill it
             executor = TaskExecutor(
                 repo_path=str(worktree.path),
+                sparse_checkout=self.pool.sparse_checkout,
+                on_process_start=lambda pgid: self.pool.register_lease_process(
+                    worktree, pgid, lease_id
+                ),
+                on_process_exit=lambda pgid: self.pool.unregister_lease_process(worktree, pgid),
+                session_id=self.execution_id,
+                lease_held=lambda: self.pool.holds_lease(worktree, lease_id),
             )
 
             # Get task details
@@ -186,7 +221,7 @@ class AutonomousTaskWorker:
                 implementation = extra.get("implementation", "")
                 files = extra.get("files", [])
                 verification_steps = extra.get("verification_steps", [])
-                batch_number = extra.get("batch_number", 1)
+                batch_number = task.batch.batch_number
 
                 # Execute with timeout
                 try:
@@ -202,6 +237,7 @@ class AutonomousTaskWorker:
                             worktree_path=worktree.path,
                             branch_name=task_obj.branch_name,
                             skip_github_ops=self.skip_github_ops,
+                            log_path=task_log_path(self.execution_id, task_obj.task_number),
                         ),
                         timeout=self.task_timeout_seconds
                     )
@@ -217,6 +253,8 @@ class AutonomousTaskWorker:
                         task_obj.status = TaskStatus.FAILED.value
                         task_obj.error = exec_result.error or "Task execution failed"
 
+                    # Reassign so the JSON column is flagged as changed
+                    task_obj.extra_data = {**(task_obj.extra_data or {}), "phases": exec_result.phases}
                     task_obj.completed_at = datetime.now(timezone.utc)
 
                     await session.commit()
@@ -245,8 +283,9 @@ class AutonomousTaskWorker:
 
         finally:
             # Always release worktree back to pool
+            await heartbeat.aclose()
             if worktree:
-                await self.pool.release(worktree)
+                await self.pool.release(worktree, lease_id)
                 logger.info(f"[{self.worker_id}] Released {worktree.id}")
 
             self.current_task = None
@@ -0,0 +1,279 @@
+"""Claude Governor - Process-wide concurrency and rate limits for Claude CLI runs."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+from app.config import settings
+from .pool_telemetry import RollingHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class ClaudeGovernor:
+    """
+    Admission control for Claude CLI processes across every session.
+
+    A run needs a slot: at most max_concurrent runs at once, at most
+    session_max_concurrent of them per session, and a token from a bucket
+    refilled at rate_per_minute (holding up to burst tokens). Waiters queue
+    per session and sessions are served round-robin, so one session with
+    many queued tasks cannot starve the others; within a session, order is
+    FIFO.
+
+    Usage:
+        async with governor.slot(session_id):
+            ...run the CLI...
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        rate_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        session_max_concurrent: Optional[int] = None,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            max_concurrent: CLI processes allowed at once across all sessions
+            rate_per_minute: Runs started per minute (None = unlimited)
+            burst: Runs that may start back to back after an idle period
+                   (default: max_concurrent)
+            session_max_concurrent: CLI processes allowed at once per session
+                                    (None = only max_concurrent applies)
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.rate_per_minute = rate_per_minute
+        self.burst = max(1, burst if burst is not None else max_concurrent)
+        self.session_max_concurrent = session_max_concurrent
+
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._refill_timer: Optional[asyncio.TimerHandle] = None
+
+        self._active = 0
+        self._active_by_session: Dict[str, int] = {}
+        # Sessions with queued waiters, in round-robin order
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._queued = 0
+
+        self.granted = 0
+        self.completed = 0
+        self.wait_histogram = RollingHistogram()
+        self.run_histogram = RollingHistogram()
+
+    @asynccontextmanager
+    async def slot(self, session_id: Optional[str] = None) -> AsyncIterator[float]:
+        """
+        Hold a CLI slot for the duration of the block.
+
+        Args:
+            session_id: Session the run is charged to (None = a shared session)
+
+        Yields:
+            Seconds spent waiting for the slot
+        """
+        session = session_id or ""
+        waited = await self._acquire(session)
+        started = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self.run_histogram.observe(time.monotonic() - started)
+            self._release(session)
+
+    async def _acquire(self, session: str) -> float:
+        enqueued_at = time.monotonic()
+        if not self._queued and self._admissible(session) and self._take_token():
+            self._grant(session)
+            self.wait_histogram.observe(0.0)
+            return 0.0
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session, deque()).append(future)
+        self._queued += 1
+        # Nothing may be running to release a slot: arm the refill timer if needed
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: pass the slot on
+                self._release(session)
+            else:
+                self._discard(session, future)
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        self.wait_histogram.observe(waited)
+        if waited > 1.0:
+            logger.info(f"Claude CLI slot for session {session or '-'} granted after {waited:.1f}s")
+        return waited
+
+    def _release(self, session: str) -> None:
+        self._active -= 1
+        self.completed += 1
+        remaining = self._active_by_session.get(session, 1) - 1
+        if remaining > 0:
+            self._active_by_session[session] = remaining
+        else:
+            self._active_by_session.pop(session, None)
+        self._dispatch()
+
+    def _discard(self, session: str, future: asyncio.Future) -> None:
+        queue = self._queues.get(session)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+            self._queued -= 1
+        except ValueError:
+            pass
+        if not queue:
+            del self._queues[session]
+
+    def _admissible(self, session: str) -> bool:
+        if self._active >= self.max_concurrent:
+            return False
+        if self.session_max_concurrent is None:
+            return True
+        return self._active_by_session.get(session, 0) < self.session_max_concurrent
+
+    def _grant(self, session: str) -> None:
+        self._active += 1
+        self._active_by_session[session] = self._active_by_session.get(session, 0) + 1
+        self.granted += 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate_per_minute:
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._refilled_at) * self.rate_per_minute / 60.0,
+            )
+        self._refilled_at = now
+
+    def _take_token(self) -> bool:
+        if not self.rate_per_minute:
+            return True
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _dispatch(self) -> None:
+        """Grant slots to queued sessions round-robin while limits allow."""
+        while self._queued and self._active < self.max_concurrent:
+            session = next((s for s in self._queues if self._admissible(s)), None)
+            if session is None:
+                return  # Every queued session is at its own cap
+            if not self._take_token():
+                self._schedule_refill()
+                return
+
+            queue = self._queues[session]
+            future = queue.popleft()
+            self._queued -= 1
+            if queue:
+                self._queues.move_to_end(session)
+            else:
+                del self._queues[session]
+
+            self._grant(session)
+            future.set_result(None)
+
+    def _schedule_refill(self) -> None:
+        if self._refill_timer is not None and not self._refill_timer.cancelled():
+            return
+        delay = (1.0 - self._tokens) * 60.0 / self.rate_per_minute
+
+        def _on_refill() -> None:
+            self._refill_timer = None
+            self._dispatch()
+
+        self._refill_timer = asyncio.get_running_loop().call_later(delay, _on_refill)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def get_status(self) -> dict:
+        """Limits, current load per session, and wait/run latency."""
+        if self.rate_per_minute:
+            self._refill()
+        sessions: Dict[str, dict] = {}
+        for session, count in self._active_by_session.items():
+            sessions.setdefault(session or "-", {"active": 0, "queued": 0})["active"] = count
+        for session, queue in self._queues.items():
+            sessions.setdefault(session or "-", {"active": 0, "queued": 0})["queued"] = len(queue)
+        return {
+            "max_concurrent": self.max_concurrent,
+            "session_max_concurrent": self.session_max_concurrent,
+            "rate_per_minute": self.rate_per_minute,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3) if self.rate_per_minute else None,
+            "active": self._active,
+            "queued": self._queued,
+            "granted": self.granted,
+            "completed": self.completed,
+            "wait": self.wait_histogram.snapshot(),
+            "run": self.run_histogram.snapshot(),
+            "sessions": sessions,
+        }
+
+    def render_prometheus(self) -> str:
+        """Governor gauges, counters and histograms in Prometheus text format."""
+        lines: List[str] = [
+            "# HELP claude_cli_active Claude CLI processes running",
+            "# TYPE claude_cli_active gauge",
+            f"claude_cli_active {self._active}",
+            "# HELP claude_cli_queued Claude CLI runs waiting for a slot",
+            "# TYPE claude_cli_queued gauge",
+            f"claude_cli_queued {self._queued}",
+            "# HELP claude_cli_granted_total Claude CLI slots granted",
+            "# TYPE claude_cli_granted_total counter",
+            f"claude_cli_granted_total {self.granted}",
+        ]
+        for name, hist, help_text in (
+            ("wait", self.wait_histogram, "Time a Claude CLI run waited for a slot"),
+            ("run", self.run_histogram, "Time a Claude CLI slot was held"),
+        ):
+            metric = f"claude_cli_{name}_seconds"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+            for le, count in hist.cumulative():
+                lines.append(f'{metric}_bucket{{le="{le}"}} {count}')
+            lines.append(f"{metric}_sum {hist.sum}")
+            lines.append(f"{metric}_count {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+_governor: Optional[ClaudeGovernor] = None
+
+
+def get_claude_governor() -> ClaudeGovernor:
+    """The process-wide governor, created from settings on first use."""
+    global _governor
+    if _governor is None:
+        _governor = ClaudeGovernor(
+            max_concurrent=settings.claude_max_concurrent,
+            rate_per_minute=settings.claude_rate_per_minute,
+            burst=settings.claude_rate_burst,
+            session_max_concurrent=settings.claude_session_max_concurrent,
+        )
+        logger.info(
+            f"✓ Claude CLI governor: {_governor.max_concurrent} concurrent, "
+            f"{_governor.rate_per_minute or 'unlimited'}/min"
+        )
+    return _governor
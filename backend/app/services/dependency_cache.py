@@ -0,0 +1,491 @@
+"""Dependency Cache - Shared dependency/build directories for pool worktrees."""
+
+import asyncio
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .git_objects import GitHelperError, GitObjectReader
+
+logger = logging.getLogger(__name__)
+
+# Written inside each linked target so a worktree knows which cache entry it holds
+KEY_MARKER = ".pool-cache-key"
+
+# Lines between these markers in info/exclude are owned by the cache
+EXCLUDE_BEGIN = "# >>> worktree-pool dependency cache"
+EXCLUDE_END = "# <<< worktree-pool dependency cache"
+
+
+@dataclass
+class CacheSpec:
+    """A dependency directory shared between worktrees."""
+    name: str                  # "backend-venv", "frontend-node-modules"
+    target: str                # Repo-relative directory, e.g. "frontend/node_modules"
+    lockfiles: List[str]       # Repo-relative files whose contents key the cache
+    build: str                 # Shell command that creates `target`, run from the entry root
+
+
+def default_cache_specs() -> List[CacheSpec]:
+    """Cache specs for this repository's backend virtualenv and frontend node_modules."""
+    return [
+        CacheSpec(
+            name="backend-venv",
+            target="backend/.venv",
+            lockfiles=["backend/requirements.txt"],
+            build=(
+                f"{sys.executable} -m venv backend/.venv && "
+                "backend/.venv/bin/pip install --quiet -r backend/requirements.txt"
+            ),
+        ),
+        CacheSpec(
+            name="frontend-node-modules",
+            target="frontend/node_modules",
+            lockfiles=["frontend/package.json", "frontend/package-lock.json"],
+            build="cd frontend && npm install --no-audit --no-fund --loglevel=error",
+        ),
+    ]
+
+
+@dataclass
+class _Entry:
+    """A materialized cache entry on disk."""
+    spec: CacheSpec
+    key: str
+    root: Path
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def source(self) -> Path:
+        return self.root / self.spec.target
+
+    @property
+    def ready_marker(self) -> Path:
+        return self.root / ".ready"
+
+
+class DependencyCache:
+    """
+    Materializes dependency directories once per lockfile hash and links them
+    into worktrees.
+
+    Each spec is keyed by the git blob IDs of its lockfiles at the worktree's
+    HEAD (plus the build command), so worktrees on the same base share one
+    entry. Entries are built in the background the first time a key is seen,
+    one build per key no matter how many worktrees ask for it. Worktrees get
+    the entry hardlinked file by file (or reflinked with link_mode="reflink"),
+    so linking costs metadata only and never re-runs the installer. Hardlinked
+    files are shared with the entry, which is fine for installers that replace
+    files rather than edit them in place.
+
+    generation increases every time an entry finishes building, so the pool
+    can tell cheaply whether a worktree might be missing a newly built entry.
+
+    Targets are added to the repository's info/exclude, so `git status`,
+    `git add -A` and `git clean -fd` all leave them alone.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        specs: Optional[List[CacheSpec]] = None,
+        link_mode: str = "hardlink",
+        build_timeout_seconds: float = 1800.0,
+        keep_entries: int = 2,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding cache entries (outlives worktrees)
+            specs: Dependency directories to share (defaults to default_cache_specs())
+            link_mode: "hardlink" to hardlink files, "reflink" to use `cp --reflink=auto`
+            build_timeout_seconds: Seconds before a build command is killed
+            keep_entries: Entries kept per spec; older keys are pruned after a build
+        """
+        if link_mode not in ("hardlink", "reflink"):
+            raise ValueError(f"Unknown link_mode: {link_mode}")
+
+        self.root = Path(root).absolute()
+        self.specs = specs if specs is not None else default_cache_specs()
+        self.link_mode = link_mode
+        self.build_timeout_seconds = build_timeout_seconds
+        self.keep_entries = max(1, keep_entries)
+
+        self._entries: Dict[str, _Entry] = {}
+        self._builds: Dict[str, asyncio.Task] = {}
+        self._failed: Set[str] = set()
+        self.generation = 0
+
+        self._hits = 0
+        self._links = 0
+        self._misses = 0
+        self._builds_total = 0
+        self._build_failures = 0
+        self._build_seconds: Dict[str, float] = {}
+
+    async def install_excludes(self, main_repo_path: Path) -> None:
+        """
+        Add every spec's target to the repository's shared info/exclude.
+
+        Linked worktrees read info/exclude from the common git dir, so one
+        block covers all of them.
+        """
+        returncode, stdout, stderr = await _run(
+            ["git", "rev-parse", "--git-common-dir"], cwd=main_repo_path, timeout=10
+        )
+        if returncode != 0:
+            logger.warning(f"Could not locate git dir for cache excludes: {stderr.strip()}")
+            return
+
+        common_dir = Path(stdout.strip())
+        if not common_dir.is_absolute():
+            common_dir = Path(main_repo_path) / common_dir
+        exclude = common_dir / "info" / "exclude"
+
+        block = "\n".join([EXCLUDE_BEGIN, *(f"/{spec.target}/" for spec in self.specs), EXCLUDE_END])
+        await asyncio.to_thread(_write_exclude_block, exclude, block)
+
+    async def attach(
+        self,
+        worktree_path: Path,
+        cone: Optional[List[str]] = None,
+        objects: Optional[GitObjectReader] = None,
+    ) -> Dict[str, str]:
+        """
+        Make each spec's dependency directory available in a worktree.
+
+        Never waits for a build: a key that is not materialized yet starts
+        building in the background and the worktree is attached on a later call.
+
+        Args:
+            worktree_path: Worktree to link into
+            cone: Sparse-checkout directories of the worktree (None = full checkout);
+                  targets outside the cone are skipped
+            objects: The worktree's cat-file helper, to look up lockfiles without
+                     spawning git (None = one `git ls-tree` call)
+
+        Returns:
+            Mapping of spec name to outcome: "hit", "linked", "building",
+            "failed", "no-lockfile" or "outside-cone"
+        """
+        outcomes: Dict[str, str] = {}
+        blobs = await self._lockfile_blobs(worktree_path, objects)
+
+        for spec in self.specs:
+            if cone is not None and not any(
+                spec.target == d or spec.target.startswith(d + "/") for d in cone
+            ):
+                outcomes[spec.name] = "outside-cone"
+                continue
+
+            present = [f"{path}:{blobs[path]}" for path in spec.lockfiles if path in blobs]
+            if not present:
+                outcomes[spec.name] = "no-lockfile"
+                continue
+
+            key = hashlib.sha256(
+                "\n".join([spec.name, spec.build, *present]).encode()
+            ).hexdigest()[:16]
+            entry_id = f"{spec.name}-{key}"
+            target = worktree_path / spec.target
+
+            if _read_marker(target) == key:
+                self._hits += 1
+                outcomes[spec.name] = "hit"
+                continue
+
+            entry = self._entries.get(entry_id) or self._load_entry(spec, key)
+            if entry is None:
+                self._misses += 1
+                outcomes[spec.name] = "failed" if entry_id in self._failed else "building"
+                if entry_id not in self._failed:
+                    self._spawn_build(spec, key, worktree_path, blobs, objects)
+                continue
+
+            entry.last_used = time.monotonic()
+            await asyncio.to_thread(self._link_entry, entry, target)
+            self._links += 1
+            outcomes[spec.name] = "linked"
+
+        return outcomes
+
+    async def wait_until_built(self) -> None:
+        """Wait for any in-flight cache builds to finish."""
+        while self._builds:
+            await asyncio.gather(*list(self._builds.values()), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel in-flight builds; finished entries stay on disk for the next run."""
+        for task in list(self._builds.values()):
+            task.cancel()
+        await asyncio.gather(*list(self._builds.values()), return_exceptions=True)
+
+    def get_status(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries on disk, in-flight builds and hit/link/build counters
+        """
+        return {
+            "root": str(self.root),
+            "link_mode": self.link_mode,
+            "entries": sorted(self._entries),
+            "building": sorted(self._builds),
+            "failed": sorted(self._failed),
+            "hits_total": self._hits,
+            "links_total": self._links,
+            "misses_total": self._misses,
+            "builds_total": self._builds_total,
+            "build_failures": self._build_failures,
+            "build_seconds": dict(self._build_seconds),
+        }
+
+    async def _lockfile_blobs(
+        self, worktree_path: Path, objects: Optional[GitObjectReader] = None
+    ) -> Dict[str, str]:
+        """Blob IDs of every spec's lockfiles at HEAD, from the cat-file helper or one `git ls-tree` call."""
+        paths = sorted({path for spec in self.specs for path in spec.lockfiles})
+        if objects is not None:
+            try:
+                infos = await asyncio.gather(*(objects.info(f"HEAD:{path}") for path in paths))
+                return {
+                    path: info.sha for path, info in zip(paths, infos)
+                    if info is not None and info.type == "blob"
+                }
+            except (asyncio.TimeoutError, GitHelperError) as e:
+                logger.warning(f"git cat-file lockfile lookup in {worktree_path} failed, using ls-tree: {e!r}")
+
+        returncode, stdout, stderr = await _run(
+            ["git", "ls-tree", "-z", "HEAD", "--", *paths], cwd=worktree_path, timeout=30
+        )
+        if returncode != 0:
+            raise Exception(f"git ls-tree failed: {stderr.strip()}")
+
+        blobs: Dict[str, str] = {}
+        for record in stdout.split("\0"):
+            if not record:
+                continue
+            meta, _, path = record.partition("\t")
+            _, obj_type, sha = meta.split(" ")
+            if obj_type == "blob":
+                blobs[path] = sha
+        return blobs
+
+    def _load_entry(self, spec: CacheSpec, key: str) -> Optional[_Entry]:
+        """Pick up an entry a previous run finished building."""
+        entry = _Entry(spec=spec, key=key, root=self.root / f"{spec.name}-{key}")
+        if not entry.ready_marker.exists():
+            return None
+        self._entries[entry.root.name] = entry
+        return entry
+
+    def _spawn_build(
+        self,
+        spec: CacheSpec,
+        key: str,
+        worktree_path: Path,
+        blobs: Dict[str, str],
+        objects: Optional[GitObjectReader] = None,
+    ) -> None:
+        """Start building an entry unless a build for the same key is in flight."""
+        entry_id = f"{spec.name}-{key}"
+        if entry_id in self._builds:
+            return
+
+        task = asyncio.create_task(
+            self._build_entry(spec, key, worktree_path, blobs, objects),
+            name=f"dependency-cache-{entry_id}",
+        )
+        self._builds[entry_id] = task
+        task.add_done_callback(lambda _: self._builds.pop(entry_id, None))
+
+    async def _build_entry(
+        self,
+        spec: CacheSpec,
+        key: str,
+        worktree_path: Path,
+        blobs: Dict[str, str],
+        objects: Optional[GitObjectReader] = None,
+    ) -> None:
+        """
+        Materialize one entry: copy the lockfiles out of git into the entry
+        root, run the build command there and mark it ready.
+
+        The entry is built in place (not renamed afterwards) because tools
+        such as virtualenv bake their absolute location into the files.
+        """
+        entry = _Entry(spec=spec, key=key, root=self.root / f"{spec.name}-{key}")
+        started = time.perf_counter()
+        self._builds_total += 1
+        logger.info(f"Building dependency cache {entry.root.name}...")
+
+        try:
+            await asyncio.to_thread(shutil.rmtree, entry.root, ignore_errors=True)
+            entry.root.mkdir(parents=True)
+
+            for path in spec.lockfiles:
+                if path not in blobs:
+                    continue
+                content = await self._read_blob(blobs[path], worktree_path, objects)
+                if content is not None:
+                    lockfile = entry.root / path
+                    lockfile.parent.mkdir(parents=True, exist_ok=True)
+                    lockfile.write_bytes(content)
+
+            returncode, _, stderr = await _run(
+                ["/bin/sh", "-c", spec.build], cwd=entry.root, timeout=self.build_timeout_seconds
+            )
+            if returncode != 0 or not entry.source.is_dir():
+                raise Exception(f"build exited {returncode}: {stderr.strip()[-500:]}")
+
+            entry.ready_marker.touch()
+        except asyncio.CancelledError:
+            await asyncio.to_thread(shutil.rmtree, entry.root, ignore_errors=True)
+            raise
+        except Exception as e:
+            self._build_failures += 1
+            self._failed.add(entry.root.name)
+            logger.error(f"✗ Dependency cache {entry.root.name} build failed: {e}")
+            await asyncio.to_thread(shutil.rmtree, entry.root, ignore_errors=True)
+            return
+
+        self._build_seconds[entry.root.name] = time.perf_counter() - started
+        self._entries[entry.root.name] = entry
+        self.generation += 1
+        logger.info(
+            f"✓ Built dependency cache {entry.root.name} in "
+            f"{self._build_seconds[entry.root.name]:.1f}s"
+        )
+        await asyncio.to_thread(self._prune, spec)
+
+    @staticmethod
+    async def _read_blob(
+        sha: str, worktree_path: Path, objects: Optional[GitObjectReader]
+    ) -> Optional[bytes]:
+        """Content of a blob, from the cat-file helper or one `git cat-file` call."""
+        if objects is not None:
+            try:
+                answer = await objects.read(sha)
+                return answer[1] if answer is not None else None
+            except (asyncio.TimeoutError, GitHelperError):
+                pass  # Helper closed with its worktree, or stalled
+        returncode, stdout, _ = await _run_raw(["git", "cat-file", "blob", sha], cwd=worktree_path, timeout=30)
+        return stdout if returncode == 0 else None
+
+    def _prune(self, spec: CacheSpec) -> None:
+        """Delete all but the keep_entries most recently used entries of a spec."""
+        entries = sorted(
+            (e for e in self._entries.values() if e.spec.name == spec.name),
+            key=lambda e: e.last_used,
+            reverse=True,
+        )
+        for entry in entries[self.keep_entries:]:
+            del self._entries[entry.root.name]
+            shutil.rmtree(entry.root, ignore_errors=True)
+            logger.info(f"Pruned dependency cache {entry.root.name}")
+
+    def _link_entry(self, entry: _Entry, target: Path) -> None:
+        """Replace a worktree's target directory with links to a cache entry."""
+        shutil.rmtree(target, ignore_errors=True)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.link_mode == "reflink":
+            subprocess.run(
+                ["cp", "-a", "--reflink=auto", str(entry.source), str(target)],
+                check=True,
+                capture_output=True,
+            )
+        else:
+            _hardlink_tree(entry.source, target)
+
+        (target / KEY_MARKER).write_text(entry.key)
+
+
+def _hardlink_tree(src: Path, dst: Path) -> None:
+    """Recreate a directory tree with hardlinks, copying where linking is impossible."""
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        out_dir = dst if rel == "." else dst / rel
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in dirnames + filenames:
+            source = os.path.join(dirpath, name)
+            dest = out_dir / name
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), dest)
+                continue
+            if name in dirnames:
+                continue
+            try:
+                os.link(source, dest)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+                shutil.copy2(source, dest)
+
+
+def _read_marker(target: Path) -> Optional[str]:
+    try:
+        return (target / KEY_MARKER).read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_exclude_block(exclude: Path, block: str) -> None:
+    """Replace (or append) the cache's block in an info/exclude file."""
+    exclude.parent.mkdir(parents=True, exist_ok=True)
+    text = exclude.read_text() if exclude.exists() else ""
+
+    start, end = text.find(EXCLUDE_BEGIN), text.find(EXCLUDE_END)
+    if start != -1 and end != -1:
+        text = text[:start] + block + text[end + len(EXCLUDE_END):]
+    else:
+        text = text + ("" if not text or text.endswith("\n") else "\n") + block + "\n"
+    exclude.write_text(text)
+
+
+async def _run(args: List[str], cwd: Path, timeout: float) -> Tuple[int, str, str]:
+    """
+    Run a command as an async subprocess in its own process group.
+
+    On timeout or cancellation the whole group is killed, so installers
+    started by a build shell do not outlive it.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    returncode, stdout, stderr = await _run_raw(args, cwd, timeout)
+    return returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def _run_raw(args: List[str], cwd: Path, timeout: float) -> Tuple[int, bytes, bytes]:
+    """Like _run(), but returns stdout and stderr as undecoded bytes."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=str(cwd),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+        raise
+    return proc.returncode, stdout, stderr
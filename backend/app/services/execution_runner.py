@@ -11,7 +11,7 @@ Orchestrates the complete execution:
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Set, List
+from typing import List, Optional, Set
 from sqlalchemy import select
 
 from app.database import get_sync_db
@@ -24,6 +24,7 @@ from app.models.autonomous import (
     TaskStatus,
 )
 from app.services.task_executor import TaskExecutor, ExecutionResult
+from app.services.task_logs import task_log_path
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ class ExecutionRunner:
     def __init__(self, session_id: str):
         self.session_id = session_id
         self._should_stop = False
-        self.executor = TaskExecutor()
+        self.executor = TaskExecutor(session_id=session_id)
 
     async def run(self) -> None:
         """Execute the autonomous session."""
@@ -153,6 +154,7 @@ class ExecutionRunner:
                 verification_steps=extra.get("verification_steps", []),
                 batch_number=batch_number,
                 auto_merge=auto_merge,
+                log_path=task_log_path(self.session_id, task_data["task_number"]),
             )
 
             # Update task result
@@ -169,6 +171,7 @@ class ExecutionRunner:
                     self._mark_task_failed_sync,
                     task_data["id"],
                     result.error or "Unknown error",
+                    result.phases,
                 )
 
             logger.info(
@@ -391,11 +394,14 @@ class ExecutionRunner:
                 task.pr_number = result.pr_number
                 task.pr_url = result.pr_url
                 task.commits = result.commits
+                task.extra_data = {**(task.extra_data or {}), "phases": result.phases}
                 task.completed_at = datetime.now(timezone.utc)
                 db.commit()
 
-    def _mark_task_failed_sync(self, task_id: str, error: str) -> None:
-        """Mark task failed (sync)."""
+    def _mark_task_failed_sync(
+        self, task_id: str, error: str, phases: Optional[List[dict]] = None
+    ) -> None:
+        """Mark task failed (sync), keeping the phase timeline of the attempt if any."""
         with get_sync_db() as db:
             result = db.execute(
                 select(TaskExecution).where(TaskExecution.id == task_id)
@@ -404,6 +410,8 @@ class ExecutionRunner:
             if task:
                 task.status = TaskStatus.FAILED.value
                 task.error = error
+                if phases:
+                    task.extra_data = {**(task.extra_data or {}), "phases": phases}
                 task.completed_at = datetime.now(timezone.utc)
                 db.commit()
 
@@ -3,14 +3,16 @@
 import asyncio
 import logging
 import os
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone
 
 from .test_queue import TestQueue, TestRequest, TestResult, TestStatus
-from .worktree_pool import WorktreePool, WorktreeInfo, WorktreeAcquisitionTimeout
+from .worktree_pool import AffinityHint, LeasePriority, WorktreePool, WorktreeInfo, WorktreeAcquisitionTimeout
 from .plan_parser import PlanParser, PlanParseError
 from .task_executor import TaskExecutor
+from .task_logs import task_log_path
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ class ExecutionWorker:
         pool: WorktreePool,
         task_timeout_seconds: float = 1800.0,  # 30 minutes default
         worktree_acquire_timeout: float = 300.0,  # 5 minutes default
+        priority: LeasePriority = LeasePriority.BACKGROUND,
     ):
         """
         Initialize execution worker.
@@ -45,16 +48,20 @@ class ExecutionWorker:
             pool: Worktree pool to acquire worktrees from
             task_timeout_seconds: Maximum time for a single task execution (default: 30 min)
             worktree_acquire_timeout: Maximum time to wait for a worktree (default: 5 min)
+            priority: Priority class for worktree acquisition (bulk test runs
+                      default to BACKGROUND)
         """
         self.worker_id = worker_id
         self.queue = queue
         self.pool = pool
         self.task_timeout_seconds = task_timeout_seconds
         self.worktree_acquire_timeout = worktree_acquire_timeout
+        self.priority = priority
         self.running = False
         self._task: Optional[asyncio.Task] = None
         self._current_test: Optional[str] = None
         self._current_test_started: Optional[datetime] = None
+        self._last_worktree_id: Optional[str] = None  # Affinity hint for the next lease
 
     async def start(self) -> None:
         """Start the worker loop in a background task."""
@@ -134,14 +141,24 @@ class ExecutionWorker:
         await self.queue.mark_running(test_request)
 
         worktree: Optional[WorktreeInfo] = None
+        lease_id: Optional[int] = None
+        heartbeat = AsyncExitStack()
 
         try:
             # 3. Acquire worktree from pool (with timeout)
             try:
+                # Plans span many tasks, so a sparse worktree starts from the
+                # always-included dirs and TaskExecutor widens it per task
                 worktree = await self.pool.acquire(
                     test_name=test_request.plan_file,
                     timeout=self.worktree_acquire_timeout,
+                    files=[],
+                    affinity=AffinityHint(worktree_id=self._last_worktree_id),
+                    priority=self.priority,
                 )
+                self._last_worktree_id = worktree.id
+                # Renew the lease while we work so the reaper leaves it alone
+                lease_id = await heartbeat.enter_async_context(self.pool.keep_alive(worktree))
                 logger.info(
                     f"Worker {self.worker_id} acquired worktree {worktree.id} "
                     f"for test {test_request.id}"
@@ -219,9 +236,10 @@ class ExecutionWorker:
             self._current_test_started = None
 
             # 6. Always release worktree back to pool
+            await heartbeat.aclose()
             if worktree:
                 try:
-                    await self.pool.release(worktree)
+                    await self.pool.release(worktree, lease_id)
                     logger.info(
                         f"Worker {self.worker_id} released worktree {worktree.id}"
                     )
@@ -315,10 +333,18 @@ class ExecutionWorker:
             if not batches:
                 raise PlanParseError("No batches found in plan file")
 
-            # 2. Create TaskExecutor with worktree path
+            # 2. Create TaskExecutor with worktree path, tied to the current lease
+            lease_id = worktree.lease_id
             executor = TaskExecutor(
                 repo_path=str(worktree.path),
                 github_token=test_request.config.github_token,
+                sparse_checkout=self.pool.sparse_checkout,
+                on_process_start=lambda pgid: self.pool.register_lease_process(
+                    worktree, pgid, lease_id
+                ),
+                on_process_exit=lambda pgid: self.pool.unregister_lease_process(worktree, pgid),
+                session_id=test_request.id,
+                lease_held=lambda: self.pool.holds_lease(worktree, lease_id),
             )
 
             # 3. Execute each task in each batch
@@ -344,6 +370,7 @@ class ExecutionWorker:
                             auto_merge=test_request.config.auto_merge,
                             worktree_path=worktree.path,
                             branch_name=worktree.branch,
+                            log_path=task_log_path(test_request.id, task.number),
                         )
 
                         if result.success:
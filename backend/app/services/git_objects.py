@@ -0,0 +1,258 @@
+"""Git Objects - Long-lived `git cat-file` helpers for fork-free ref and object lookups."""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Optional, Tuple, Union
+
+from .git_ops import run_git
+
+logger = logging.getLogger(__name__)
+
+
+class GitHelperError(Exception):
+    """A cat-file helper process died or answered out of protocol."""
+    pass
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """What `git cat-file --batch-check` reports for an object."""
+    sha: str
+    type: str  # "commit", "tree", "blob" or "tag"
+    size: int
+
+
+_Answer = Union[None, ObjectInfo, Tuple[ObjectInfo, bytes]]
+
+
+class _CatFileProcess:
+    """
+    One `git cat-file --batch` or `--batch-check` process serving requests in order.
+
+    Requests are written to stdin as they arrive and answered by a single
+    reader task, so many callers can have lookups in flight at once without
+    waiting on each other. cat-file answers strictly in request order, which
+    is how each answer is matched to its caller.
+    """
+
+    def __init__(self, repo_path: Path, mode: str):
+        self.repo_path = repo_path
+        self.mode = mode
+        self.spawns = 0
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def request(self, name: str) -> _Answer:
+        """Look up one object name; None if it does not exist."""
+        if "\n" in name:
+            raise ValueError("Object names may not contain newlines")
+        if not self.alive:
+            await self._start()
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # Queue and write in one step so queue order matches the order cat-file sees
+        self._pending.append(future)
+        self._proc.stdin.write(name.encode() + b"\n")
+        try:
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self._fail(GitHelperError(f"git cat-file {self.mode} exited: {e}"))
+        return await future
+
+    async def _start(self) -> None:
+        async with self._start_lock:
+            if self.alive:
+                return
+            if self._reader is not None:
+                # Requests left on a dead process can never be answered
+                self._reader.cancel()
+                await asyncio.gather(self._reader, return_exceptions=True)
+            self._proc = await asyncio.create_subprocess_exec(
+                "git", "cat-file", self.mode,
+                cwd=str(self.repo_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            self.spawns += 1
+            self._reader = asyncio.create_task(
+                self._read_answers(self._proc), name=f"git-cat-file{self.mode}"
+            )
+
+    async def _read_answers(self, proc: asyncio.subprocess.Process) -> None:
+        try:
+            while True:
+                header = await proc.stdout.readline()
+                if not header:
+                    raise GitHelperError(f"git cat-file {self.mode} exited")
+                answer = self._parse_header(header.decode(errors="replace").rstrip("\n"))
+                if answer is not None and self.mode == "--batch":
+                    body = await proc.stdout.readexactly(answer.size + 1)  # Content plus LF
+                    answer = (answer, body[:-1])
+                if not self._pending:
+                    raise GitHelperError(f"git cat-file {self.mode} answered an unasked request")
+                future = self._pending.popleft()
+                if not future.done():  # The caller may have been cancelled
+                    future.set_result(answer)
+        except asyncio.CancelledError:
+            self._fail(GitHelperError(f"git cat-file {self.mode} closed"))
+            raise
+        except (GitHelperError, asyncio.IncompleteReadError, ValueError) as e:
+            self._fail(e if isinstance(e, GitHelperError) else GitHelperError(str(e)))
+            if proc.returncode is None:
+                proc.kill()
+
+    @staticmethod
+    def _parse_header(header: str) -> Optional[ObjectInfo]:
+        # "<name> missing" / "<name> ambiguous"; the name itself may contain spaces
+        if header.endswith(" missing") or header.endswith(" ambiguous"):
+            return None
+        sha, obj_type, size = header.split(" ")
+        return ObjectInfo(sha=sha, type=obj_type, size=int(size))
+
+    def _fail(self, error: Exception) -> None:
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        """Stop the process; in-flight requests fail with GitHelperError."""
+        proc, reader = self._proc, self._reader
+        self._proc, self._reader = None, None
+        if proc is not None and proc.returncode is None:
+            proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+        if reader is not None:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+        self._fail(GitHelperError(f"git cat-file {self.mode} closed"))
+
+
+class GitObjectReader:
+    """
+    Fork-free object and ref lookups for one repository or worktree.
+
+    Keeps a `git cat-file --batch-check` process for sizes, types and ref
+    resolution and a `git cat-file --batch` process for object contents,
+    each started on first use. Names are resolved relative to repo_path, so
+    HEAD means the worktree's HEAD. A helper that dies is restarted and the
+    request retried once; refs and objects written after start (commits,
+    fetches) are seen by later lookups.
+
+    Usage:
+        reader = GitObjectReader(worktree_path)
+        sha = await reader.resolve("origin/main^{commit}")
+        info = await reader.info("HEAD:uv.lock")
+        await reader.close()
+    """
+
+    def __init__(self, repo_path: Union[str, Path], timeout: float = 10.0):
+        """
+        Initialize the reader.
+
+        Args:
+            repo_path: Repository or worktree the helpers run in
+            timeout: Seconds before a lookup is abandoned and its helper restarted
+        """
+        self.repo_path = Path(repo_path)
+        self.timeout = timeout
+        self.requests = 0
+        self.restarts = 0
+        self._check = _CatFileProcess(self.repo_path, "--batch-check")
+        self._batch = _CatFileProcess(self.repo_path, "--batch")
+
+    async def _ask(self, helper: _CatFileProcess, name: str) -> _Answer:
+        self.requests += 1
+        for attempt in (1, 2):
+            try:
+                return await asyncio.wait_for(helper.request(name), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"git cat-file {helper.mode} in {self.repo_path} stalled, restarting")
+                await helper.close()
+                self.restarts += 1
+                raise
+            except GitHelperError as e:
+                await helper.close()
+                if attempt == 2:
+                    raise
+                self.restarts += 1
+                logger.debug(f"Restarting git cat-file {helper.mode} in {self.repo_path}: {e}")
+
+    async def info(self, name: str) -> Optional[ObjectInfo]:
+        """
+        Type, size and SHA of an object.
+
+        Args:
+            name: Any object name git accepts, e.g. "HEAD", "main^{tree}", "HEAD:path"
+
+        Returns:
+            ObjectInfo, or None if the name does not resolve
+        """
+        return await self._ask(self._check, name)
+
+    async def resolve(self, name: str) -> Optional[str]:
+        """SHA an object name resolves to, or None (like `git rev-parse --verify --quiet`)."""
+        info = await self.info(name)
+        return info.sha if info else None
+
+    async def read(self, name: str) -> Optional[Tuple[ObjectInfo, bytes]]:
+        """Object info and raw content, or None if the name does not resolve."""
+        return await self._ask(self._batch, name)
+
+    async def close(self) -> None:
+        """Stop both helper processes."""
+        await asyncio.gather(self._check.close(), self._batch.close())
+
+    def get_status(self) -> dict:
+        return {
+            "requests": self.requests,
+            "restarts": self.restarts,
+            "spawns": self._check.spawns + self._batch.spawns,
+            "alive": int(self._check.alive) + int(self._batch.alive),
+        }
+
+
+async def resolve_ref(
+    name: str,
+    cwd: Union[str, Path],
+    objects: Optional[GitObjectReader] = None,
+    timeout: float = 30.0,
+) -> Optional[str]:
+    """
+    SHA an object name resolves to, through a cat-file helper when one is given.
+
+    Falls back to `git rev-parse --verify --quiet` if the helper stalls or
+    dies, so one bad helper only costs a fork, not the caller's operation.
+
+    Args:
+        name: Object name, e.g. "HEAD" or "origin/main^{commit}"
+        cwd: Repository or worktree the name is resolved in
+        objects: Helper for cwd (None = always fork)
+        timeout: Seconds before the fallback git process is killed
+
+    Returns:
+        The SHA, or None if the name does not resolve
+    """
+    if objects is not None:
+        try:
+            return await objects.resolve(name)
+        except (asyncio.TimeoutError, GitHelperError) as e:
+            logger.warning(f"git cat-file lookup of {name} in {cwd} failed, using rev-parse: {e!r}")
+    returncode, stdout, _ = await run_git(
+        ["rev-parse", "--verify", "--quiet", name], cwd=Path(cwd), timeout=timeout
+    )
+    return stdout.strip() if returncode == 0 and stdout.strip() else None
@@ -0,0 +1,239 @@
+"""Git Operations - Async git invocations and NUL-safe parsing shared by executors and pools."""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Times a git command is retried when it fails on a lock held by another worktree operation
+GIT_LOCK_RETRIES = 3
+
+# Stage everything and list what is now staged, NUL-delimited; the shell
+# execs into the diff, so this is one spawn running two git processes.
+_STAGE_SCRIPT = 'git add -A "$@" && exec git diff --cached -z --name-only --no-renames'
+
+# Summary line `git commit` prints: "[<branch> <sha>] <subject>", where the
+# branch part may be "detached HEAD" or carry "(root-commit)"
+_COMMIT_SUMMARY = re.compile(r"^\[.* ([0-9a-f]{40,64})\] ", re.MULTILINE)
+
+
+class GitError(Exception):
+    """A git command failed."""
+
+    def __init__(self, message: str, returncode: Optional[int] = None, stderr: str = ""):
+        super().__init__(message)
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+@dataclass
+class CommitResult:
+    """A commit created by commit_all()."""
+    sha: str
+    files: List[str] = field(default_factory=list)  # Paths added, modified or deleted
+
+
+async def _exec(
+    argv: Sequence[str],
+    cwd: Path,
+    timeout: float,
+    stdin: Optional[bytes],
+    lock_retries: int,
+) -> Tuple[int, str, str]:
+    attempt = 0
+    while True:
+        attempt += 1
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=str(cwd),
+            stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(stdin), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            proc.kill()
+            await proc.wait()
+            raise
+
+        stderr_text = stderr.decode(errors="replace")
+        if proc.returncode != 0 and ".lock" in stderr_text and attempt < lock_retries:
+            logger.debug(f"git hit a lock, retrying (attempt {attempt}): {stderr_text.strip()}")
+            await asyncio.sleep(0.05 * attempt)
+            continue
+
+        return proc.returncode, stdout.decode(errors="replace"), stderr_text
+
+
+async def run_git(
+    args: Sequence[str],
+    cwd: Path,
+    timeout: float = 30.0,
+    stdin: Optional[bytes] = None,
+    lock_retries: int = GIT_LOCK_RETRIES,
+) -> Tuple[int, str, str]:
+    """
+    Run a git command as an async subprocess.
+
+    Retries briefly when git fails because another worktree operation holds
+    a lock file in the shared repository.
+
+    Args:
+        args: Arguments after `git`
+        cwd: Working directory
+        timeout: Seconds before the process is killed
+        stdin: Bytes to feed to the process on stdin
+        lock_retries: Attempts before a lock failure is returned
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        asyncio.TimeoutError: If git does not finish within timeout
+    """
+    return await _exec(["git", *args], cwd, timeout, stdin, lock_retries)
+
+
+def worktree_git_dir(path: Path) -> Path:
+    """
+    Git directory of a checkout or linked worktree, without running git.
+
+    Follows the `gitdir:` line of a linked worktree's `.git` file; a main
+    checkout's `.git` directory is returned as-is.
+
+    Raises:
+        ValueError: If path has no `.git` directory or gitdir file
+    """
+    dot_git = Path(path).resolve() / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except OSError as e:
+        raise ValueError(f"{dot_git} is not readable: {e}")
+    if not content.startswith("gitdir:"):
+        raise ValueError(f"{dot_git} is not a gitdir file")
+    git_dir = Path(content[len("gitdir:"):].strip())
+    if not git_dir.is_absolute():
+        git_dir = (dot_git.parent / git_dir).resolve()
+    return git_dir
+
+
+def split_nul(output: str) -> List[str]:
+    """Split `-z` output into its non-empty records."""
+    return [record for record in output.split("\0") if record]
+
+
+def parse_status_v2(output: str) -> Tuple[Optional[str], Optional[str], List[str], List[str]]:
+    """
+    Parse `git status --porcelain=v2 --branch -z` output.
+
+    Returns:
+        Tuple of (HEAD sha, branch name, changed tracked paths, untracked paths).
+        Untracked directories keep their trailing slash. Renames contribute both
+        the new and the original path.
+    """
+    head: Optional[str] = None
+    branch: Optional[str] = None
+    tracked: List[str] = []
+    untracked: List[str] = []
+
+    records = output.split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        if record.startswith("# branch.oid "):
+            head = record[len("# branch.oid "):]
+        elif record.startswith("# branch.head "):
+            branch = record[len("# branch.head "):]
+        elif record.startswith("1 "):
+            tracked.append(record.split(" ", 8)[8])
+        elif record.startswith("2 "):
+            tracked.append(record.split(" ", 9)[9])
+            if i < len(records):
+                tracked.append(records[i])  # Original path of the rename/copy
+                i += 1
+        elif record.startswith("u "):
+            tracked.append(record.split(" ", 10)[10])
+        elif record.startswith("? "):
+            untracked.append(record[2:])
+
+    return head, branch, tracked, untracked
+
+
+async def commit_all(
+    cwd: Path,
+    message: str,
+    sparse: bool = False,
+    timeout: float = 60.0,
+) -> Optional[CommitResult]:
+    """
+    Stage every change in a worktree and commit it, in two process invocations.
+
+    The first stages everything and lists the staged paths (git add and git
+    diff --cached behind one shell); the second commits with the full SHA in
+    its summary line, so no status, log or rev-parse call is needed. A clean
+    tree stops after the first.
+
+    Args:
+        cwd: Worktree to commit in
+        message: Commit message (passed on stdin, so any text is safe)
+        sparse: Also stage paths outside a sparse-checkout cone
+        timeout: Seconds before each invocation is killed
+
+    Returns:
+        The new commit's SHA and changed paths, or None if there was nothing to commit
+
+    Raises:
+        GitError: If staging or committing fails
+    """
+    returncode, stdout, stderr = await _exec(
+        ["sh", "-c", _STAGE_SCRIPT, "sh", *(["--sparse"] if sparse else [])],
+        cwd,
+        timeout,
+        None,
+        GIT_LOCK_RETRIES,
+    )
+    if returncode != 0:
+        raise GitError(f"git add failed: {stderr.strip()}", returncode, stderr)
+    files = split_nul(stdout)
+    if not files:
+        return None
+
+    returncode, stdout, stderr = await run_git(
+        ["-c", "core.abbrev=no", "commit", "-F", "-"], cwd=cwd, timeout=timeout, stdin=message.encode()
+    )
+    if returncode != 0:
+        raise GitError(f"git commit failed: {(stderr or stdout).strip()}", returncode, stderr)
+    match = _COMMIT_SUMMARY.search(stdout)
+    if match:
+        return CommitResult(sha=match.group(1), files=files)
+
+    # A hook or config changed the summary format; ask for the SHA instead
+    returncode, stdout, stderr = await run_git(["rev-parse", "HEAD"], cwd=cwd, timeout=timeout)
+    if returncode != 0:
+        raise GitError(f"git rev-parse failed: {stderr.strip()}", returncode, stderr)
+    return CommitResult(sha=stdout.strip(), files=files)
+
+
+async def changed_paths(cwd: Path, base: str, head: str = "HEAD", timeout: float = 30.0) -> List[str]:
+    """
+    Paths that differ between two commits, renames reported as both paths.
+
+    Raises:
+        GitError: If the diff fails
+    """
+    returncode, stdout, stderr = await run_git(
+        ["diff", "--name-only", "--no-renames", "-z", base, head], cwd=cwd, timeout=timeout
+    )
+    if returncode != 0:
+        raise GitError(f"git diff failed: {stderr.strip()}", returncode, stderr)
+    return split_nul(stdout)
@@ -0,0 +1,330 @@
+"""GitHub Client - Shared, pooled GitHub REST client with conditional requests and rate-limit tracking."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubAPIError(Exception):
+    """GitHub answered with an error status (0 when the request itself failed)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class GitHubRateLimitError(GitHubAPIError):
+    """The rate-limit budget is exhausted until reset_at."""
+
+    def __init__(self, reset_at: float):
+        super().__init__(403, f"Rate limit exhausted until {time.strftime('%H:%M:%S', time.localtime(reset_at))}")
+        self.reset_at = reset_at
+
+
+@dataclass
+class RateLimit:
+    """Budget reported by the X-RateLimit-* headers of the latest response."""
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    used: Optional[int] = None
+    reset_at: Optional[float] = None  # Epoch seconds
+    resource: Optional[str] = None
+
+    def update(self, headers: httpx.Headers) -> None:
+        def _int(name: str) -> Optional[int]:
+            value = headers.get(name)
+            return int(value) if value is not None and value.isdigit() else None
+
+        if "x-ratelimit-remaining" not in headers:
+            return
+        self.limit = _int("x-ratelimit-limit")
+        self.remaining = _int("x-ratelimit-remaining")
+        self.used = _int("x-ratelimit-used")
+        reset = _int("x-ratelimit-reset")
+        self.reset_at = float(reset) if reset is not None else None
+        self.resource = headers.get("x-ratelimit-resource")
+
+    @property
+    def exhausted(self) -> bool:
+        return (
+            self.remaining == 0
+            and self.reset_at is not None
+            and self.reset_at > time.time()
+        )
+
+
+class GitHubClient:
+    """
+    One GitHub REST client shared by every executor in the process.
+
+    Requests go over a pooled httpx client, so connections are kept alive
+    across tasks. Reads made with conditional=True remember the ETag of the
+    last answer and send If-None-Match; a 304 reply returns the cached body
+    and does not count against the rate limit. The budget from the latest
+    X-RateLimit-* headers is tracked: once it is exhausted, requests wait for
+    the reset if it is at most max_rate_limit_wait seconds away and fail with
+    GitHubRateLimitError otherwise.
+
+    Tests can point base_url at a local fake server, or pass an httpx
+    transport (e.g. httpx.MockTransport).
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.github.com",
+        max_connections: int = 10,
+        timeout: float = 30.0,
+        etag_cache_size: int = 512,
+        max_rate_limit_wait: float = 60.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            token: GitHub token sent as a Bearer credential
+            base_url: API root (a GitHub Enterprise or fake server URL for tests)
+            max_connections: Size of the keep-alive connection pool
+            timeout: Seconds before a request fails
+            etag_cache_size: Conditional responses remembered (LRU)
+            max_rate_limit_wait: Longest wait for a rate-limit reset before failing
+            transport: httpx transport override, for tests
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.rate_limit = RateLimit()
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "CC4-pipeline",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+        self._etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_cache_size = etag_cache_size
+        self._repos: Dict[str, "GitHubRepo"] = {}
+
+        self.requests_total = 0
+        self.not_modified_total = 0
+        self.errors_total = 0
+        self.rate_limit_waits = 0
+
+    def repo(self, owner: str, name: str) -> "GitHubRepo":
+        """Cached handle for a repository; creating one makes no request."""
+        full_name = f"{owner}/{name}"
+        handle = self._repos.get(full_name)
+        if handle is None:
+            handle = self._repos[full_name] = GitHubRepo(self, owner, name)
+        return handle
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        conditional: bool = False,
+    ) -> Any:
+        """
+        Make one API request.
+
+        Args:
+            method: HTTP method
+            path: Path under base_url, e.g. "/repos/o/r/pulls"
+            params: Query parameters
+            json: JSON body
+            conditional: Send If-None-Match with the ETag of the previous answer (GET only)
+
+        Returns:
+            Decoded JSON body, or None for an empty body
+
+        Raises:
+            GitHubAPIError: On an error status or a connection failure
+            GitHubRateLimitError: If the budget is exhausted for too long
+        """
+        await self._respect_rate_limit()
+
+        key = None
+        headers: Dict[str, str] = {}
+        if conditional and method == "GET":
+            key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+            cached = self._etags.get(key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
+
+        self.requests_total += 1
+        try:
+            response = await self._http.request(method, path, params=params, json=json, headers=headers)
+        except httpx.HTTPError as e:
+            self.errors_total += 1
+            raise GitHubAPIError(0, f"{method} {path} failed: {e}")
+        self.rate_limit.update(response.headers)
+
+        if response.status_code == 304 and key is not None and key in self._etags:
+            self.not_modified_total += 1
+            self._etags.move_to_end(key)
+            return self._etags[key][1]
+
+        if response.status_code >= 400:
+            self.errors_total += 1
+            if response.status_code in (403, 429) and self.rate_limit.exhausted:
+                raise GitHubRateLimitError(self.rate_limit.reset_at)
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise GitHubAPIError(response.status_code, message)
+
+        body = response.json() if response.content else None
+        etag = response.headers.get("etag")
+        if key is not None and etag:
+            self._etags[key] = (etag, body)
+            self._etags.move_to_end(key)
+            while len(self._etags) > self._etag_cache_size:
+                self._etags.popitem(last=False)
+        return body
+
+    async def _respect_rate_limit(self) -> None:
+        if not self.rate_limit.exhausted:
+            return
+        wait = self.rate_limit.reset_at - time.time()
+        if wait > self.max_rate_limit_wait:
+            raise GitHubRateLimitError(self.rate_limit.reset_at)
+        self.rate_limit_waits += 1
+        logger.warning(f"GitHub rate limit exhausted, waiting {wait:.0f}s for reset")
+        await asyncio.sleep(wait)
+        self.rate_limit.remaining = None
+
+    def get_status(self) -> dict:
+        """Request counts, conditional hit rate and the current rate-limit budget."""
+        return {
+            "base_url": self.base_url,
+            "requests_total": self.requests_total,
+            "not_modified_total": self.not_modified_total,
+            "errors_total": self.errors_total,
+            "rate_limit_waits": self.rate_limit_waits,
+            "etag_cache_entries": len(self._etags),
+            "rate_limit": {
+                "limit": self.rate_limit.limit,
+                "remaining": self.rate_limit.remaining,
+                "used": self.rate_limit.used,
+                "reset_at": self.rate_limit.reset_at,
+                "resource": self.rate_limit.resource,
+            },
+        }
+
+    async def close(self) -> None:
+        await self._http.aclose()
+
+
+class GitHubRepo:
+    """The pull request operations TaskExecutor needs on one repository."""
+
+    def __init__(self, client: GitHubClient, owner: str, name: str):
+        self.client = client
+        self.owner = owner
+        self.name = name
+        self.full_name = f"{owner}/{name}"
+        self._path = f"/repos/{owner}/{name}"
+
+    async def find_open_pull(self, branch: str, head_owner: Optional[str] = None) -> Optional[dict]:
+        """The open PR whose head is branch, or None (conditional read)."""
+        pulls = await self.client.request(
+            "GET",
+            f"{self._path}/pulls",
+            params={"state": "open", "head": f"{head_owner or self.owner}:{branch}"},
+            conditional=True,
+        )
+        return pulls[0] if pulls else None
+
+    async def create_pull(self, title: str, body: str, head: str, base: str, draft: bool = False) -> dict:
+        return await self.client.request(
+            "POST",
+            f"{self._path}/pulls",
+            json={"title": title, "body": body, "head": head, "base": base, "draft": draft},
+        )
+
+    async def get_pull(self, number: int) -> dict:
+        """A PR's current state (conditional read)."""
+        return await self.client.request("GET", f"{self._path}/pulls/{number}", conditional=True)
+
+    async def wait_for_mergeable(self, number: int, timeout: float = 30.0, interval: float = 2.0) -> dict:
+        """
+        Fetch a PR until GitHub has computed its mergeability.
+
+        GitHub reports mergeable as null while the test merge is computed in
+        the background. Unchanged polls come back as free 304s.
+
+        Returns:
+            The PR; its "mergeable" is still None if timeout passed first
+        """
+        deadline = time.monotonic() + timeout
+        pull = await self.get_pull(number)
+        while pull.get("mergeable") is None and time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            pull = await self.get_pull(number)
+        return pull
+
+    async def merge_pull(self, number: int, commit_title: str, merge_method: str = "squash") -> dict:
+        return await self.client.request(
+            "PUT",
+            f"{self._path}/pulls/{number}/merge",
+            json={"commit_title": commit_title, "merge_method": merge_method},
+        )
+
+    async def delete_branch(self, branch: str) -> None:
+        await self.client.request("DELETE", f"{self._path}/git/refs/heads/{branch}")
+
+
+_clients: Dict[str, GitHubClient] = {}
+
+
+def get_github_status() -> Dict[str, dict]:
+    """Status of every shared client, keyed by the last four characters of its token."""
+    return {f"...{token[-4:]}": client.get_status() for token, client in _clients.items()}
+
+
+def get_github_client(token: Optional[str] = None) -> GitHubClient:
+    """
+    The process-wide client for a token (default: settings.github_token).
+
+    Raises:
+        ValueError: If no token is configured
+    """
+    token = token or settings.github_token
+    if not token:
+        raise ValueError("GitHub token not configured. Set GITHUB_TOKEN env var.")
+    client = _clients.get(token)
+    if client is None:
+        client = _clients[token] = GitHubClient(
+            token,
+            base_url=settings.github_api_url,
+            max_connections=settings.github_max_connections,
+        )
+    return client
+
+
+async def close_github_clients() -> None:
+    """Close every shared client's connection pool (application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
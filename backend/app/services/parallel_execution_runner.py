@@ -2,10 +2,11 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timezone
 
-from .worktree_pool import WorktreePool
+from .worktree_pool import LeasePriority, WorktreePool
+from .worktree_pool_registry import WorktreePoolRegistry
 from .autonomous_task_worker import AutonomousTaskWorker
 from app.database import async_session
 from app.models.autonomous import AutonomousSession, BatchExecution, TaskExecution
@@ -14,57 +15,138 @@ from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger(__name__)
 
-# Global worktree pool
+# Global worktree pools: one per project repository, the default one for CC4 itself
+_global_pool_registry: Optional[WorktreePoolRegistry] = None
 _global_worktree_pool: Optional[WorktreePool] = None
 
 
-async def initialize_global_worktree_pool(pool_size: int = 3, base_dir: str = "../CC4-worktrees"):
-    """Initialize the global worktree pool on application startup."""
-    global _global_worktree_pool
+async def initialize_global_worktree_pool(
+    pool_size: int = 3,
+    base_dir: str = "../CC4-worktrees",
+    provision_concurrency: int = 4,
+    min_ready: Optional[int] = None,
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    scale_down_idle_seconds: float = 600.0,
+    persistent: bool = False,
+    sparse_checkout: bool = False,
+    sparse_always_include: Optional[List[str]] = None,
+    dependency_cache: bool = False,
+    dependency_cache_link_mode: str = "hardlink",
+    affinity_wait_seconds: float = 2.0,
+    lease_ttl_seconds: Optional[float] = 300.0,
+    max_lease_seconds: Optional[float] = None,
+    reserved_worktrees: int = 0,
+    priority_aging_seconds: float = 30.0,
+    max_total_worktrees: int = 16,
+    max_total_disk_bytes: Optional[int] = None,
+    pool_idle_evict_seconds: Optional[float] = 1800.0,
+    clone_mode: Optional[str] = None,
+):
+    """
+    Initialize the global worktree pool registry on application startup.
+
+    Creates the pool for the CC4 repository itself; pools for other project
+    repositories are created on first use and share max_total_worktrees and
+    max_total_disk_bytes with it. Idle project pools are evicted after
+    pool_idle_evict_seconds.
+
+    With min_ready set, returns as soon as that many worktrees exist and
+    builds the rest in the background. With max_size > min_size the pool
+    autoscales between the two bounds. With persistent set, worktrees from
+    the previous run are adopted and left in place on shutdown. With
+    sparse_checkout set, each task's worktree only checks out the
+    directories of its declared files. With dependency_cache set, virtualenvs
+    and node_modules are built once per lockfile hash under
+    base_dir/.dependency-cache and linked into every worktree. With
+    reserved_worktrees set, that many free worktrees are held back for
+    interactive callers. With clone_mode set, new worktrees are reflinked
+    from a template checkout where the filesystem supports it.
+    """
+    global _global_pool_registry, _global_worktree_pool
 
-    if _global_worktree_pool is not None:
+    if _global_pool_registry is not None:
         logger.warning("Worktree pool already initialized")
         return
 
     logger.info(f"Initializing global worktree pool: {pool_size} worktrees in {base_dir}")
-    _global_worktree_pool = WorktreePool(
-        pool_size=pool_size,
+    _global_pool_registry = WorktreePoolRegistry(
         base_dir=base_dir,
-        main_repo_path="..",  # Project root is one level up from backend/
+        default_repo_path="..",  # Project root is one level up from backend/
+        pool_options=dict(
+            pool_size=pool_size,
+            provision_concurrency=provision_concurrency,
+            min_size=min_size,
+            max_size=max_size,
+            scale_down_idle_seconds=scale_down_idle_seconds,
+            persistent=persistent,
+            sparse_checkout=sparse_checkout,
+            sparse_always_include=sparse_always_include,
+            affinity_wait_seconds=affinity_wait_seconds,
+            lease_ttl_seconds=lease_ttl_seconds,
+            max_lease_seconds=max_lease_seconds,
+            reserved_worktrees=reserved_worktrees,
+            priority_aging_seconds=priority_aging_seconds,
+            clone_mode=clone_mode,
+        ),
+        max_total_worktrees=max_total_worktrees,
+        max_total_disk_bytes=max_total_disk_bytes,
+        idle_evict_seconds=pool_idle_evict_seconds,
+        dependency_cache=dependency_cache,
+        dependency_cache_link_mode=dependency_cache_link_mode,
     )
 
-    await _global_worktree_pool.initialize()
-    logger.info(f"Global worktree pool initialized with {pool_size} worktrees")
+    _global_worktree_pool = await _global_pool_registry.start(min_ready=min_ready)
+    logger.info(
+        f"Global worktree pool initialized with {len(_global_worktree_pool.worktrees)}"
+        f"/{pool_size} worktrees"
+    )
 
 
 async def cleanup_global_worktree_pool():
-    """Cleanup the global worktree pool on application shutdown."""
-    global _global_worktree_pool
+    """Cleanup all worktree pools on application shutdown."""
+    global _global_pool_registry, _global_worktree_pool
 
-    if _global_worktree_pool is None:
+    if _global_pool_registry is None:
         logger.warning("No worktree pool to cleanup")
         return
 
-    logger.info("Cleaning up global worktree pool...")
-    await _global_worktree_pool.cleanup()
+    logger.info("Cleaning up global worktree pools...")
+    await _global_pool_registry.close()
+    _global_pool_registry = None
     _global_worktree_pool = None
-    logger.info("Global worktree pool cleaned up")
+    logger.info("Global worktree pools cleaned up")
 
 
-async def start_parallel_execution(execution_id: str, num_workers: int = 3):
+async def start_parallel_execution(
+    execution_id: str,
+    num_workers: int = 3,
+    priority: LeasePriority = LeasePriority.NORMAL,
+    repo_path: Optional[str] = None,
+):
     """
     Start parallel execution for an autonomous session.
 
     Args:
         execution_id: ID of the execution session
         num_workers: Number of parallel workers to use
-    """
-    global _global_worktree_pool
+        priority: Priority class the session's workers acquire worktrees with
+        repo_path: Repository the session works on (None = the CC4 repository)
 
-    if _global_worktree_pool is None:
+    Raises:
+        WorktreePoolCapacityExceeded: If no pool can be created for repo_path
+    """
+    if _global_pool_registry is None:
         raise RuntimeError("Global worktree pool not initialized")
 
-    logger.info(f"[{execution_id}] Starting parallel execution with {num_workers} workers")
+    pool = await _global_pool_registry.get_pool(repo_path)
+    # Keep the pool from being evicted until every worker has exited
+    _global_pool_registry.pin(repo_path, execution_id)
+
+    logger.info(
+        f"[{execution_id}] Starting parallel execution with {num_workers} workers "
+        f"on {pool.main_repo_path}"
+    )
 
     # Create and start workers
     workers = []
@@ -75,7 +157,8 @@ async def start_parallel_execution(execution_id: str, num_workers: int = 3):
         worker = AutonomousTaskWorker(
             worker_id=worker_id,
             execution_id=execution_id,
-            pool=_global_worktree_pool,
+            pool=pool,
+            priority=priority,
         )
         workers.append(worker)
 
@@ -86,6 +169,13 @@ async def start_parallel_execution(execution_id: str, num_workers: int = 3):
         )
         worker_tasks.append(task)
 
+    def _worker_done(_task: asyncio.Task) -> None:
+        if all(t.done() for t in worker_tasks) and _global_pool_registry is not None:
+            _global_pool_registry.unpin(execution_id)
+
+    for task in worker_tasks:
+        task.add_done_callback(_worker_done)
+
     logger.info(f"[{execution_id}] {num_workers} workers started")
 
     # Workers will run in background and process batches as they come
@@ -95,3 +185,8 @@ async def start_parallel_execution(execution_id: str, num_workers: int = 3):
 async def get_worktree_pool() -> Optional[WorktreePool]:
     """Get the global worktree pool instance."""
     return _global_worktree_pool
+
+
+async def get_worktree_pool_registry() -> Optional[WorktreePoolRegistry]:
+    """Get the registry of per-repository worktree pools."""
+    return _global_pool_registry
@@ -21,6 +21,8 @@ class ParallelTestConfig:
     # Worktree settings
     num_workers: int = 3
     worktree_base_dir: str = "../PipelineHardening-worktrees"
+    sparse_checkout: bool = False  # Check out only the directories each task touches
+    sparse_always_include: List[str] = field(default_factory=list)
 
     # Queue settings
     max_queue_size: int = 100
@@ -96,6 +98,8 @@ class ParallelTestOrchestrator:
         self.pool = WorktreePool(
             pool_size=self.config.num_workers,
             base_dir=self.config.worktree_base_dir,
+            sparse_checkout=self.config.sparse_checkout,
+            sparse_always_include=self.config.sparse_always_include,
         )
         self.workers: List[ExecutionWorker] = []
 
@@ -332,7 +336,7 @@ class ParallelTestOrchestrator:
             Dictionary with orchestrator status information
         """
         queue_status = self.queue.get_status()
-        pool_status = self.pool.get_status()
+        pool_status = self.pool.get_pool_status()
 
         return {
             "session_id": self.session_id,
@@ -343,8 +347,20 @@ class ParallelTestOrchestrator:
             "pool": {
                 "num_free": self.pool.num_free,
                 "num_busy": self.pool.num_busy,
+                "num_dirty": self.pool.num_dirty,
                 "num_error": self.pool.num_error,
-                "worktrees": pool_status,
+                "num_quarantined": self.pool.num_quarantined,
+                "recycling": self.pool.get_recycle_metrics(),
+                "healer": self.pool.get_healer_metrics(),
+                "autoscaling": pool_status["autoscaling"],
+                "base": pool_status["base"],
+                "sparse": pool_status["sparse"],
+                "affinity": pool_status["affinity"],
+                "priorities": pool_status["priorities"],
+                "provisioning": pool_status["provisioning"],
+                "leases": pool_status["leases"],
+                "dependency_cache": pool_status["dependency_cache"],
+                "worktrees": self.pool.get_status(),
             },
             "workers": [
                 worker.get_status()
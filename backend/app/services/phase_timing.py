@@ -0,0 +1,106 @@
+"""Phase Timing - Per-phase spans of a task execution and their aggregation."""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List
+
+from .pool_telemetry import percentile
+
+# Phases of TaskExecutor.execute_task, in execution order
+PHASES = (
+    "setup",              # Branch creation or worktree preparation
+    "prompt_build",
+    "claude_queue",       # Waiting for a ClaudeGovernor slot
+    "claude_run",
+    "commit",             # Staging and commit (commit_all)
+    "push",
+    "pr_create",
+    "mergeability_wait",  # Fetching the PR until GitHub reports mergeability
+    "merge",
+)
+
+
+class PhaseTimer:
+    """
+    Records named, timed spans while a task executes.
+
+    Spans are stored as offsets from the timer's creation, so a task's
+    timeline can be reconstructed and gaps between phases are visible.
+    A phase that raises is still recorded, with ok=False.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self.spans: List[Dict] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase `name`."""
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.add(name, started, ok=ok)
+
+    def add(self, name: str, started: float, ok: bool = True) -> None:
+        """
+        Record a phase that began at `started` (a time.perf_counter() value) and ends now.
+
+        Args:
+            name: Phase name, normally one of PHASES
+            started: perf_counter() reading when the phase began
+            ok: Whether the phase completed without error
+        """
+        now = time.perf_counter()
+        self.spans.append({
+            "phase": name,
+            "start_seconds": round(started - self._origin, 4),
+            "duration_seconds": round(now - started, 4),
+            "ok": ok,
+        })
+
+    def to_list(self) -> List[Dict]:
+        """Copy of the recorded spans, in completion order."""
+        return [dict(span) for span in self.spans]
+
+
+def aggregate_phases(timelines: Iterable[List[Dict]]) -> Dict[str, Dict]:
+    """
+    Summarize phase durations across many task timelines.
+
+    A phase that occurs several times in one task (e.g. a retried push)
+    counts once, with its durations summed.
+
+    Args:
+        timelines: One list of spans per task, as produced by PhaseTimer.to_list()
+
+    Returns:
+        Phase name to count, p50/p95/max and total seconds; known phases
+        first in execution order, then any others alphabetically
+    """
+    durations: Dict[str, List[float]] = {}
+    for spans in timelines:
+        per_task: Dict[str, float] = {}
+        for span in spans or []:
+            name = span.get("phase")
+            seconds = span.get("duration_seconds")
+            if name is None or seconds is None:
+                continue
+            per_task[name] = per_task.get(name, 0.0) + float(seconds)
+        for name, seconds in per_task.items():
+            durations.setdefault(name, []).append(seconds)
+
+    order = [p for p in PHASES if p in durations] + sorted(set(durations) - set(PHASES))
+    summary: Dict[str, Dict] = {}
+    for name in order:
+        ordered = sorted(durations[name])
+        summary[name] = {
+            "count": len(ordered),
+            "p50_seconds": percentile(ordered, 50),
+            "p95_seconds": percentile(ordered, 95),
+            "max_seconds": ordered[-1],
+            "total_seconds": round(sum(ordered), 4),
+        }
+    return summary
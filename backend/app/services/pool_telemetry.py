@@ -0,0 +1,234 @@
+"""Pool Telemetry - Constant-time counters, rolling histograms and a utilization timeline."""
+
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds, from sub-second acquires to hour-long leases
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0,
+)
+
+
+def percentile(values: Iterable[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of a sample, or None if the sample is empty."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+class RollingHistogram:
+    """
+    Latency histogram with cumulative buckets and a rolling quantile window.
+
+    observe() is O(log buckets). Bucket counts and the sum only ever grow, as
+    Prometheus expects; percentiles are computed on read from the most
+    recent `window` observations.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, window: int = 1024):
+        self.bounds: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Record one observation (seconds)."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self._recent.append(value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile over the rolling window, or None if empty."""
+        return percentile(self._recent, pct)
+
+    def snapshot(self) -> dict:
+        """Totals plus p50/p95/p99 and max of the rolling window."""
+        return {
+            "count": self.count,
+            "sum_seconds": self.sum,
+            "window": len(self._recent),
+            "p50_seconds": self.percentile(50),
+            "p95_seconds": self.percentile(95),
+            "p99_seconds": self.percentile(99),
+            "max_seconds": max(self._recent) if self._recent else None,
+        }
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs for Prometheus, ending with +Inf."""
+        pairs: List[Tuple[str, int]] = []
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            pairs.append((_format_bound(bound), running))
+        pairs.append(("+Inf", running + self.counts[-1]))
+        return pairs
+
+
+class UtilizationTimeline:
+    """
+    Time-weighted pool occupancy in fixed-width buckets.
+
+    Callers report the current state on every change; the time spent in the
+    previous state is integrated into the buckets it covered, so each update
+    is constant time (bounded by the number of buckets elapsed) and a bucket
+    shows average busy/size/queued over its interval rather than a sample.
+    """
+
+    def __init__(self, bucket_seconds: float = 10.0, buckets: int = 360):
+        self.bucket_seconds = bucket_seconds
+        self._buckets: Deque[dict] = deque(maxlen=buckets)
+        self._state: Tuple[int, int, int] = (0, 0, 0)  # busy, size, queued
+        self._last = time.monotonic()
+
+    def update(self, busy: int, size: int, queued: int, now: Optional[float] = None) -> None:
+        """Account for time since the last update, then switch to the new state."""
+        now = time.monotonic() if now is None else now
+        self._integrate(now)
+        self._state = (busy, size, queued)
+        bucket = self._bucket(int(now // self.bucket_seconds))
+        bucket["peak_queued"] = max(bucket["peak_queued"], queued)
+
+    def _bucket(self, index: int) -> dict:
+        if not self._buckets or self._buckets[-1]["index"] < index:
+            self._buckets.append({
+                "index": index, "busy": 0.0, "size": 0.0, "queued": 0.0, "peak_queued": 0,
+            })
+        return self._buckets[-1]
+
+    def _integrate(self, now: float) -> None:
+        busy, size, queued = self._state
+        # Past a full timeline of idle time, older buckets would fall off anyway
+        t = max(self._last, now - self.bucket_seconds * (self._buckets.maxlen or 1))
+        index = int(t // self.bucket_seconds)
+        while t < now:
+            end = min(now, (index + 1) * self.bucket_seconds)
+            if end > t:
+                bucket = self._bucket(index)
+                span = end - t
+                bucket["busy"] += busy * span
+                bucket["size"] += size * span
+                bucket["queued"] += queued * span
+                t = end
+            index += 1
+        self._last = max(self._last, now)
+
+    def snapshot(self, now: Optional[float] = None) -> List[dict]:
+        """Per-bucket averages, oldest first; the current bucket is partial."""
+        now = time.monotonic() if now is None else now
+        self._integrate(now)
+        wall_offset = time.time() - now
+        points = []
+        for bucket in self._buckets:
+            start = bucket["index"] * self.bucket_seconds
+            span = min(self.bucket_seconds, now - start) or self.bucket_seconds
+            size = bucket["size"] / span
+            points.append({
+                "start": round(start + wall_offset, 3),
+                "avg_busy": round(bucket["busy"] / span, 3),
+                "avg_size": round(size, 3),
+                "avg_queued": round(bucket["queued"] / span, 3),
+                "peak_queued": bucket["peak_queued"],
+                "utilization": round(bucket["busy"] / bucket["size"], 3) if bucket["size"] else None,
+            })
+        return points
+
+
+class PoolTelemetry:
+    """Counters, histograms and the utilization timeline of one WorktreePool."""
+
+    HISTOGRAMS = {
+        "acquire_wait": "Time from acquire() call to lease, including queueing",
+        "lease_duration": "Time a worktree was held, from lease to release",
+        "cleanup_duration": "Time to clean a released worktree",
+        "recovery_duration": "Time spent on a recovery attempt of an errored worktree",
+        "provision_duration": "Time to build a new worktree",
+    }
+
+    COUNTERS = {
+        "acquires": "Leases granted",
+        "acquire_timeouts": "acquire() calls that timed out",
+        "releases": "Leases released",
+        "cleanups": "Released worktrees cleaned",
+        "cleanup_failures": "Cleanups that failed and sent the worktree to recovery",
+        "recoveries": "Errored worktrees recovered",
+        "recovery_failures": "Recovery attempts that failed",
+        "quarantines": "Worktrees quarantined after repeated failed recoveries",
+        "reaps": "Expired leases reclaimed by the reaper",
+    }
+
+    def __init__(self, timeline_bucket_seconds: float = 10.0, timeline_buckets: int = 360):
+        self.counters: Dict[str, int] = {name: 0 for name in self.COUNTERS}
+        self.histograms: Dict[str, RollingHistogram] = {
+            name: RollingHistogram() for name in self.HISTOGRAMS
+        }
+        self.timeline = UtilizationTimeline(timeline_bucket_seconds, timeline_buckets)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histograms[name].observe(seconds)
+
+    def snapshot(self) -> dict:
+        """JSON-ready view of every counter, histogram and the timeline."""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {name: hist.snapshot() for name, hist in self.histograms.items()},
+            "timeline_bucket_seconds": self.timeline.bucket_seconds,
+            "timeline": self.timeline.snapshot(),
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def render_prometheus(pools: Dict[str, Tuple[PoolTelemetry, Dict[str, int]]]) -> str:
+    """
+    Render pools' telemetry in the Prometheus text exposition format.
+
+    Args:
+        pools: Pool label (e.g. repo path) to (telemetry, gauges), where gauges
+               are current values such as {"free": 2, "busy": 1}
+
+    Returns:
+        Exposition text, one metric family per counter, gauge and histogram
+    """
+    lines: List[str] = []
+
+    for name, help_text in PoolTelemetry.COUNTERS.items():
+        metric = f"worktree_pool_{name}_total"
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for pool, (telemetry, _) in pools.items():
+            lines.append(f'{metric}{{pool="{_label(pool)}"}} {telemetry.counters[name]}')
+
+    gauge_names = sorted({g for _, gauges in pools.values() for g in gauges})
+    for name in gauge_names:
+        metric = f"worktree_pool_{name}"
+        lines += [f"# HELP {metric} Current {name.replace('_', ' ')}", f"# TYPE {metric} gauge"]
+        for pool, (_, gauges) in pools.items():
+            if name in gauges:
+                lines.append(f'{metric}{{pool="{_label(pool)}"}} {gauges[name]}')
+
+    for name, help_text in PoolTelemetry.HISTOGRAMS.items():
+        metric = f"worktree_pool_{name}_seconds"
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for pool, (telemetry, _) in pools.items():
+            hist = telemetry.histograms[name]
+            label = f'pool="{_label(pool)}"'
+            for le, count in hist.cumulative():
+                lines.append(f'{metric}_bucket{{{label},le="{le}"}} {count}')
+            lines.append(f"{metric}_sum{{{label}}} {hist.sum}")
+            lines.append(f"{metric}_count{{{label}}} {hist.count}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,293 @@
+"""Push Coordinator - Coalesces branch pushes from many worktrees into multi-refspec pushes."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from app.config import settings
+from .git_ops import run_git, worktree_git_dir
+
+logger = logging.getLogger(__name__)
+
+# `git push --porcelain` flags that mean the remote ref now matches ours
+_PUSHED_FLAGS = {" ", "+", "*", "="}
+
+
+@dataclass
+class PushResult:
+    """Outcome of pushing one branch."""
+    branch: str
+    ok: bool
+    flag: Optional[str] = None  # Porcelain flag: " " fast-forward, "*" new, "=" up to date, "!" rejected
+    summary: str = ""           # e.g. "abc123..def456", "[new branch]", "[rejected] (non-fast-forward)"
+    error: Optional[str] = None
+    batch_size: int = 1         # Branches pushed together in the same git push
+
+
+def git_common_dir(worktree_path: Union[str, Path]) -> Path:
+    """
+    Repository directory shared by a checkout and all its worktrees, without running git.
+
+    Reads the `.git` file of a linked worktree (gitdir: ...) and its
+    commondir file; a main checkout's `.git` directory is returned as-is.
+    """
+    git_dir = worktree_git_dir(Path(worktree_path))
+    commondir = git_dir / "commondir"
+    if commondir.exists():
+        return (git_dir / commondir.read_text().strip()).resolve()
+    return git_dir
+
+
+def checkout_root(git_dir: Union[str, Path]) -> Path:
+    """Main checkout of a common git dir (the dir itself for a bare repository)."""
+    git_dir = Path(git_dir)
+    return git_dir.parent if git_dir.name == ".git" else git_dir
+
+
+def parse_push_porcelain(output: str) -> Dict[str, tuple]:
+    """
+    Parse `git push --porcelain` output.
+
+    Returns:
+        Mapping of local ref (e.g. "refs/heads/x") to (flag, summary)
+    """
+    results: Dict[str, tuple] = {}
+    for line in output.splitlines():
+        if "\t" not in line or line.startswith("To "):
+            continue
+        flag, refs, summary = (line.split("\t", 2) + [""])[:3]
+        local = refs.split(":", 1)[0]
+        results[local] = (flag[:1], summary)
+    return results
+
+
+class PushCoordinator:
+    """
+    Pushes branches of one repository in batches.
+
+    All worktrees of a repository share its refs, so branches committed in
+    different worktrees can be pushed together from the common git dir. The
+    first push() opens a collection window of window_seconds; every branch
+    requested before it closes (or until max_batch branches are queued) goes
+    out in one `git push --porcelain -u <remote> <refspec>...`, a single
+    connection and negotiation. Each caller gets the result for its own ref;
+    one rejected ref does not fail the others. Branches that do not exist are
+    failed before the push, and a push that dies without reporting any ref is
+    retried ref by ref so the error lands only on the refs that caused it.
+
+    Usage:
+        coordinator = PushCoordinator(git_common_dir(worktree_path))
+        result = await coordinator.push("feature/batch-1-task-1-1")
+    """
+
+    def __init__(
+        self,
+        git_dir: Union[str, Path],
+        remote: str = "origin",
+        work_dir: Optional[Union[str, Path]] = None,
+        window_seconds: float = 0.2,
+        max_batch: int = 32,
+        timeout: float = 120.0,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            git_dir: Common git directory of the repository
+            remote: Remote name or URL to push to
+            work_dir: Directory git runs in, against which relative remote URLs
+                resolve. Defaults to the checkout root of git_dir.
+            window_seconds: How long the first request waits for others to join
+            max_batch: Branches that flush a batch immediately
+            timeout: Seconds before a git push is killed
+        """
+        self.git_dir = Path(git_dir)
+        self.remote = remote
+        self.work_dir = Path(work_dir) if work_dir is not None else checkout_root(self.git_dir)
+        self.window_seconds = window_seconds
+        self.max_batch = max(1, max_batch)
+        self.timeout = timeout
+
+        self._queued: Dict[str, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._full = asyncio.Event()
+
+        self.pushes_total = 0
+        self.refs_total = 0
+        self.failures_total = 0
+        self.push_seconds_total = 0.0
+        self.largest_batch = 0
+
+    async def push(self, branch: str) -> PushResult:
+        """
+        Push a local branch to the same name on the remote, batched with others.
+
+        Args:
+            branch: Local branch name
+
+        Returns:
+            PushResult for this branch (ok=False with error on rejection or failure)
+        """
+        future = self._queued.get(branch)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._queued[branch] = future
+        if len(self._queued) >= self.max_batch:
+            self._full.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush(), name="git-push-coordinator")
+        # Shield: one caller giving up must not cancel the push for everyone
+        return await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        while self._queued:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.window_seconds)
+            except asyncio.TimeoutError:
+                pass
+            batch = dict(list(self._queued.items())[:self.max_batch])
+            for branch in batch:
+                del self._queued[branch]
+            if len(self._queued) < self.max_batch:
+                self._full.clear()
+            # Branches requested while this push runs form the next batch
+            await self._push_batch(batch)
+
+    async def _existing_branches(self, branches: List[str]) -> Set[str]:
+        """Branches among `branches` that exist locally, in one for-each-ref."""
+        returncode, stdout, _ = await run_git(
+            ["--git-dir", str(self.git_dir), "for-each-ref", "--format=%(refname)",
+             *(f"refs/heads/{b}" for b in branches)],
+            cwd=self.work_dir,
+            timeout=self.timeout,
+        )
+        if returncode != 0:
+            # Let the push itself report on every ref
+            return set(branches)
+        refs = set(stdout.split())
+        return {b for b in branches if f"refs/heads/{b}" in refs}
+
+    async def _run_push(self, branches: List[str]) -> Tuple[Dict[str, tuple], Optional[str]]:
+        """
+        One `git push` of `branches`.
+
+        Returns:
+            Tuple of (parsed porcelain output, error). error is set only when git
+            failed without reporting any ref.
+        """
+        refspecs = [f"refs/heads/{b}:refs/heads/{b}" for b in branches]
+        try:
+            returncode, stdout, stderr = await run_git(
+                ["--git-dir", str(self.git_dir), "push", "--porcelain", "--set-upstream",
+                 self.remote, *refspecs],
+                cwd=self.work_dir,
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            return {}, f"git push timed out after {self.timeout:.0f}s"
+        except Exception as e:
+            return {}, str(e)
+        parsed = parse_push_porcelain(stdout)
+        if returncode != 0 and not parsed:
+            return {}, stderr.strip() or f"git push exited with {returncode}"
+        return parsed, None
+
+    async def _push_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        started = time.perf_counter()
+        errors: Dict[str, str] = {}
+        parsed: Dict[str, tuple] = {}
+
+        try:
+            existing = await self._existing_branches(list(batch))
+        except Exception:
+            existing = set(batch)
+        for branch in batch:
+            if branch not in existing:
+                errors[branch] = f"branch {branch} does not exist"
+        branches = [b for b in batch if b in existing]
+
+        pushes = 0
+        if branches:
+            parsed, error = await self._run_push(branches)
+            pushes += 1
+            if error is not None and len(branches) > 1:
+                # git reported no refs at all; find out which ones are at fault
+                logger.warning(f"Batched push to {self.remote} failed ({error}), retrying refs one by one")
+                for branch in branches:
+                    single, single_error = await self._run_push([branch])
+                    pushes += 1
+                    parsed.update(single)
+                    if single_error is not None:
+                        errors[branch] = single_error
+            elif error is not None:
+                errors[branches[0]] = error
+
+        elapsed = time.perf_counter() - started
+        self.pushes_total += pushes
+        self.refs_total += len(branches)
+        self.push_seconds_total += elapsed
+        self.largest_batch = max(self.largest_batch, len(branches))
+
+        for branch, future in batch.items():
+            flag, summary = parsed.get(f"refs/heads/{branch}", (None, ""))
+            error = errors.get(branch)
+            ok = error is None and flag in _PUSHED_FLAGS
+            if not ok:
+                self.failures_total += 1
+            result = PushResult(
+                branch=branch,
+                ok=ok,
+                flag=flag,
+                summary=summary,
+                error=None if ok else (error or summary or "ref missing from push output"),
+                batch_size=len(branches),
+            )
+            if not future.done():
+                future.set_result(result)
+
+        failed = sum(1 for future in batch.values() if not future.result().ok)
+        logger.info(
+            f"✓ Pushed {len(batch)} branch(es) to {self.remote} in {elapsed:.2f}s"
+            if not failed else
+            f"✗ Pushed {len(batch) - failed}/{len(batch)} branch(es) to {self.remote} in {elapsed:.2f}s"
+        )
+
+    def get_status(self) -> dict:
+        """Batching statistics."""
+        return {
+            "git_dir": str(self.git_dir),
+            "remote": self.remote,
+            "window_seconds": self.window_seconds,
+            "queued": len(self._queued),
+            "pushes_total": self.pushes_total,
+            "refs_total": self.refs_total,
+            "failures_total": self.failures_total,
+            "avg_batch_size": self.refs_total / self.pushes_total if self.pushes_total else None,
+            "largest_batch": self.largest_batch,
+            "push_seconds_total": round(self.push_seconds_total, 3),
+        }
+
+
+_coordinators: Dict[Path, PushCoordinator] = {}
+
+
+def get_push_coordinator(worktree_path: Union[str, Path], remote: str = "origin") -> PushCoordinator:
+    """The shared coordinator for the repository a worktree belongs to."""
+    git_dir = git_common_dir(worktree_path)
+    coordinator = _coordinators.get(git_dir)
+    if coordinator is None or coordinator.remote != remote:
+        coordinator = _coordinators[git_dir] = PushCoordinator(
+            git_dir,
+            remote=remote,
+            window_seconds=settings.git_push_window_seconds,
+            max_batch=settings.git_push_max_batch,
+        )
+    return coordinator
+
+
+def get_push_status() -> Dict[str, dict]:
+    """Batching statistics of every coordinator, keyed by git dir."""
+    return {str(git_dir): coordinator.get_status() for git_dir, coordinator in _coordinators.items()}
@@ -14,14 +14,21 @@ import asyncio
 import subprocess
 import logging
 import os
+import signal
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 from dataclasses import dataclass, field
 
-from github import Github, GithubException, Auth
-
 from app.config import settings
+from .claude_governor import ClaudeGovernor, get_claude_governor
+from .git_ops import GitError, commit_all, run_git
+from .github_client import GitHubAPIError, GitHubClient, get_github_client
+from .push_coordinator import PushCoordinator, get_push_coordinator
+from .phase_timing import PhaseTimer
+from .task_logs import OutputCapture
+from .worktree_pool import sparse_cone_dirs
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +66,24 @@ class ExecutionResult:
     merge_sha: Optional[str] = None
     error: Optional[str] = None
     duration_seconds: float = 0.0
-    claude_output: str = ""
+    claude_output: str = ""  # Tail of the CLI output; the full log is at claude_log_path
+    claude_log_path: Optional[str] = None
+    phases: List[dict] = field(default_factory=list)  # PhaseTimer spans, see phase_timing.PHASES
+
+
+async def _stop_process_group(proc: asyncio.subprocess.Process, grace_seconds: float) -> None:
+    """SIGTERM a subprocess's process group, then SIGKILL it if it has not exited in time."""
+    for sig, wait in ((signal.SIGTERM, grace_seconds), (signal.SIGKILL, None)):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            break
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=wait)
+            break
+        except asyncio.TimeoutError:
+            continue
+    await proc.wait()
 
 
 class TaskExecutor:
@@ -76,28 +100,76 @@ class TaskExecutor:
     - WorktreePool creates isolated worktrees with branches
     - Pass worktree path to execute_task()
     - Each task runs in isolation - no git conflicts
+
+    With sparse_checkout, the worktree is a cone-mode sparse checkout: each
+    task widens it to the directories of its files before running, and
+    commits stage paths outside the cone too.
+
+    The Claude CLI runs as an asyncio subprocess in its own process group,
+    so many executors can run in one event loop. Cancelling execute_task()
+    or hitting claude_timeout_seconds kills the CLI and everything it
+    started. on_process_start/on_process_exit receive the process group ID,
+    e.g. to register it with WorktreePool.register_lease_process().
+    lease_held, e.g. WorktreePool.holds_lease() bound to the worktree and
+    lease, is checked before committing and pushing: once the lease has been
+    reaped, the worktree may already be recycled for another task.
+
+    Every run first takes a slot from the process-wide ClaudeGovernor,
+    charged to session_id, so concurrent executors share its concurrency
+    and rate limits; claude_timeout_seconds only counts once the slot is held.
+
+    Pushes go through the repository's shared PushCoordinator, which sends
+    branches finished around the same time in a single `git push`. GitHub
+    calls go through the process-wide GitHubClient for the token, so
+    connections, the repository handle and conditional-read ETags are
+    shared across executors.
     """
 
+    # Seconds between SIGTERM and SIGKILL when stopping the CLI's process group
+    KILL_GRACE_SECONDS = 5.0
+
     def __init__(
         self,
         repo_path: Optional[str] = None,
         github_token: Optional[str] = None,
         repo_owner: Optional[str] = None,
         repo_name: Optional[str] = None,
+        sparse_checkout: bool = False,
+        claude_timeout_seconds: Optional[float] = None,
+        on_process_start: Optional[Callable[[int], None]] = None,
+        on_process_exit: Optional[Callable[[int], None]] = None,
+        output_tail_lines: int = 200,
+        session_id: Optional[str] = None,
+        governor: Optional[ClaudeGovernor] = None,
+        push_coordinator: Optional[PushCoordinator] = None,
+        github_client: Optional[GitHubClient] = None,
+        lease_held: Optional[Callable[[], bool]] = None,
     ):
         self.repo_path = Path(repo_path) if repo_path else Path(settings.repo_path)
         self.github_token = github_token or settings.github_token
         self.repo_owner = repo_owner or settings.github_repo_owner or "PROACTIVA-US"
         self.repo_name = repo_name or settings.github_repo_name or "PipelineHardening"
-        self._github: Optional[Github] = None
+        self.sparse_checkout = sparse_checkout
+        self.claude_timeout_seconds = (
+            claude_timeout_seconds if claude_timeout_seconds is not None
+            else settings.claude_timeout_seconds
+        )
+        self.on_process_start = on_process_start
+        self.on_process_exit = on_process_exit
+        self.output_tail_lines = output_tail_lines
+        self.session_id = session_id
+        self.governor = governor or get_claude_governor()
+        self.push_coordinator = push_coordinator
+        self._github = github_client
+        self.lease_held = lease_held
 
     @property
-    def github(self) -> Github:
-        """Lazy-load GitHub client."""
+    def github(self) -> GitHubClient:
+        """The shared GitHub client for this executor's token."""
         if self._github is None:
             if not self.github_token:
                 raise PRError("GitHub token not configured. Set GITHUB_TOKEN env var.")
-            self._github = Github(auth=Auth.Token(self.github_token))
+            self._github = get_github_client(self.github_token)
         return self._github
 
     async def execute_task(
@@ -112,6 +184,7 @@ class TaskExecutor:
         worktree_path: Optional[Path] = None,
         branch_name: Optional[str] = None,
         skip_github_ops: bool = False,
+        log_path: Optional[Path] = None,
     ) -> ExecutionResult:
         """
         Execute a single task end-to-end.
@@ -129,11 +202,14 @@ class TaskExecutor:
                           If None, uses legacy _create_branch (not recommended).
             branch_name: Branch name (required if worktree_path provided).
             skip_github_ops: If True, skips push/PR/merge operations (for local testing).
+            log_path: Append-only file receiving the CLI's full output as it runs.
 
         Returns:
-            ExecutionResult with success status and details
+            ExecutionResult with success status and details; its phases list
+            times each step (see phase_timing.PHASES)
         """
         start_time = datetime.now(timezone.utc)
+        phases = PhaseTimer()
 
         # Use provided branch name or generate one
         if branch_name is None:
@@ -147,13 +223,16 @@ class TaskExecutor:
         try:
             # 1. Create feature branch (only if NOT using worktree)
             # Worktrees already have their branch set up by WorktreePool
-            if worktree_path:
-                logger.info(f"[Task {task_number}] Using worktree: {worktree_path} (branch: {branch_name})")
-            else:
-                # DEPRECATED: This path has git corruption bugs with parallel execution
-                logger.warning(f"[Task {task_number}] Using legacy _create_branch - NOT RECOMMENDED for parallel execution")
-                logger.info(f"[Task {task_number}] Creating branch: {branch_name}")
-                await self._create_branch(branch_name)
+            with phases.phase("setup"):
+                if worktree_path:
+                    logger.info(f"[Task {task_number}] Using worktree: {worktree_path} (branch: {branch_name})")
+                    if self.sparse_checkout and files:
+                        await self._widen_sparse_checkout(files, worktree_path)
+                else:
+                    # DEPRECATED: This path has git corruption bugs with parallel execution
+                    logger.warning(f"[Task {task_number}] Using legacy _create_branch - NOT RECOMMENDED for parallel execution")
+                    logger.info(f"[Task {task_number}] Creating branch: {branch_name}")
+                    await self._create_branch(branch_name)
 
             # 2. Build prompt and execute with Claude (or mock for benchmarking)
             if skip_github_ops:
@@ -166,8 +245,11 @@ class TaskExecutor:
                     file_path.write_text(f"Benchmark test file for task {task_number}\n")
             else:
                 logger.info(f"[Task {task_number}] Executing with Claude CLI...")
-                prompt = self._build_prompt(task_number, task_title, implementation, files, verification_steps)
-                claude_output = await self._execute_with_claude(prompt, branch_name, exec_path)
+                with phases.phase("prompt_build"):
+                    prompt = self._build_prompt(task_number, task_title, implementation, files, verification_steps)
+                claude_output = await self._execute_with_claude(
+                    prompt, branch_name, exec_path, log_path=log_path, phases=phases
+                )
 
             # For benchmark/testing mode, skip GitHub operations
             if skip_github_ops:
@@ -179,6 +261,7 @@ class TaskExecutor:
                     task_number=task_number,
                     task_title=task_title,
                     exec_path=exec_path,
+                    phases=phases,
                 )
 
                 duration = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -189,6 +272,8 @@ class TaskExecutor:
                     files_changed=files_changed,
                     duration_seconds=duration,
                     claude_output=claude_output,
+                    claude_log_path=str(log_path) if log_path else None,
+                    phases=phases.to_list(),
                 )
 
             # 3. Commit and push
@@ -198,6 +283,7 @@ class TaskExecutor:
                 task_number=task_number,
                 task_title=task_title,
                 exec_path=exec_path,
+                phases=phases,
             )
 
             if not commit_sha:
@@ -208,24 +294,27 @@ class TaskExecutor:
                     branch_name=branch_name,
                     duration_seconds=duration,
                     claude_output=claude_output,
+                    claude_log_path=str(log_path) if log_path else None,
+                    phases=phases.to_list(),
                 )
 
             # 4. Create PR
             logger.info(f"[Task {task_number}] Creating PR...")
-            pr_number, pr_url = await self._create_pr(
-                branch_name=branch_name,
-                task_number=task_number,
-                task_title=task_title,
-                batch_number=batch_number,
-                files=files,
-            )
+            with phases.phase("pr_create"):
+                pr_number, pr_url = await self._create_pr(
+                    branch_name=branch_name,
+                    task_number=task_number,
+                    task_title=task_title,
+                    batch_number=batch_number,
+                    files=files,
+                )
 
             # 5. Merge PR if auto_merge enabled
             merged = False
             merge_sha = None
             if auto_merge and pr_number:
                 logger.info(f"[Task {task_number}] Merging PR #{pr_number}...")
-                merged, merge_sha = await self._merge_pr(pr_number, branch_name)
+                merged, merge_sha = await self._merge_pr(pr_number, branch_name, phases=phases)
 
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
 
@@ -240,6 +329,8 @@ class TaskExecutor:
                 merge_sha=merge_sha,
                 duration_seconds=duration,
                 claude_output=claude_output,
+                claude_log_path=str(log_path) if log_path else None,
+                phases=phases.to_list(),
             )
 
         except Exception as e:
@@ -252,6 +343,8 @@ class TaskExecutor:
                 error=str(e),
                 duration_seconds=duration,
                 claude_output=claude_output,
+                claude_log_path=str(log_path) if log_path else None,
+                phases=phases.to_list(),
             )
 
     def _generate_branch_name(self, batch_number: int, task_number: str) -> str:
@@ -315,6 +408,19 @@ class TaskExecutor:
         except subprocess.CalledProcessError as e:
             raise BranchError(f"Failed to create branch: {e.stderr}")
 
+    async def _widen_sparse_checkout(self, files: List[str], exec_path: Path) -> None:
+        """Add the directories of a task's files to a sparse worktree's cone."""
+        dirs = sparse_cone_dirs(files)
+        if not dirs:
+            return
+
+        returncode, _, stderr = await run_git(
+            ["sparse-checkout", "add", *dirs], cwd=Path(exec_path), timeout=120
+        )
+        if returncode != 0:
+            # Not a sparse worktree (e.g. leased as a full checkout) - nothing to widen
+            logger.debug(f"sparse-checkout add skipped: {stderr.strip()}")
+
     def _build_prompt(
         self,
         task_number: str,
@@ -361,15 +467,26 @@ class TaskExecutor:
         prompt: str,
         branch_name: str,
         exec_path: Optional[Path] = None,
+        log_path: Optional[Path] = None,
+        phases: Optional[PhaseTimer] = None,
     ) -> str:
         """Execute task using Claude Code CLI.
 
+        Output is streamed line by line to log_path as it is produced; only
+        the last output_tail_lines lines are kept in memory.
+
         Args:
             prompt: Task prompt to execute
             branch_name: Git branch name (for logging)
             exec_path: Path to execute in (worktree or repo). Uses self.repo_path if None.
+            log_path: Append-only file for the full output (None = keep the tail only)
+            phases: Timer receiving the claude_queue and claude_run spans
+
+        Returns:
+            The tail of the CLI's combined stdout/stderr
         """
         work_path = exec_path if exec_path else self.repo_path
+        phases = phases or PhaseTimer()
         logger.info(f"Executing Claude CLI with prompt ({len(prompt)} chars) in {work_path}...")
 
         # Write prompt to temp file
@@ -394,30 +511,63 @@ class TaskExecutor:
                     current_path = f"{extra_path}:{current_path}"
             env["PATH"] = current_path
 
-            # Run claude CLI
-            # Using --print for non-interactive mode, -p for prompt from stdin
-            result = subprocess.run(
-                ["claude", "--print", "-p", prompt],
-                cwd=str(work_path),
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minute timeout
-                env=env,
-            )
-
-            output = result.stdout + result.stderr
-            logger.info(f"Claude CLI completed with return code {result.returncode}")
+            # Wait for a slot under the global CLI limits before spawning
+            queued_at = time.perf_counter()
+            async with self.governor.slot(self.session_id):
+                phases.add("claude_queue", queued_at)
+                run_started = time.perf_counter()
+                # Run claude CLI in its own session so cancellation can kill its whole tree
+                # Using --print for non-interactive mode, -p for prompt from stdin
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        "claude", "--print", "-p", prompt,
+                        cwd=str(work_path),
+                        stdin=asyncio.subprocess.DEVNULL,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=env,
+                        start_new_session=True,
+                    )
+                except FileNotFoundError:
+                    raise ExecutionError("Claude CLI not found. Is `claude` installed and in PATH?")
+
+                pgid = proc.pid
+                if self.on_process_start:
+                    self.on_process_start(pgid)
+                capture = OutputCapture(log_path, tail_lines=self.output_tail_lines)
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(capture.pump(proc.stdout), capture.pump(proc.stderr), proc.wait()),
+                        timeout=self.claude_timeout_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    phases.add("claude_run", run_started, ok=False)
+                    await _stop_process_group(proc, self.KILL_GRACE_SECONDS)
+                    raise ExecutionError(
+                        f"Claude CLI execution timed out after {self.claude_timeout_seconds:.0f}s"
+                    )
+                except asyncio.CancelledError:
+                    logger.warning(f"Claude CLI on {branch_name} cancelled, killing process group {pgid}")
+                    await asyncio.shield(_stop_process_group(proc, self.KILL_GRACE_SECONDS))
+                    raise
+                else:
+                    phases.add("claude_run", run_started)
+                finally:
+                    capture.close()
+                    if self.on_process_exit:
+                        self.on_process_exit(pgid)
+
+                logger.info(
+                    f"Claude CLI completed with return code {proc.returncode} "
+                    f"({capture.lines_total} lines, {capture.bytes_total} bytes)"
+                )
 
-            if result.returncode != 0:
-                logger.warning(f"Claude CLI returned non-zero: {result.returncode}")
-                logger.warning(f"stderr: {result.stderr[:500]}")
+                if proc.returncode != 0:
+                    logger.warning(f"Claude CLI returned non-zero: {proc.returncode}")
+                    logger.warning(f"output tail: {capture.tail(10)[-500:]}")
 
-            return output
+                return capture.tail()
 
-        except subprocess.TimeoutExpired:
-            raise ExecutionError("Claude CLI execution timed out after 30 minutes")
-        except FileNotFoundError:
-            raise ExecutionError("Claude CLI not found. Is `claude` installed and in PATH?")
         finally:
             # Cleanup temp file
             if prompt_file.exists():
@@ -429,6 +579,7 @@ class TaskExecutor:
         task_number: str,
         task_title: str,
         exec_path: Optional[Path] = None,
+        phases: Optional[PhaseTimer] = None,
     ) -> Tuple[Optional[str], List[str]]:
         """Commit changes locally (no push). For benchmarking/testing.
 
@@ -437,64 +588,19 @@ class TaskExecutor:
             task_number: Task identifier for commit message
             task_title: Task title for commit message
             exec_path: Path to execute in (worktree or repo). Uses self.repo_path if None.
+            phases: Timer receiving the commit span
         """
-        work_path = exec_path if exec_path else self.repo_path
-
-        try:
-            # Check for changes
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=str(work_path),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            if not result.stdout.strip():
-                return None, []
-
-            # Get list of changed files
-            files_changed = [line[3:] for line in result.stdout.strip().split("\n") if line]
-
-            # Stage all changes
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=str(work_path),
-                capture_output=True,
-                check=True,
-            )
-
-            # Commit
-            commit_msg = (
-                f"feat(pipeline): {task_title}\n\n"
-                f"Task {task_number} from autonomous pipeline execution (benchmark mode).\n\n"
-                f"Co-Authored-By: Claude <noreply@anthropic.com>"
-            )
-
-            subprocess.run(
-                ["git", "commit", "-m", commit_msg],
-                cwd=str(work_path),
-                capture_output=True,
-                check=True,
-            )
-
-            # Get commit SHA
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(work_path),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            commit_sha = result.stdout.strip()
-
-            # No push in benchmark mode
+        commit_msg = (
+            f"feat(pipeline): {task_title}\n\n"
+            f"Task {task_number} from autonomous pipeline execution (benchmark mode).\n\n"
+            f"Co-Authored-By: Claude <noreply@anthropic.com>"
+        )
+        commit_sha, files_changed = await self._commit(commit_msg, exec_path, phases)
+
+        # No push in benchmark mode
+        if commit_sha:
             logger.debug(f"Local commit created: {commit_sha} (no push)")
-
-            return commit_sha, files_changed
-
-        except subprocess.CalledProcessError as e:
-            raise TaskExecutorError(f"Git operation failed: {e.stderr}")
+        return commit_sha, files_changed
 
     async def _commit_and_push(
         self,
@@ -502,6 +608,7 @@ class TaskExecutor:
         task_number: str,
         task_title: str,
         exec_path: Optional[Path] = None,
+        phases: Optional[PhaseTimer] = None,
     ) -> Tuple[Optional[str], List[str]]:
         """Commit changes and push to remote.
 
@@ -510,69 +617,59 @@ class TaskExecutor:
             task_number: Task identifier for commit message
             task_title: Task title for commit message
             exec_path: Path to execute in (worktree or repo). Uses self.repo_path if None.
+            phases: Timer receiving the commit and push spans
         """
         work_path = exec_path if exec_path else self.repo_path
+        phases = phases or PhaseTimer()
+
+        commit_msg = (
+            f"feat(pipeline): {task_title}\n\n"
+            f"Task {task_number} from autonomous pipeline execution.\n\n"
+            f"Co-Authored-By: Claude <noreply@anthropic.com>"
+        )
+        commit_sha, files_changed = await self._commit(commit_msg, exec_path, phases)
+        if not commit_sha:
+            return None, []
+
+        self._check_lease("push")
+        with phases.phase("push"):
+            coordinator = self.push_coordinator or get_push_coordinator(work_path)
+            result = await coordinator.push(branch_name)
+        if not result.ok:
+            raise TaskExecutorError(f"Git operation failed: {result.error}")
+        if result.batch_size > 1:
+            logger.debug(f"Pushed {branch_name} with {result.batch_size - 1} other branch(es)")
+
+        return commit_sha, files_changed
+
+    async def _commit(
+        self,
+        message: str,
+        exec_path: Optional[Path] = None,
+        phases: Optional[PhaseTimer] = None,
+    ) -> Tuple[Optional[str], List[str]]:
+        """Stage and commit everything in the worktree through commit_all().
 
+        Returns:
+            Tuple of (commit SHA, changed files), or (None, []) if nothing changed
+        """
+        work_path = exec_path if exec_path else self.repo_path
+        phases = phases or PhaseTimer()
+        self._check_lease("commit")
         try:
-            # Check for changes
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=str(work_path),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            if not result.stdout.strip():
-                return None, []
-
-            # Get list of changed files
-            files_changed = [line[3:] for line in result.stdout.strip().split("\n") if line]
-
-            # Stage all changes
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=str(work_path),
-                capture_output=True,
-                check=True,
-            )
-
-            # Commit
-            commit_msg = (
-                f"feat(pipeline): {task_title}\n\n"
-                f"Task {task_number} from autonomous pipeline execution.\n\n"
-                f"Co-Authored-By: Claude <noreply@anthropic.com>"
-            )
-
-            subprocess.run(
-                ["git", "commit", "-m", commit_msg],
-                cwd=str(work_path),
-                capture_output=True,
-                check=True,
-            )
-
-            # Get commit SHA
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(work_path),
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            commit_sha = result.stdout.strip()
-
-            # Push
-            subprocess.run(
-                ["git", "push", "-u", "origin", branch_name],
-                cwd=str(work_path),
-                capture_output=True,
-                check=True,
-            )
+            with phases.phase("commit"):
+                result = await commit_all(work_path, message, sparse=self.sparse_checkout)
+        except GitError as e:
+            raise TaskExecutorError(f"Git operation failed: {e.stderr}")
 
-            return commit_sha, files_changed
+        if result is None:
+            return None, []
+        return result.sha, result.files
 
-        except subprocess.CalledProcessError as e:
-            raise TaskExecutorError(f"Git operation failed: {e.stderr}")
+    def _check_lease(self, action: str) -> None:
+        """Refuse to act on a worktree whose lease was lost."""
+        if self.lease_held is not None and not self.lease_held():
+            raise TaskExecutorError(f"Worktree lease was lost, refusing to {action}")
 
     async def _create_pr(
         self,
@@ -584,14 +681,13 @@ class TaskExecutor:
     ) -> Tuple[int, str]:
         """Create a pull request via GitHub API."""
         try:
-            repo = self.github.get_repo(f"{self.repo_owner}/{self.repo_name}")
+            repo = self.github.repo(self.repo_owner, self.repo_name)
 
             # Check for existing PR
-            existing_prs = list(repo.get_pulls(state="open", head=f"{self.repo_owner}:{branch_name}"))
-            if existing_prs:
-                pr = existing_prs[0]
-                logger.info(f"Found existing PR #{pr.number}")
-                return pr.number, pr.html_url
+            existing = await repo.find_open_pull(branch_name)
+            if existing:
+                logger.info(f"Found existing PR #{existing['number']}")
+                return existing["number"], existing["html_url"]
 
             # Build PR body
             file_list = "\n".join(f"- `{f}`" for f in files) if files else "- See diff"
@@ -611,7 +707,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>
 """
 
             # Create PR
-            pr = repo.create_pull(
+            pr = await repo.create_pull(
                 title=f"Task {task_number}: {task_title}",
                 body=body,
                 head=branch_name,
@@ -619,48 +715,53 @@ Co-Authored-By: Claude <noreply@anthropic.com>
                 draft=False,
             )
 
-            logger.info(f"Created PR #{pr.number}: {pr.html_url}")
-            return pr.number, pr.html_url
+            logger.info(f"Created PR #{pr['number']}: {pr['html_url']}")
+            return pr["number"], pr["html_url"]
 
-        except GithubException as e:
+        except GitHubAPIError as e:
             raise PRError(f"Failed to create PR: {e}")
 
     async def _merge_pr(
         self,
         pr_number: int,
         branch_name: str,
+        phases: Optional[PhaseTimer] = None,
     ) -> Tuple[bool, Optional[str]]:
         """Merge a pull request."""
+        phases = phases or PhaseTimer()
         try:
-            repo = self.github.get_repo(f"{self.repo_owner}/{self.repo_name}")
-            pr = repo.get_pull(pr_number)
+            with phases.phase("mergeability_wait"):
+                repo = self.github.repo(self.repo_owner, self.repo_name)
+                # GitHub computes mergeability in the background; unchanged polls are free 304s
+                pr = await repo.wait_for_mergeable(pr_number)
 
             # Check if mergeable
-            if not pr.mergeable:
+            if not pr.get("mergeable"):
                 logger.warning(f"PR #{pr_number} is not mergeable")
                 return False, None
 
             # Merge
-            merge_result = pr.merge(
-                commit_title=f"Merge: {pr.title}",
-                merge_method="squash",
-            )
+            with phases.phase("merge"):
+                merge_result = await repo.merge_pull(
+                    pr_number,
+                    commit_title=f"Merge: {pr['title']}",
+                    merge_method="squash",
+                )
 
-            if merge_result.merged:
-                logger.info(f"PR #{pr_number} merged: {merge_result.sha}")
+            if merge_result.get("merged"):
+                logger.info(f"PR #{pr_number} merged: {merge_result.get('sha')}")
 
                 # Delete branch
                 try:
-                    ref = repo.get_git_ref(f"heads/{branch_name}")
-                    ref.delete()
+                    await repo.delete_branch(branch_name)
                     logger.info(f"Deleted branch: {branch_name}")
-                except GithubException:
+                except GitHubAPIError:
                     pass
 
-                return True, merge_result.sha
+                return True, merge_result.get("sha")
 
             return False, None
 
-        except GithubException as e:
+        except GitHubAPIError as e:
             logger.error(f"Failed to merge PR: {e}")
             return False, None
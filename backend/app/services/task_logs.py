@@ -0,0 +1,174 @@
+"""Task Logs - Streaming capture of Claude CLI output to a tail buffer and a spill file."""
+
+import asyncio
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, Optional, Tuple
+
+from app.config import settings
+
+# Bytes read from a pipe per chunk
+CHUNK_SIZE = 64 * 1024
+
+# Spill files currently being written, each with an event pulsed on new output
+_writing: Dict[str, asyncio.Event] = {}
+
+
+def task_log_path(execution_id: str, task_number: str) -> Path:
+    """
+    Where a task's CLI output is spilled.
+
+    Args:
+        execution_id: Autonomous session ID
+        task_number: Task identifier (e.g., "1.1")
+
+    Returns:
+        Path under settings.claude_log_dir, one directory per session
+    """
+    return Path(settings.claude_log_dir) / _safe_name(execution_id) / f"{_safe_name(task_number)}.log"
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", value) or "_"
+
+
+class OutputCapture:
+    """
+    Collects a subprocess's output line by line with constant memory.
+
+    Every line is appended to the spill file as soon as it is complete, so
+    the file can be tailed while the process runs; only the last tail_lines
+    lines are kept in memory. A line longer than max_line_bytes is split.
+    """
+
+    def __init__(
+        self,
+        spill_path: Optional[Path] = None,
+        tail_lines: int = 200,
+        max_line_bytes: int = 8192,
+    ):
+        """
+        Initialize the capture.
+
+        Args:
+            spill_path: Append-only file receiving all output (None = tail only)
+            tail_lines: Lines kept in memory for ExecutionResult.claude_output
+            max_line_bytes: Longest line kept whole; longer ones are split
+        """
+        self.spill_path = spill_path
+        self.max_line_bytes = max_line_bytes
+        self.bytes_total = 0
+        self.lines_total = 0
+        self._tail: Deque[str] = deque(maxlen=tail_lines)
+        self._file: Optional[BinaryIO] = None
+        if spill_path is not None:
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(spill_path, "ab")
+            _writing[_key(spill_path)] = asyncio.Event()
+
+    async def pump(self, stream: asyncio.StreamReader) -> None:
+        """Read a pipe to EOF, recording each complete line."""
+        partial = b""
+        while True:
+            chunk = await stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            partial += chunk
+            *lines, partial = partial.split(b"\n")
+            for line in lines:
+                self._record(line)
+            if len(partial) > self.max_line_bytes:
+                # Keep the last, possibly unfinished, piece for the next chunk
+                cut = (len(partial) - 1) // self.max_line_bytes * self.max_line_bytes
+                self._record(partial[:cut])
+                partial = partial[cut:]
+            self._wake_readers()
+        if partial:
+            self._record(partial)
+            self._wake_readers()
+
+    def _wake_readers(self) -> None:
+        if self.spill_path is not None:
+            event = _writing.get(_key(self.spill_path))
+            if event is not None:
+                event.set()
+                event.clear()
+
+    def _record(self, line: bytes) -> None:
+        """Record one line (without its newline), split into max_line_bytes pieces."""
+        pieces = [
+            line[start:start + self.max_line_bytes] + b"\n"
+            for start in range(0, max(len(line), 1), self.max_line_bytes)
+        ]
+        for piece in pieces:
+            self.bytes_total += len(piece)
+            self.lines_total += 1
+            self._tail.append(piece.decode(errors="replace"))
+        if self._file is not None:
+            self._file.write(b"".join(pieces))
+            self._file.flush()
+
+    def tail(self, lines: Optional[int] = None) -> str:
+        """The last `lines` lines of output (default: the whole tail buffer)."""
+        kept = list(self._tail)
+        if lines is not None:
+            kept = kept[-lines:] if lines > 0 else []
+        return "".join(kept)
+
+    def close(self) -> None:
+        """Close the spill file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._wake_readers()
+            _writing.pop(_key(self.spill_path), None)
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def is_being_written(path: Path) -> bool:
+    """Whether a CLI run in this process is still appending to path."""
+    return _key(path) in _writing
+
+
+async def wait_for_output(path: Path, timeout: float) -> None:
+    """
+    Wait until more output is appended to path, or timeout elapses.
+
+    Readers of a log written in this process are woken on every chunk;
+    the timeout covers logs written elsewhere.
+    """
+    event = _writing.get(_key(path))
+    if event is None:
+        await asyncio.sleep(timeout)
+        return
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+def read_log_range(path: Path, offset: int, limit: int) -> Tuple[bytes, int, int]:
+    """
+    Read at most limit bytes of a log starting at offset.
+
+    Only the requested range is read, so any number of readers can page
+    through a large log cheaply. A negative offset counts from the end.
+
+    Returns:
+        Tuple of (data, next offset, current file size); empty data and
+        size 0 if the log does not exist yet
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            start = max(0, size + offset) if offset < 0 else min(offset, size)
+            f.seek(start)
+            data = f.read(max(0, limit))
+    except FileNotFoundError:
+        return b"", 0, 0
+    return data, start + len(data), size
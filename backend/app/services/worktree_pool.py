@@ -1,14 +1,25 @@
 """Worktree Pool Manager - Manages pool of git worktrees for parallel execution."""
 
 import asyncio
-import subprocess
 import logging
+import os
+import shlex
+import shutil
+import signal
+import subprocess
 import time
-from pathlib import Path
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, Optional, List, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
+from enum import Enum, IntEnum
+
+from .dependency_cache import DependencyCache
+from .git_objects import GitObjectReader, resolve_ref
+from .git_ops import changed_paths, parse_status_v2, run_git, worktree_git_dir
+from .pool_telemetry import PoolTelemetry, percentile
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +34,34 @@ class WorktreeRecoveryFailed(Exception):
     pass
 
 
+class WorktreePoolClosed(Exception):
+    """Raised to pending acquirers when the pool is cleaned up."""
+    pass
+
+
 class WorktreeStatus(Enum):
     """Status of a worktree."""
     FREE = "free"
     BUSY = "busy"
-    ERROR = "error"
+    DIRTY = "dirty"    # Released, waiting for the recycler to clean it
+    ERROR = "error"    # Waiting for the healer to recover it
+    QUARANTINED = "quarantined"  # Recovery kept failing; excluded until unquarantined
+    RETIRING = "retiring"  # Being removed by autoscaler scale-down
+
+
+class LeasePriority(IntEnum):
+    """Priority class of an acquire() call; lower values are served first."""
+    INTERACTIVE = 0  # A person is waiting (reruns, single tasks)
+    NORMAL = 1       # Autonomous sessions
+    BACKGROUND = 2   # Bulk runs such as the parallel test harness
+
+
+@dataclass
+class AffinityHint:
+    """What a lease relates to, so acquire() can prefer a worktree that is already warm for it."""
+    batch: Optional[int] = None          # Plan batch number
+    files: Optional[List[str]] = None    # Files the task will touch
+    worktree_id: Optional[str] = None    # Worktree the caller leased last time
 
 
 @dataclass
@@ -36,10 +70,155 @@ class WorktreeInfo:
     id: str                              # "wt-1", "wt-2", etc.
     path: Path                           # /path/to/PipelineHardening-worktrees/wt-1
     branch: str                          # "worktree-wt-1"
-    status: WorktreeStatus               # FREE, BUSY, ERROR
+    status: WorktreeStatus               # FREE, BUSY, DIRTY, ERROR, QUARANTINED, RETIRING
     current_test: Optional[str] = None   # Test plan being executed
     created_at: Optional[datetime] = None
     last_used: Optional[datetime] = None
+    recovery_attempts: int = 0           # Consecutive failed recoveries
+    next_recovery_at: float = 0.0        # time.monotonic() before which the healer skips it
+    idle_since: Optional[float] = None   # time.monotonic() when it last went onto the free-list
+    sparse_dirs: Optional[List[str]] = None  # Cone-mode sparse directories (None = full checkout)
+    cache_generation: Optional[int] = None   # DependencyCache.generation at its last attach
+    last_affinity: Optional[AffinityHint] = None  # Hint given by the most recent lease
+    lease_id: int = 0                    # Changes on every lease; stale holders can't release a re-leased tree
+    lease_started_at: Optional[float] = None  # time.monotonic() when the current lease began
+    lease_expires_at: Optional[float] = None  # time.monotonic() after which the reaper reclaims it
+    lease_pgids: Set[int] = field(default_factory=set)  # Process groups started for the current lease
+
+
+def _parse_worktree_list(output: str) -> List[Dict[str, str]]:
+    """
+    Parse `git worktree list --porcelain` output.
+
+    Returns:
+        One dict per worktree with "worktree", "HEAD" and "branch" keys (when
+        present) plus flag keys such as "prunable", "locked" or "detached"
+    """
+    entries: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if current:
+                entries.append(current)
+                current = {}
+            continue
+        key, _, value = line.partition(" ")
+        current[key] = value
+    if current:
+        entries.append(current)
+    return entries
+
+
+def _path_count_bucket(count: int) -> str:
+    """Bucket label used for per-path-count cleanup timings."""
+    if count == 0:
+        return "0"
+    if count <= 10:
+        return "1-10"
+    if count <= 100:
+        return "11-100"
+    return "101+"
+
+
+def sparse_cone_dirs(files: Iterable[str], always_include: Iterable[str] = ()) -> List[str]:
+    """
+    Directories a cone-mode sparse checkout needs for a set of task files.
+
+    Each file contributes its parent directory (a trailing slash marks a
+    directory that is included as-is). Files at the repository root need no
+    entry because cone mode always checks out top-level files. Globs, absolute
+    paths and paths escaping the repository are ignored.
+
+    Args:
+        files: Repository-relative paths declared by the task
+        always_include: Directories added to every cone (test configs, lockfiles)
+
+    Returns:
+        Sorted, de-duplicated directories with nested entries collapsed
+    """
+    dirs: Set[str] = set()
+    for entry in always_include:
+        path = PurePosixPath(entry.strip().rstrip("/"))
+        if str(path) not in ("", "."):
+            dirs.add(str(path))
+
+    for file in files:
+        file = file.strip()
+        if not file or file.startswith("/") or any(c in file for c in "*?["):
+            continue
+        path = PurePosixPath(file.rstrip("/")) if file.endswith("/") else PurePosixPath(file).parent
+        if ".." in path.parts or str(path) == ".":
+            continue
+        dirs.add(str(path))
+
+    # Cone mode includes everything below a directory, so drop nested entries
+    collapsed: List[str] = []
+    for path in sorted(dirs):
+        if not any(path.startswith(parent + "/") for parent in collapsed):
+            collapsed.append(path)
+    return collapsed
+
+
+def _affinity_score(hint: AffinityHint, info: WorktreeInfo) -> int:
+    """
+    How well a worktree's last lease matches an affinity hint (0 = no overlap).
+
+    The caller's own previous worktree outranks a same-batch worktree, which
+    outranks one that merely shares files or directories.
+    """
+    score = 0
+    if hint.worktree_id is not None and hint.worktree_id == info.id:
+        score += 1000
+
+    last = info.last_affinity
+    if last is None:
+        return score
+    if hint.batch is not None and hint.batch == last.batch:
+        score += 100
+    if hint.files and last.files:
+        score += len(set(hint.files) & set(last.files))
+        score += len(
+            {str(PurePosixPath(f).parent) for f in hint.files}
+            & {str(PurePosixPath(f).parent) for f in last.files}
+        )
+    return score
+
+
+def _reflink_supported(directory: Path) -> bool:
+    """Whether `cp --reflink=always` works on the filesystem holding directory."""
+    probe = directory / ".reflink-probe"
+    clone = directory / ".reflink-probe-clone"
+    try:
+        probe.write_bytes(b"probe")
+        result = subprocess.run(
+            ["cp", "--reflink=always", str(probe), str(clone)], capture_output=True
+        )
+        return result.returncode == 0
+    finally:
+        probe.unlink(missing_ok=True)
+        clone.unlink(missing_ok=True)
+
+
+def _clone_tree(src: Path, dst: Path) -> None:
+    """Reflink a checkout's files (not its .git file) into dst."""
+    entries = [name for name in os.listdir(src) if name != ".git"]
+    if entries:
+        subprocess.run(
+            ["cp", "-a", "--reflink=always", *(str(src / name) for name in entries), str(dst)],
+            check=True,
+            capture_output=True,
+        )
+
+
+@dataclass
+class _Waiter:
+    """A pending acquire() call parked in the waiter queue or the affinity queue."""
+    future: "asyncio.Future[WorktreeInfo]"
+    test_name: Optional[str] = None
+    affinity: Optional[AffinityHint] = None
+    priority: LeasePriority = LeasePriority.NORMAL
+    use_reserved: bool = False           # May take one of the reserved worktrees
+    enqueued_at: float = field(default_factory=time.perf_counter)
 
 
 class WorktreePool:
@@ -48,13 +227,98 @@ class WorktreePool:
 
     Each worktree is an isolated working directory linked to the main repository,
     allowing multiple tests to run simultaneously without conflicts.
+
+    Acquisition is event-driven: FREE worktrees sit on a free-list, and callers
+    that find it empty park on a waiter queue. release() hands the worktree
+    straight to the best waiter, so there is no polling.
+
+    Waiters are ordered by LeasePriority, then arrival. Waiting ages a caller
+    up one priority class every priority_aging_seconds, so background work
+    is delayed but never starved. reserved_worktrees trees are held back for
+    INTERACTIVE callers: other callers only take a free tree while more than
+    that many are free.
+
+    Callers can pass an AffinityHint (batch, files, previous worktree). Among
+    FREE worktrees the best match wins, and any free worktree is taken at
+    once if none matches. Only when nothing is free and a BUSY or DIRTY
+    worktree matches does the caller wait for it, up to
+    affinity_wait_seconds, before queuing for whichever frees up first.
+
+    Provisioning runs git as async subprocesses, several worktrees at a time,
+    and the pool can start serving before every worktree has been built.
+
+    Released worktrees are marked DIRTY and cleaned by background recycler
+    tasks (at most recycle_concurrency at once); only clean worktrees ever
+    reach the free-list.
+
+    ERROR worktrees are recovered by a background healer with exponential
+    backoff, never on the acquire() path. A worktree that fails recovery
+    max_recovery_attempts times in a row is QUARANTINED.
+
+    With max_size > min_size the pool is elastic: an autoscaler adds worktrees
+    while callers queue for too long and retires worktrees that sit idle,
+    always staying within [min_size, max_size].
+
+    The base commit that worktrees are built from and reset to is pinned per
+    epoch. refresh_base() runs a single `git fetch` in the main repository
+    (whose object store every linked worktree shares) and concurrent refresh
+    requests share that one in-flight fetch.
+
+    In sparse mode each lease is narrowed with cone-mode sparse-checkout to the
+    directories of the files the caller declares (plus sparse_always_include),
+    so checkout, reset and clean scale with the task footprint rather than
+    the size of the repository.
+
+    With a dependency_cache, shared dependency directories (virtualenvs,
+    node_modules) are linked into each worktree once per lockfile hash and
+    survive recycling instead of being rebuilt by every task.
+
+    Leases expire unless renewed: holders wrap their work in keep_alive() (or
+    call renew()), and a reaper reclaims leases that stop heartbeating or
+    exceed max_lease_seconds. Reaping kills the process groups registered for
+    the lease and recycles the worktree, so a crashed or hung holder cannot
+    shrink the pool; a holder that outlived its lease sees holds_lease() fail.
+
+    In persistent mode the pool adopts worktrees left by a previous run
+    (resetting only the dirty ones) and leaves them on disk at shutdown, so
+    restarts keep warm checkouts instead of rebuilding them.
     """
 
+    # Retries for git commands that lose a race on a shared lock file in the main repo
+    GIT_LOCK_RETRIES = 3
+
     def __init__(
         self,
         pool_size: int = 3,
         base_dir: str = "../PipelineHardening-worktrees",
         main_repo_path: Optional[str] = None,
+        provision_concurrency: int = 4,
+        min_ready: Optional[int] = None,
+        recycle_concurrency: int = 2,
+        max_recovery_attempts: int = 5,
+        recovery_backoff_seconds: float = 2.0,
+        recovery_backoff_max_seconds: float = 300.0,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        scale_up_wait_seconds: float = 2.0,
+        scale_down_idle_seconds: float = 600.0,
+        autoscale_interval_seconds: float = 5.0,
+        persistent: bool = False,
+        incremental_cleanup_max_paths: int = 500,
+        base_branch: str = "main",
+        base_remote: str = "origin",
+        base_max_age_seconds: Optional[float] = 300.0,
+        sparse_checkout: bool = False,
+        sparse_always_include: Optional[List[str]] = None,
+        dependency_cache: Optional[DependencyCache] = None,
+        affinity_wait_seconds: float = 2.0,
+        lease_ttl_seconds: Optional[float] = 300.0,
+        max_lease_seconds: Optional[float] = None,
+        reaper_interval_seconds: float = 15.0,
+        reserved_worktrees: int = 0,
+        priority_aging_seconds: float = 30.0,
+        growth_budget: Optional[Callable[[], int]] = None,
+        clone_mode: Optional[str] = None,
     ):
         """
         Initialize worktree pool.
@@ -63,43 +327,505 @@ class WorktreePool:
             pool_size: Number of worktrees to create
             base_dir: Directory where worktrees will be created
             main_repo_path: Path to main repository (auto-detected if None)
+            provision_concurrency: Maximum number of worktrees built at the same time
+            min_ready: Number of worktrees initialize() waits for before returning;
+                       the rest keep building in the background (None = wait for all)
+            recycle_concurrency: Maximum number of released worktrees cleaned at the same time
+            max_recovery_attempts: Consecutive failed recoveries before a worktree is quarantined
+            recovery_backoff_seconds: Delay before the second recovery attempt (doubles each time)
+            recovery_backoff_max_seconds: Upper bound on the recovery backoff
+            min_size: Lower bound for autoscaling (defaults to pool_size)
+            max_size: Upper bound for autoscaling (defaults to pool_size, i.e. fixed size)
+            scale_up_wait_seconds: Grow when waiters exist and the p95 acquire wait
+                                   or the oldest waiter's age exceeds this
+            scale_down_idle_seconds: Retire FREE worktrees idle longer than this
+            autoscale_interval_seconds: How often the autoscaler re-evaluates
+            persistent: Adopt existing worktrees on initialize() and keep them on cleanup()
+            incremental_cleanup_max_paths: Above this many changed paths, cleanup does a
+                                           full reset/clean instead of restoring paths one by one
+            base_branch: Branch worktrees are built from and reset to
+            base_remote: Remote fetched by refresh_base()
+            base_max_age_seconds: When the pinned base is older than this, the next
+                                  lookup triggers a background refresh (None = never)
+            sparse_checkout: Narrow leased worktrees to the directories of the files
+                             passed to acquire()
+            sparse_always_include: Directories included in every sparse checkout
+            dependency_cache: Shared dependency directories to link into worktrees
+            affinity_wait_seconds: How long acquire() waits for a matching busy worktree
+                                   when no worktree is free
+            lease_ttl_seconds: A lease not renewed for this long is reaped (None = never)
+            max_lease_seconds: Hard cap on a lease, heartbeats or not (None = no cap)
+            reaper_interval_seconds: How often the reaper looks for expired leases
+            reserved_worktrees: Free worktrees kept back for INTERACTIVE callers
+            priority_aging_seconds: Waiting this long promotes a waiter one priority class
+            growth_budget: Called before scaling up; returns how many more worktrees
+                           may be built (lets several pools share one global cap)
+            clone_mode: Build worktrees by reflinking a template checkout instead of
+                        checking out: "reflink" or "auto" (both fall back to a
+                        checkout where the filesystem has no reflinks; "reflink"
+                        also logs a warning). Files are never hardlinked: a task
+                        editing one in place would change it in every worktree.
+                        None = plain `git worktree add`. Ignored in sparse mode.
         """
-        self.pool_size = pool_size
+        if clone_mode not in (None, "auto", "reflink"):
+            raise ValueError(f"Unknown clone_mode: {clone_mode}")
+
+        self.min_size = max(1, min_size if min_size is not None else pool_size)
+        self.max_size = max(self.min_size, max_size if max_size is not None else pool_size)
+        self.pool_size = min(max(pool_size, self.min_size), self.max_size)
         self.base_dir = Path(base_dir).absolute()
         self.main_repo_path = Path(main_repo_path) if main_repo_path else Path.cwd()
+        self.provision_concurrency = max(1, provision_concurrency)
+        self.min_ready = min_ready
         self.worktrees: Dict[str, WorktreeInfo] = {}
         self._lock = asyncio.Lock()
         self._initialized = False
+        self._provision_semaphore = asyncio.Semaphore(self.provision_concurrency)
+        self._provisioning: Set[asyncio.Task] = set()
+        self._provisioning_ids: Set[str] = set()
+        # `git worktree add` reads every entry under .git/worktrees, so a
+        # concurrent add can trip over another's half-written one; only this
+        # registration step is serialized, file writes still run in parallel
+        self._worktree_admin_lock = asyncio.Lock()
+
+        # Background recycling of released (DIRTY) worktrees
+        self.recycle_concurrency = max(1, recycle_concurrency)
+        self._recycle_semaphore = asyncio.Semaphore(self.recycle_concurrency)
+        self._recycling: Set[asyncio.Task] = set()
+        self._recycle_latencies: Deque[float] = deque(maxlen=512)
+        self._recycled_total = 0
+        self._recycle_failures = 0
+        self.incremental_cleanup_max_paths = incremental_cleanup_max_paths
+        self._cleanup_timings: Dict[str, Deque[float]] = {}
+
+        # Pinned base commit, refreshed by one coalesced fetch per epoch
+        self.base_branch = base_branch
+        self.base_remote = base_remote
+        self.base_max_age_seconds = base_max_age_seconds
+        self._base_sha: Optional[str] = None
+        self._base_epoch = 0
+        # Long-lived cat-file helpers: one for the main repo, one per worktree
+        self._main_objects = GitObjectReader(self.main_repo_path)
+        self._object_readers: Dict[str, GitObjectReader] = {}
+        self._base_refreshed_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._fetches_total = 0
+        self._fetch_failures = 0
+        self._refreshes_coalesced = 0
+        self._last_fetch_seconds: Optional[float] = None
+
+        # Sparse-checkout worktrees scoped to each lease's files
+        self.sparse_checkout = sparse_checkout
+        self.sparse_always_include = list(sparse_always_include or [])
+        self._sparse_narrowed = 0
+        self._sparse_failures = 0
+
+        # Shared dependency/build directories, kept out of cleanup
+        self.dependency_cache = dependency_cache
+
+        # Background healing of ERROR worktrees
+        self.max_recovery_attempts = max(1, max_recovery_attempts)
+        self.recovery_backoff_seconds = recovery_backoff_seconds
+        self.recovery_backoff_max_seconds = recovery_backoff_max_seconds
+        self._healer_task: Optional[asyncio.Task] = None
+        self._heal_wakeup = asyncio.Event()
+        self._recovered_total = 0
+        self._recovery_failures = 0
+
+        # Free-list of FREE worktree IDs and FIFO queue of parked acquirers
+        self._free: Deque[str] = deque()
+        self._waiters: Deque[_Waiter] = deque()
+        self._acquire_waits: Deque[float] = deque(maxlen=256)
+
+        # Priority classes with aging, and worktrees reserved for interactive callers
+        self.reserved_worktrees = max(0, reserved_worktrees)
+        self.priority_aging_seconds = priority_aging_seconds
+        self._waits_by_priority: Dict[LeasePriority, Deque[float]] = {
+            priority: deque(maxlen=256) for priority in LeasePriority
+        }
+
+        # Constant-time state counts and telemetry for get_telemetry()/metrics endpoints
+        self._status_counts: Dict[WorktreeStatus, int] = {status: 0 for status in WorktreeStatus}
+        self._queued = 0
+        self.telemetry = PoolTelemetry()
+
+        # Cap shared with other pools (see WorktreePoolRegistry)
+        self.growth_budget = growth_budget
+
+        # Copy-on-write provisioning from a template checkout kept at the pinned base
+        self.clone_mode = clone_mode
+        self.template_path = self.base_dir / ".template"
+        self._template_sha: Optional[str] = None
+        self._template_lock = asyncio.Lock()
+        self._clone_method: Optional[str] = None  # clone_mode after probing for reflink support
+        self._provisioned: Dict[str, int] = {"reflink": 0, "checkout": 0}
+        self._provision_seconds: Dict[str, float] = {"reflink": 0.0, "checkout": 0.0}
+        self._clone_fallbacks = 0
+
+        # Lease heartbeats and reclamation of abandoned BUSY worktrees
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.max_lease_seconds = max_lease_seconds
+        self.reaper_interval_seconds = reaper_interval_seconds
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._lease_counter = 0
+        self._reaped_total = 0
+        self._killed_process_groups = 0
+        self._stale_releases = 0
+        self._reap_events: Deque[dict] = deque(maxlen=50)
+
+        # Affinity-aware leasing: callers briefly waiting for a matching worktree
+        self.affinity_wait_seconds = affinity_wait_seconds
+        self._affinity_waiters: Deque[_Waiter] = deque()
+        self._affinity_requests = 0
+        self._affinity_hits = 0
+        self._affinity_waits = 0
+        self._affinity_wait_hits = 0
+
+        # Elastic sizing
+        self.scale_up_wait_seconds = scale_up_wait_seconds
+        self.scale_down_idle_seconds = scale_down_idle_seconds
+        self.autoscale_interval_seconds = autoscale_interval_seconds
+        self._autoscaler_task: Optional[asyncio.Task] = None
+        self._retiring: Set[asyncio.Task] = set()
+        self._scale_decisions: Deque[dict] = deque(maxlen=50)
+
+        # Persistent mode: worktrees from a previous run that can be adopted
+        self.persistent = persistent
+        self._adoptable: Dict[str, Dict[str, str]] = {}
 
     async def initialize(self) -> None:
         """
         Create all worktrees in the pool.
 
-        Creates the base directory and initializes each worktree with a unique branch.
+        Creates the base directory and builds the worktrees concurrently, at most
+        provision_concurrency at a time. Returns once min_ready worktrees are
+        available; any remaining worktrees finish in the background and are handed
+        to waiters as they come up.
+
+        Raises:
+            Exception: If fewer than min_ready worktrees could be created
         """
         if self._initialized:
             logger.warning("Worktree pool already initialized")
             return
 
-        logger.info(f"Initializing worktree pool with {self.pool_size} worktrees")
+        logger.info(
+            f"Initializing worktree pool with {self.pool_size} worktrees "
+            f"({self.provision_concurrency} at a time)"
+        )
         logger.info(f"Base directory: {self.base_dir}")
         logger.info(f"Main repo: {self.main_repo_path}")
 
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create each worktree
-        for i in range(1, self.pool_size + 1):
-            wt_id = f"wt-{i}"
+        # One fetch up front so every worktree is built from the same base
+        await self.refresh_base()
+
+        if self.dependency_cache is not None:
+            await self.dependency_cache.install_excludes(self.main_repo_path)
+
+        if self.persistent:
+            self._adoptable = await self._discover_worktrees()
+            logger.info(f"Found {len(self._adoptable)} adoptable worktrees from a previous run")
+
+        target = self.pool_size if self.min_ready is None else max(1, min(self.min_ready, self.pool_size))
+        started = time.perf_counter()
+
+        pending = {self._spawn_provision(f"wt-{i}") for i in range(1, self.pool_size + 1)}
+        created = 0
+
+        try:
+            while pending and created < target:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                created += sum(1 for task in done if task.result())
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            raise
+
+        if created < target:
+            raise Exception(
+                f"Worktree pool initialization failed: only {created}/{target} worktrees created"
+            )
+
+        self._initialized = True
+        self._healer_task = asyncio.create_task(self._run_healer(), name="worktree-healer")
+        if self.lease_ttl_seconds is not None or self.max_lease_seconds is not None:
+            self._reaper_task = asyncio.create_task(self._run_reaper(), name="worktree-reaper")
+        if self.autoscaling:
+            self._autoscaler_task = asyncio.create_task(
+                self._run_autoscaler(), name="worktree-autoscaler"
+            )
+            logger.info(f"Worktree pool autoscaling between {self.min_size} and {self.max_size}")
+
+        if pending:
+            # The rest keep building; _create_worktree hands each one off as it lands
+            logger.info(
+                f"Worktree pool serving with {created} worktrees after "
+                f"{time.perf_counter() - started:.1f}s, {len(pending)} still provisioning"
+            )
+        else:
+            logger.info(
+                f"Worktree pool initialized with {len(self.worktrees)} worktrees "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+    def _spawn_provision(self, wt_id: str) -> asyncio.Task:
+        """Start building a worktree in the background under the fan-out limit."""
+        task = asyncio.create_task(
+            self._provision_worktree(wt_id, self._provision_semaphore),
+            name=f"worktree-provision-{wt_id}",
+        )
+        self._provisioning.add(task)
+        self._provisioning_ids.add(wt_id)
+
+        def _done(t: asyncio.Task) -> None:
+            self._provisioning.discard(t)
+            self._provisioning_ids.discard(wt_id)
+
+        task.add_done_callback(_done)
+        return task
+
+    async def wait_until_provisioned(self) -> None:
+        """Wait for any background worktree provisioning to finish."""
+        while self._provisioning:
+            await asyncio.gather(*list(self._provisioning), return_exceptions=True)
+
+    async def _provision_worktree(self, wt_id: str, semaphore: asyncio.Semaphore) -> bool:
+        """
+        Build one worktree under the provisioning fan-out limit.
+
+        A worktree that fails to build is registered in ERROR state so that
+        recovery can recreate it later.
+
+        Returns:
+            True if the worktree was created
+        """
+        async with semaphore:
+            if self._adoptable.pop(wt_id, None) is not None:
+                try:
+                    await self._adopt_worktree(wt_id)
+                    return True
+                except Exception as e:
+                    logger.warning(f"Could not adopt worktree {wt_id}, recreating: {e}")
+
             try:
                 await self._create_worktree(wt_id)
                 logger.info(f"✓ Created worktree: {wt_id}")
+                return True
             except Exception as e:
                 logger.error(f"✗ Failed to create worktree {wt_id}: {e}")
-                raise
+                info = WorktreeInfo(
+                    id=wt_id,
+                    path=self.base_dir / wt_id,
+                    branch=f"worktree-{wt_id}",
+                    status=WorktreeStatus.ERROR,
+                )
+                self._register(info)
+                self._mark_error(info)
+                return False
 
-        self._initialized = True
-        logger.info(f"Worktree pool initialized with {len(self.worktrees)} worktrees")
+    async def _discover_worktrees(self) -> Dict[str, Dict[str, str]]:
+        """
+        Find pool worktrees registered in the main repo by a previous run.
+
+        Only worktrees at base_dir/wt-N on their own worktree-wt-N branch, with
+        the directory still present, are considered adoptable.
+
+        Returns:
+            Mapping of worktree ID to its `git worktree list --porcelain` entry
+        """
+        await self._run_git(["worktree", "prune"], timeout=30)
+        returncode, stdout, stderr = await self._run_git(
+            ["worktree", "list", "--porcelain"], timeout=30
+        )
+        if returncode != 0:
+            logger.warning(f"git worktree list failed, adopting nothing: {stderr.strip()}")
+            return {}
+
+        adoptable: Dict[str, Dict[str, str]] = {}
+        for entry in _parse_worktree_list(stdout):
+            path = Path(entry.get("worktree", ""))
+            if path.parent.resolve() != self.base_dir.resolve() or not path.name.startswith("wt-"):
+                continue
+            if "prunable" in entry or not path.is_dir():
+                continue
+            if entry.get("branch") != f"refs/heads/worktree-{path.name}":
+                continue
+            adoptable[path.name] = entry
+        return adoptable
+
+    async def refresh_base(self) -> Optional[str]:
+        """
+        Fetch the base branch once and pin its SHA as a new epoch.
+
+        Concurrent callers share a single in-flight fetch. If the fetch fails
+        (e.g. offline, no remote), the pool keeps using the best local ref.
+
+        Returns:
+            The pinned base SHA, or None if no base ref can be resolved
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self._fetch_base(), name="worktree-base-refresh"
+            )
+        else:
+            self._refreshes_coalesced += 1
+
+        # Shield so one caller being cancelled does not cancel everyone's fetch
+        return await asyncio.shield(self._refresh_task)
+
+    async def _fetch_base(self) -> Optional[str]:
+        """Run the fetch in the main repo and pin the resulting base SHA."""
+        started = time.perf_counter()
+        self._fetches_total += 1
+
+        try:
+            returncode, _, stderr = await self._run_git(
+                ["fetch", "--quiet", "--no-tags", self.base_remote, self.base_branch],
+                timeout=120,
+            )
+            if returncode != 0:
+                self._fetch_failures += 1
+                logger.warning(
+                    f"git fetch {self.base_remote} {self.base_branch} failed, "
+                    f"using local refs: {stderr.strip()}"
+                )
+        except asyncio.TimeoutError:
+            self._fetch_failures += 1
+            logger.warning(f"git fetch {self.base_remote} {self.base_branch} timed out, using local refs")
+
+        self._last_fetch_seconds = time.perf_counter() - started
+
+        sha = None
+        for ref in (f"{self.base_remote}/{self.base_branch}", self.base_branch):
+            sha = await resolve_ref(f"{ref}^{{commit}}", self.main_repo_path, self._main_objects)
+            if sha:
+                break
+
+        if sha and sha != self._base_sha:
+            self._base_epoch += 1
+            logger.info(f"Worktree base epoch {self._base_epoch}: {self.base_branch} @ {sha[:12]}")
+        self._base_sha = sha or self._base_sha
+        self._base_refreshed_at = time.monotonic()
+        return self._base_sha
+
+    async def _resolve_base_sha(self) -> Optional[str]:
+        """
+        SHA that clean worktrees are reset to: the pinned base of the current epoch.
+
+        Never fetches inline once a base is pinned; a stale base only schedules
+        a background refresh so recyclers are not held up by the network.
+        """
+        if self._base_sha is None:
+            return await self.refresh_base()
+
+        if (
+            self.base_max_age_seconds is not None
+            and self._base_refreshed_at is not None
+            and time.monotonic() - self._base_refreshed_at > self.base_max_age_seconds
+            and (self._refresh_task is None or self._refresh_task.done())
+        ):
+            self._refresh_task = asyncio.create_task(
+                self._fetch_base(), name="worktree-base-refresh"
+            )
+
+        return self._base_sha
+
+    def get_base_status(self) -> dict:
+        """
+        Get the pinned base and fetch statistics.
+
+        Returns:
+            Dictionary with base SHA, epoch, age and fetch counters
+        """
+        return {
+            "branch": self.base_branch,
+            "sha": self._base_sha,
+            "epoch": self._base_epoch,
+            "age_seconds": (
+                time.monotonic() - self._base_refreshed_at
+                if self._base_refreshed_at is not None else None
+            ),
+            "refresh_in_flight": self._refresh_task is not None and not self._refresh_task.done(),
+            "fetches_total": self._fetches_total,
+            "fetch_failures": self._fetch_failures,
+            "refreshes_coalesced": self._refreshes_coalesced,
+            "last_fetch_seconds": self._last_fetch_seconds,
+        }
+
+    async def _adopt_worktree(self, wt_id: str) -> None:
+        """
+        Take over a worktree left by a previous run.
+
+        A worktree that is already clean and at the base commit is adopted
+        as-is; anything else is fast-reset with the normal cleanup first.
+
+        Args:
+            wt_id: ID of the worktree to adopt
+
+        Raises:
+            Exception: If the worktree is unusable or cannot be reset
+        """
+        wt_path = self.base_dir / wt_id
+        info = WorktreeInfo(
+            id=wt_id,
+            path=wt_path,
+            branch=f"worktree-{wt_id}",
+            status=WorktreeStatus.DIRTY,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        # Incremental cleanup leaves a pristine tree untouched and resets only what changed
+        await self._cleanup_worktree(info)
+
+        # Pick up the cone a previous run left, or widen it if sparse mode is now off
+        returncode, stdout, _ = await self._run_git(
+            ["sparse-checkout", "list"], cwd=wt_path, timeout=30
+        )
+        if returncode == 0:
+            info.sparse_dirs = [line for line in stdout.splitlines() if line]
+            if not self.sparse_checkout:
+                await self._set_sparse_cone(info, None)
+        await self._attach_dependency_cache(info)
+        logger.info(f"✓ Adopted worktree: {wt_id}")
+
+        self._register(info)
+        self._hand_off(info)
+
+    async def _run_git(
+        self,
+        args: List[str],
+        cwd: Optional[Path] = None,
+        timeout: float = 30.0,
+        stdin: Optional[bytes] = None,
+    ) -> Tuple[int, str, str]:
+        """
+        Run a git command as an async subprocess.
+
+        Retries briefly when git fails because another worktree operation holds
+        a lock file in the shared repository.
+
+        Args:
+            args: Arguments after `git`
+            cwd: Working directory (defaults to the main repository)
+            timeout: Seconds before the process is killed
+            stdin: Bytes to feed to the process on stdin
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            asyncio.TimeoutError: If git does not finish within timeout
+        """
+        return await run_git(
+            args,
+            cwd=cwd or self.main_repo_path,
+            timeout=timeout,
+            stdin=stdin,
+            lock_retries=self.GIT_LOCK_RETRIES,
+        )
 
     async def _create_worktree(self, wt_id: str) -> None:
         """Create a single worktree."""
@@ -113,30 +839,32 @@ class WorktreePool:
 
         # Delete branch if it exists
         try:
-            subprocess.run(
-                ["git", "branch", "-D", branch_name],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                timeout=30,
-            )
-        except subprocess.TimeoutExpired:
+            await self._run_git(["branch", "-D", branch_name], timeout=30)
+        except asyncio.TimeoutError:
             raise Exception(f"Timeout deleting branch {branch_name}")
 
-        # Create worktree with new branch from main
-        try:
-            result = subprocess.run(
-                ["git", "worktree", "add", str(wt_path), "-b", branch_name, "main"],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                raise Exception(f"Git worktree add failed: {result.stderr}")
+        base = await self._resolve_base_sha() or self.base_branch
+        started = time.perf_counter()
+        method = None
+        if (
+            self.clone_mode is not None
+            and not self.sparse_checkout
+            and await self._probe_clone_method() == "reflink"
+        ):
+            try:
+                method = await self._clone_from_template(wt_path, branch_name, base)
+            except Exception as e:
+                self._clone_fallbacks += 1
+                logger.warning(f"Cloning {wt_id} from template failed, checking out instead: {e}")
+                await self._remove_worktree_directory(wt_id)
+                await self._run_git(["branch", "-D", branch_name], timeout=30)
 
-        except subprocess.TimeoutExpired:
-            raise Exception(f"Timeout creating worktree {wt_id}")
+        if method is None:
+            method = "checkout"
+            await self._checkout_worktree(wt_id, wt_path, branch_name, base)
+        self._provisioned[method] += 1
+        self._provision_seconds[method] += time.perf_counter() - started
+        self.telemetry.observe("provision_duration", time.perf_counter() - started)
 
         # Create WorktreeInfo
         info = WorktreeInfo(
@@ -147,119 +875,812 @@ class WorktreePool:
             created_at=datetime.now(timezone.utc),
         )
 
-        self.worktrees[wt_id] = info
+        if self.sparse_checkout:
+            cone = sparse_cone_dirs([], self.sparse_always_include)
+            await self._set_sparse_cone(info, cone)
+            # Populate the index; only the cone is written to disk
+            returncode, _, stderr = await self._run_git(
+                ["reset", "-q", "--hard", base], cwd=wt_path, timeout=120
+            )
+            if returncode != 0:
+                raise Exception(f"Sparse checkout of {wt_id} failed: {stderr.strip()}")
+
+        await self._attach_dependency_cache(info)
+
+        self._register(info)
+        self._hand_off(info)
+
+    async def _checkout_worktree(self, wt_id: str, wt_path: Path, branch_name: str, base: str) -> None:
+        """Create a worktree with `git worktree add` (writes every file of the checkout)."""
+        try:
+            await self._add_worktree(wt_path, branch_name, base)
+            # In sparse mode nothing is checked out until the cone is set
+            if not self.sparse_checkout:
+                returncode, _, stderr = await self._run_git(
+                    ["reset", "-q", "--hard", base], cwd=wt_path, timeout=600
+                )
+                if returncode != 0:
+                    raise Exception(f"Checkout of {wt_id} failed: {stderr.strip()}")
+
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout creating worktree {wt_id}")
+
+    async def _add_worktree(self, wt_path: Path, branch_name: str, base: str) -> None:
+        """Register a worktree on a new branch with `git worktree add --no-checkout` (writes no files)."""
+        async with self._worktree_admin_lock:
+            returncode, _, stderr = await self._run_git(
+                ["worktree", "add", "--no-checkout", str(wt_path), "-b", branch_name, base],
+                timeout=60,
+            )
+        if returncode != 0:
+            raise Exception(f"Git worktree add failed: {stderr}")
+
+    async def _probe_clone_method(self) -> str:
+        """
+        How clone_mode provisions worktrees on this filesystem: "reflink" or "checkout".
+
+        Probed once. Without reflink support worktrees are checked out; files are
+        never hardlinked, since tracked files are edited in place.
+        """
+        if self._clone_method is None:
+            async with self._template_lock:
+                if self._clone_method is None:
+                    supported = await asyncio.to_thread(_reflink_supported, self.base_dir)
+                    if not supported and self.clone_mode == "reflink":
+                        logger.warning(
+                            f"Filesystem at {self.base_dir} does not support reflinks, "
+                            f"worktrees will be checked out"
+                        )
+                    self._clone_method = "reflink" if supported else "checkout"
+                    logger.info(f"Worktrees will be provisioned by {self._clone_method}")
+        return self._clone_method
+
+    async def _ensure_template(self, base: str) -> None:
+        """
+        Create the template checkout, or move it to a new base.
+
+        Moving only rewrites files that differ between the old and new base.
+        The template is never leased, so it stays pristine.
+        """
+        async with self._template_lock:
+            if self._template_sha == base:
+                return
+
+            if (self.template_path / ".git").exists():
+                returncode, _, stderr = await self._run_git(
+                    ["checkout", "-q", "--detach", "-f", base], cwd=self.template_path, timeout=600
+                )
+            else:
+                if self.template_path.exists():
+                    await asyncio.to_thread(shutil.rmtree, self.template_path, ignore_errors=True)
+                async with self._worktree_admin_lock:
+                    await self._run_git(["worktree", "prune"], timeout=30)
+                    returncode, _, stderr = await self._run_git(
+                        ["worktree", "add", "--no-checkout", "--detach", str(self.template_path), base],
+                        timeout=60,
+                    )
+                if returncode == 0:
+                    returncode, _, stderr = await self._run_git(
+                        ["reset", "-q", "--hard", base], cwd=self.template_path, timeout=600
+                    )
+            if returncode != 0:
+                raise Exception(f"Template checkout failed: {stderr.strip()}")
+
+            self._template_sha = base
+            logger.info(f"✓ Template checkout at {base[:12]}")
+
+    async def _clone_from_template(self, wt_path: Path, branch_name: str, base: str) -> str:
+        """
+        Create a worktree by reflinking the template's files and copying its index.
+
+        The worktree is registered with `git worktree add --no-checkout`, so
+        git writes no files. Reflinked files share blocks with the template
+        until written, so an in-place edit only ever changes this worktree.
+
+        Returns:
+            "reflink"
+        """
+        await self._ensure_template(base)
+
+        await self._add_worktree(wt_path, branch_name, base)
+
+        async with self._template_lock:
+            if self._template_sha != base:
+                raise Exception("Template moved to a newer base while cloning")
+            await asyncio.to_thread(_clone_tree, self.template_path, wt_path)
+            template_git_dir = await self._git_dir(self.template_path)
+            worktree_git_dir = await self._git_dir(wt_path)
+            await asyncio.to_thread(
+                shutil.copy2, template_git_dir / "index", worktree_git_dir / "index"
+            )
+
+        # Stat data in the copied index describes the template's inodes; refresh
+        # it so status checks in the new worktree stay cheap
+        await self._run_git(["update-index", "-q", "--refresh"], cwd=wt_path, timeout=600)
+        return self._clone_method
+
+    async def _git_dir(self, path: Path) -> Path:
+        """Absolute git directory of a worktree, read from its .git file when possible."""
+        try:
+            return worktree_git_dir(path)
+        except ValueError:
+            pass
+        returncode, stdout, stderr = await self._run_git(
+            ["rev-parse", "--absolute-git-dir"], cwd=path, timeout=30
+        )
+        if returncode != 0:
+            raise Exception(f"Cannot find git dir of {path}: {stderr.strip()}")
+        return Path(stdout.strip())
+
+    async def acquire(
+        self,
+        test_name: Optional[str] = None,
+        timeout: float = 300.0,
+        files: Optional[List[str]] = None,
+        affinity: Optional[AffinityHint] = None,
+        priority: LeasePriority = LeasePriority.NORMAL,
+        use_reserved: Optional[bool] = None,
+    ) -> WorktreeInfo:
+        """
+        Acquire an available worktree from the pool.
+
+        Blocks if all worktrees are busy until one becomes available or timeout.
+
+        Args:
+            test_name: Name of test that will use this worktree (for tracking)
+            timeout: Maximum seconds to wait for a worktree (default: 300s / 5 minutes)
+            files: Files the caller will work on. In sparse mode the worktree is
+                   narrowed to their directories; None means a full checkout.
+                   Ignored when the pool is not in sparse mode.
+            affinity: Prefer a worktree whose last lease matched this hint
+            priority: Priority class; higher classes are served first when waiting
+            use_reserved: Whether the caller may take a reserved worktree
+                          (defaults to True for INTERACTIVE callers only)
+
+        Returns:
+            WorktreeInfo for the acquired worktree
+
+        Raises:
+            WorktreeAcquisitionTimeout: If no worktree available within timeout
+            Exception: If pool not initialized
+        """
+        if not self._initialized:
+            raise Exception("Worktree pool not initialized. Call initialize() first.")
+
+        priority = LeasePriority(priority)
+        if use_reserved is None:
+            use_reserved = priority == LeasePriority.INTERACTIVE
+
+        started = time.perf_counter()
+        info: Optional[WorktreeInfo] = None
+        # Only time spent contending for the pool feeds the autoscaler
+        contended = 0.0
+
+        if affinity is not None:
+            self._affinity_requests += 1
+            info = self._take_affine(affinity, test_name, priority, use_reserved)
+            if info is None and self._should_wait_for_affinity(affinity, priority, use_reserved):
+                queued_at = time.perf_counter()
+                info = await self._wait_for_affinity(
+                    affinity, test_name, priority, use_reserved,
+                    min(self.affinity_wait_seconds, timeout),
+                )
+                contended += time.perf_counter() - queued_at
+
+        if info is None:
+            queued_at = time.perf_counter()
+            info = await self._acquire_any(
+                test_name, max(0.0, timeout - (queued_at - started)), priority, use_reserved
+            )
+            contended += time.perf_counter() - queued_at
+
+        if affinity is not None and _affinity_score(affinity, info) > 0:
+            self._affinity_hits += 1
+
+        waited = time.perf_counter() - started
+        self._acquire_waits.append(contended)
+        self.telemetry.incr("acquires")
+        self.telemetry.observe("acquire_wait", waited)
+        self._waits_by_priority[priority].append(contended)
+        info.last_affinity = affinity
+        logger.info(
+            f"Acquired worktree {info.id} for test: {test_name} "
+            f"({priority.name.lower()}, waited {waited:.3f}s)"
+        )
+        return await self._prepare_lease(info, files)
+
+    async def _acquire_any(
+        self,
+        test_name: Optional[str],
+        timeout: float,
+        priority: LeasePriority,
+        use_reserved: bool,
+    ) -> WorktreeInfo:
+        """Lease the most recently freed worktree, or park until one is handed over."""
+        # Fast path: a worktree is free (outside the reserve, unless we may use it)
+        # and nobody who outranks us is queued. Take the most recently freed one
+        # so idle worktrees age out for scale-down.
+        if self._can_take_free(priority, use_reserved):
+            return self._lease(self._free.pop(), test_name)
+
+        # Slow path: park on the waiter queue until release() hands us a worktree
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            test_name=test_name,
+            priority=priority,
+            use_reserved=use_reserved,
+        )
+        self._waiters.append(waiter)
+        logger.debug(
+            f"No worktree available, queued as waiter #{len(self._waiters)} "
+            f"({priority.name.lower()}) for test: {test_name}"
+        )
+
+        self._queued += 1
+        self._record_utilization()
+        try:
+            await asyncio.wait({waiter.future}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        finally:
+            self._queued -= 1
+            self._record_utilization()
+
+        if not waiter.future.done():
+            self._abandon(waiter)
+            self.telemetry.incr("acquire_timeouts")
+
+            busy_worktrees = [
+                f"{wt_id}:{info.current_test}"
+                for wt_id, info in self.worktrees.items()
+                if info.status == WorktreeStatus.BUSY
+            ]
+            raise WorktreeAcquisitionTimeout(
+                f"No worktree available within {timeout}s. "
+                f"Busy worktrees: {busy_worktrees}"
+            )
+
+        return waiter.future.result()
+
+    def _effective_priority(self, waiter: _Waiter, now: float) -> float:
+        """A waiter's priority after aging: one class better per priority_aging_seconds waited."""
+        if self.priority_aging_seconds <= 0:
+            return float(waiter.priority)
+        return waiter.priority - (now - waiter.enqueued_at) / self.priority_aging_seconds
+
+    def _may_take(self, use_reserved: bool, free_count: int) -> bool:
+        """Whether a caller may take one of free_count free worktrees without dipping into the reserve."""
+        return free_count > 0 and (use_reserved or free_count > self.reserved_worktrees)
+
+    def _can_take_free(self, priority: LeasePriority, use_reserved: bool) -> bool:
+        """Whether a new caller may lease straight from the free-list."""
+        if not self._may_take(use_reserved, len(self._free)):
+            return False
+        # Never jump a queued waiter that could have had this tree and ranks at
+        # least as high, counting aging the same way _hand_off() does
+        now = time.perf_counter()
+        return not any(
+            not waiter.future.done()
+            and self._effective_priority(waiter, now) <= priority
+            and self._may_take(waiter.use_reserved, len(self._free))
+            for waiter in (*self._waiters, *self._affinity_waiters)
+        )
+
+    def _take_affine(
+        self,
+        affinity: AffinityHint,
+        test_name: Optional[str],
+        priority: LeasePriority,
+        use_reserved: bool,
+    ) -> Optional[WorktreeInfo]:
+        """Lease the free worktree that best matches a hint, if any matches at all."""
+        if not self._can_take_free(priority, use_reserved):
+            return None
+
+        best_id, best_score = None, 0
+        for wt_id in self._free:
+            score = _affinity_score(affinity, self.worktrees[wt_id])
+            if score > best_score:
+                best_id, best_score = wt_id, score
+
+        if best_id is None:
+            return None
+        self._free.remove(best_id)
+        return self._lease(best_id, test_name)
+
+    def _should_wait_for_affinity(
+        self, affinity: AffinityHint, priority: LeasePriority, use_reserved: bool
+    ) -> bool:
+        """
+        Wait for a matching worktree only when there is no free one to take
+        anyway and a matching worktree is on its way back.
+        """
+        if self.affinity_wait_seconds <= 0 or self._can_take_free(priority, use_reserved):
+            return False
+        return any(
+            info.status in (WorktreeStatus.BUSY, WorktreeStatus.DIRTY)
+            and _affinity_score(affinity, info) > 0
+            for info in self.worktrees.values()
+        )
+
+    async def _wait_for_affinity(
+        self,
+        affinity: AffinityHint,
+        test_name: Optional[str],
+        priority: LeasePriority,
+        use_reserved: bool,
+        timeout: float,
+    ) -> Optional[WorktreeInfo]:
+        """
+        Wait briefly for a matching worktree to be handed off.
+
+        The caller is contending like any queued waiter: if a non-matching
+        worktree frees up and nobody else wants it, it is handed over too.
+
+        Returns:
+            The worktree handed over, or None if none came back within timeout
+        """
+        self._affinity_waits += 1
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            test_name=test_name,
+            affinity=affinity,
+            priority=priority,
+            use_reserved=use_reserved,
+        )
+        self._affinity_waiters.append(waiter)
+
+        try:
+            await asyncio.wait({waiter.future}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if not waiter.future.done():
+            self._abandon(waiter)
+            return None
+
+        info = waiter.future.result()
+        if _affinity_score(affinity, info) > 0:
+            self._affinity_wait_hits += 1
+        return info
+
+    async def _prepare_lease(self, info: WorktreeInfo, files: Optional[List[str]]) -> WorktreeInfo:
+        """
+        Scope a freshly leased worktree to the caller's files and link any
+        dependency cache entries built since it was last attached.
+
+        If the caller is cancelled meanwhile, the worktree goes back for recycling.
+        """
+        try:
+            cone_changed = await self._scope_lease(info, files)
+            if self.dependency_cache is not None and (
+                cone_changed or info.cache_generation != self.dependency_cache.generation
+            ):
+                await self._attach_dependency_cache(info)
+        except asyncio.CancelledError:
+            await self.release(info)
+            raise
+        return info
+
+    async def _scope_lease(self, info: WorktreeInfo, files: Optional[List[str]]) -> bool:
+        """
+        Narrow (or widen) a freshly leased worktree to the caller's files.
+
+        A no-op outside sparse mode or when the cone is unchanged. If the
+        sparse-checkout cannot be applied the caller gets a full checkout
+        rather than an error.
+
+        Returns:
+            True if the worktree's cone changed
+        """
+        if not self.sparse_checkout:
+            return False
+
+        cone = None if files is None else sparse_cone_dirs(files, self.sparse_always_include)
+        if cone == info.sparse_dirs:
+            return False
+
+        try:
+            await self._set_sparse_cone(info, cone)
+            self._sparse_narrowed += 1
+        except Exception as e:
+            self._sparse_failures += 1
+            logger.warning(f"Could not scope {info.id} to {cone}, using a full checkout: {e}")
+            try:
+                await self._set_sparse_cone(info, None)
+            except Exception as e2:
+                logger.error(f"✗ Could not disable sparse-checkout on {info.id}: {e2}")
+        return True
+
+    async def _attach_dependency_cache(self, info: WorktreeInfo) -> None:
+        """Link shared dependency directories into a worktree; failures only cost warmth."""
+        if self.dependency_cache is None:
+            return
+
+        # Read the generation first so a build landing mid-attach is picked up next time
+        info.cache_generation = self.dependency_cache.generation
+        try:
+            outcomes = await self.dependency_cache.attach(
+                info.path, info.sparse_dirs, objects=self.objects_for(info)
+            )
+            logger.debug(f"Worktree {info.id} dependency cache: {outcomes}")
+        except Exception as e:
+            logger.warning(f"Could not attach dependency cache to {info.id}: {e}")
+
+    def objects_for(self, info: WorktreeInfo) -> GitObjectReader:
+        """The worktree's cat-file helper, created on first use and closed with the worktree."""
+        reader = self._object_readers.get(info.id)
+        if reader is None or reader.repo_path != info.path:
+            reader = self._object_readers[info.id] = GitObjectReader(info.path)
+        return reader
+
+    async def _close_object_reader(self, wt_id: str) -> None:
+        reader = self._object_readers.pop(wt_id, None)
+        if reader is not None:
+            await reader.close()
+
+    async def _set_sparse_cone(self, info: WorktreeInfo, cone: Optional[List[str]]) -> None:
+        """
+        Apply a cone-mode sparse-checkout to a worktree.
+
+        Args:
+            info: Worktree to update
+            cone: Directories to check out, or None to disable sparse-checkout
+
+        Raises:
+            Exception: If git sparse-checkout fails
+        """
+        if cone is None:
+            args, stdin = ["sparse-checkout", "disable"], None
+        else:
+            args = ["sparse-checkout", "set", "--cone", "--stdin"]
+            stdin = "".join(f"{path}\n" for path in cone).encode()
+
+        returncode, _, stderr = await self._run_git(args, cwd=info.path, timeout=120, stdin=stdin)
+        if returncode != 0:
+            raise Exception(f"git {' '.join(args[:2])} failed: {stderr.strip()}")
+        info.sparse_dirs = cone
+        logger.debug(f"Worktree {info.id} sparse cone: {cone if cone is not None else 'full'}")
+
+    def _register(self, info: WorktreeInfo) -> None:
+        """Add a worktree to the pool (replacing any entry with the same ID)."""
+        previous = self.worktrees.get(info.id)
+        if previous is not None:
+            self._status_counts[previous.status] -= 1
+        self.worktrees[info.id] = info
+        self._status_counts[info.status] += 1
+        self._record_utilization()
+
+    def _unregister(self, wt_id: str) -> None:
+        """Drop a worktree from the pool."""
+        info = self.worktrees.pop(wt_id, None)
+        if info is not None:
+            self._status_counts[info.status] -= 1
+            self._record_utilization()
+
+    def _set_status(self, info: WorktreeInfo, status: WorktreeStatus) -> None:
+        """Change a worktree's status, keeping the per-status counts in step."""
+        if self.worktrees.get(info.id) is info:
+            self._status_counts[info.status] -= 1
+            self._status_counts[status] += 1
+        info.status = status
+        self._record_utilization()
+
+    def _record_utilization(self) -> None:
+        """Report the current occupancy to the utilization timeline."""
+        self.telemetry.timeline.update(
+            busy=self._status_counts[WorktreeStatus.BUSY],
+            size=len(self.worktrees) - self._status_counts[WorktreeStatus.RETIRING],
+            queued=self._queued,
+        )
+
+    def _lease(self, wt_id: str, test_name: Optional[str]) -> WorktreeInfo:
+        """Mark a worktree taken off the free-list as BUSY for a caller."""
+        info = self.worktrees[wt_id]
+        self._set_status(info, WorktreeStatus.BUSY)
+        info.current_test = test_name
+        info.last_used = datetime.now(timezone.utc)
+        info.idle_since = None
+
+        self._lease_counter += 1
+        info.lease_id = self._lease_counter
+        info.lease_started_at = time.monotonic()
+        info.lease_expires_at = (
+            info.lease_started_at + self.lease_ttl_seconds
+            if self.lease_ttl_seconds is not None else None
+        )
+        info.lease_pgids.clear()
+        return info
+
+    def holds_lease(self, worktree: WorktreeInfo, lease_id: Optional[int] = None) -> bool:
+        """
+        Whether a lease is still held (not released or reaped).
+
+        Holders check this before acting on the worktree after long work:
+        once the lease is lost the worktree may already belong to someone else.
+
+        Args:
+            worktree: Leased worktree
+            lease_id: Lease to check (defaults to the worktree's current lease)
+        """
+        if worktree.status != WorktreeStatus.BUSY:
+            return False
+        return lease_id is None or lease_id == worktree.lease_id
+
+    def renew(self, worktree: WorktreeInfo, lease_id: Optional[int] = None) -> bool:
+        """
+        Heartbeat: push back the expiry of a lease.
+
+        Args:
+            worktree: Leased worktree
+            lease_id: Lease being renewed (defaults to the worktree's current lease)
+
+        Returns:
+            False if the lease is no longer held (released or reaped)
+        """
+        if not self.holds_lease(worktree, lease_id):
+            return False
+        if self.lease_ttl_seconds is not None:
+            worktree.lease_expires_at = time.monotonic() + self.lease_ttl_seconds
+        return True
+
+    @asynccontextmanager
+    async def keep_alive(self, worktree: WorktreeInfo) -> AsyncIterator[int]:
+        """
+        Renew a lease in the background for as long as the block runs.
+
+        The heartbeat stops if the lease is reaped; the block keeps running,
+        so it must check holds_lease() before touching the worktree again.
+
+        Yields:
+            The lease ID, to pass to release() and register_lease_process()
+        """
+        lease_id = worktree.lease_id
+        heartbeat = asyncio.create_task(
+            self._heartbeat(worktree, lease_id), name=f"worktree-heartbeat-{worktree.id}"
+        )
+        try:
+            yield lease_id
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+    async def _heartbeat(self, worktree: WorktreeInfo, lease_id: int) -> None:
+        """Renew a lease every third of its TTL until it is no longer held."""
+        if self.lease_ttl_seconds is None:
+            return
+        while True:
+            await asyncio.sleep(self.lease_ttl_seconds / 3)
+            if not self.renew(worktree, lease_id):
+                logger.warning(
+                    f"Lease {lease_id} on {worktree.id} was lost, stopping heartbeat; "
+                    f"the holder must not use the worktree any more"
+                )
+                return
+
+    def register_lease_process(
+        self, worktree: WorktreeInfo, pgid: int, lease_id: Optional[int] = None
+    ) -> None:
+        """Record a process group started for a lease so the reaper can kill it."""
+        if lease_id is None or lease_id == worktree.lease_id:
+            worktree.lease_pgids.add(pgid)
+
+    def unregister_lease_process(self, worktree: WorktreeInfo, pgid: int) -> None:
+        """Forget a process group that has exited."""
+        worktree.lease_pgids.discard(pgid)
+
+    def _hand_off(self, info: WorktreeInfo) -> None:
+        """
+        Make a FREE worktree available: give it to the highest-ranked live
+        waiter, else put it on the free-list.
+
+        Waiters rank by priority class, improved by aging, then by arrival.
+        A caller briefly waiting for exactly this worktree (affinity) gets it
+        unless a queued waiter outranks it. Waiters that may not use the
+        reserve are skipped while the free-list is at or below it.
+
+        Synchronous on purpose - there is no await between checking the
+        waiter queue and resolving the future, so no lock is needed.
+        """
+        self._set_status(info, WorktreeStatus.FREE)
+        info.current_test = None
+
+        now = time.perf_counter()
+        free_count = len(self._free) + (0 if info.id in self._free else 1)
+
+        best: Optional[_Waiter] = None
+        best_rank: Tuple[float, float] = (float("inf"), float("inf"))
+        for waiter in list(self._waiters):
+            if waiter.future.done():
+                self._waiters.remove(waiter)  # Timed out or cancelled, drop it
+                continue
+            if not self._may_take(waiter.use_reserved, free_count):
+                continue
+            rank = (self._effective_priority(waiter, now), waiter.enqueued_at)
+            if rank < best_rank:
+                best, best_rank = waiter, rank
+
+        for waiter in list(self._affinity_waiters):
+            if waiter.future.done():
+                self._affinity_waiters.remove(waiter)
+            elif (
+                _affinity_score(waiter.affinity, info) > 0
+                and self._may_take(waiter.use_reserved, free_count)
+                and self._effective_priority(waiter, now) <= best_rank[0]
+            ):
+                self._affinity_waiters.remove(waiter)
+                self._give(info, waiter)
+                return
+
+        # Affinity waiters only wait when nothing is free, so a tree nobody
+        # queued wants goes to them rather than sitting on the free-list
+        if best is None:
+            for waiter in self._affinity_waiters:
+                if self._may_take(waiter.use_reserved, free_count):
+                    rank = (self._effective_priority(waiter, now), waiter.enqueued_at)
+                    if rank < best_rank:
+                        best, best_rank = waiter, rank
+
+        if best is not None:
+            queue = self._affinity_waiters if best.affinity is not None else self._waiters
+            queue.remove(best)
+            self._give(info, best)
+            return
+
+        if info.id not in self._free:
+            info.idle_since = time.monotonic()
+            self._free.append(info.id)
+
+    def _give(self, info: WorktreeInfo, waiter: _Waiter) -> None:
+        """Lease a worktree straight to a parked waiter."""
+        if info.id in self._free:
+            self._free.remove(info.id)
+        waiter.future.set_result(self._lease(info.id, waiter.test_name))
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """
+        Withdraw a waiter that timed out or was cancelled.
+
+        If a worktree was handed to it in the meantime, pass that worktree on
+        so it is not leaked.
+        """
+        queue = self._affinity_waiters if waiter.affinity is not None else self._waiters
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            pass
+
+        if waiter.future.done() and not waiter.future.cancelled():
+            if waiter.future.exception() is None:
+                self._hand_off(waiter.future.result())
+        else:
+            waiter.future.cancel()
 
-    async def acquire(
-        self,
-        test_name: Optional[str] = None,
-        timeout: float = 300.0,
-    ) -> WorktreeInfo:
+    async def release(self, worktree: WorktreeInfo, lease_id: Optional[int] = None) -> None:
         """
-        Acquire an available worktree from the pool.
+        Release a worktree back to the pool.
 
-        Blocks if all worktrees are busy until one becomes available or timeout.
+        Returns immediately: the worktree is marked DIRTY and a background
+        recycler cleans it and hands it to the next waiter.
 
         Args:
-            test_name: Name of test that will use this worktree (for tracking)
-            timeout: Maximum seconds to wait for a worktree (default: 300s / 5 minutes)
-
-        Returns:
-            WorktreeInfo for the acquired worktree
-
-        Raises:
-            WorktreeAcquisitionTimeout: If no worktree available within timeout
-            Exception: If pool not initialized
+            worktree: WorktreeInfo to release
+            lease_id: Lease being released; a stale ID (the lease was reaped and
+                      the worktree possibly re-leased) is ignored
         """
-        if not self._initialized:
-            raise Exception("Worktree pool not initialized. Call initialize() first.")
+        if worktree.id not in self.worktrees:
+            logger.warning(f"Attempted to release unknown worktree: {worktree.id}")
+            return
 
-        deadline = time.time() + timeout
-        attempt = 0
-
-        while time.time() < deadline:
-            attempt += 1
-
-            # Acquire lock only for the check-and-acquire operation (not during sleep)
-            async with self._lock:
-                # First, try to recover any ERROR worktrees
-                for wt_id, info in self.worktrees.items():
-                    if info.status == WorktreeStatus.ERROR:
-                        logger.info(f"Attempting to recover ERROR worktree {wt_id}")
-                        try:
-                            await self._try_recover_worktree(wt_id)
-                        except Exception as e:
-                            logger.warning(f"Failed to recover worktree {wt_id}: {e}")
-
-                # Find free worktree
-                for wt_id, info in self.worktrees.items():
-                    if info.status == WorktreeStatus.FREE:
-                        # Mark as busy
-                        info.status = WorktreeStatus.BUSY
-                        info.current_test = test_name
-                        info.last_used = datetime.now(timezone.utc)
-                        logger.info(f"Acquired worktree {wt_id} for test: {test_name}")
-                        return info
-
-            # No free worktrees - release lock and wait before retry
-            remaining = deadline - time.time()
-            if remaining <= 0:
-                break
+        if lease_id is not None and lease_id != worktree.lease_id:
+            self._stale_releases += 1
+            logger.warning(
+                f"Ignoring release of {worktree.id} for stale lease {lease_id} "
+                f"(current lease {worktree.lease_id})"
+            )
+            return
 
-            if attempt % 10 == 0:  # Log every 10 attempts
-                logger.warning(
-                    f"All worktrees busy, waiting... (attempt {attempt}, "
-                    f"{remaining:.1f}s remaining)"
-                )
-            else:
-                logger.debug(f"All worktrees busy, waiting... (attempt {attempt})")
+        if worktree.status != WorktreeStatus.BUSY:
+            logger.warning(
+                f"Released worktree {worktree.id} is {worktree.status.value}, not busy; ignoring"
+            )
+            return
 
-            await asyncio.sleep(min(1.0, remaining))
+        logger.info(f"Releasing worktree {worktree.id} for recycling")
 
-        # Timeout reached
-        busy_worktrees = [
-            f"{wt_id}:{info.current_test}"
-            for wt_id, info in self.worktrees.items()
-            if info.status == WorktreeStatus.BUSY
-        ]
-        raise WorktreeAcquisitionTimeout(
-            f"No worktree available within {timeout}s. "
-            f"Busy worktrees: {busy_worktrees}"
+        self.telemetry.incr("releases")
+        if worktree.lease_started_at is not None:
+            self.telemetry.observe("lease_duration", time.monotonic() - worktree.lease_started_at)
+        self._set_status(worktree, WorktreeStatus.DIRTY)
+        worktree.current_test = None
+        worktree.lease_expires_at = None
+        worktree.lease_pgids.clear()
+
+        task = asyncio.create_task(
+            self._recycle_worktree(worktree, time.perf_counter()),
+            name=f"worktree-recycle-{worktree.id}",
         )
+        self._recycling.add(task)
+        task.add_done_callback(self._recycling.discard)
 
-    async def release(self, worktree: WorktreeInfo) -> None:
+    async def _recycle_worktree(self, worktree: WorktreeInfo, released_at: float) -> None:
         """
-        Release a worktree back to the pool after cleaning it.
+        Clean a DIRTY worktree and make it available again.
+
+        Runs under the recycle semaphore. On failure the worktree goes to ERROR
+        for recovery instead of back to the free-list.
 
         Args:
-            worktree: WorktreeInfo to release
+            worktree: DIRTY worktree to clean
+            released_at: perf_counter() timestamp of the release, for latency metrics
         """
-        async with self._lock:
-            if worktree.id not in self.worktrees:
-                logger.warning(f"Attempted to release unknown worktree: {worktree.id}")
-                return
-
-            logger.info(f"Releasing worktree {worktree.id}")
+        async with self._recycle_semaphore:
+            if self.worktrees.get(worktree.id) is not worktree:
+                return  # Removed from the pool while queued
 
+            cleanup_started = time.perf_counter()
             try:
-                # Clean the worktree
                 await self._cleanup_worktree(worktree)
+            except Exception as e:
+                logger.error(f"Error recycling worktree {worktree.id}: {e}")
+                self._recycle_failures += 1
+                self.telemetry.incr("cleanup_failures")
+                self._mark_error(worktree)
+                return
+            self.telemetry.incr("cleanups")
+            self.telemetry.observe("cleanup_duration", time.perf_counter() - cleanup_started)
 
-                # Mark as free
-                worktree.status = WorktreeStatus.FREE
-                worktree.current_test = None
+            await self._attach_dependency_cache(worktree)
 
-                logger.info(f"✓ Worktree {worktree.id} released and ready")
+            self._recycle_latencies.append(time.perf_counter() - released_at)
+            self._recycled_total += 1
 
-            except Exception as e:
-                logger.error(f"Error releasing worktree {worktree.id}: {e}")
-                worktree.status = WorktreeStatus.ERROR
-                raise
+            # Hand to the oldest waiter, or back onto the free-list
+            self._hand_off(worktree)
+            logger.info(f"✓ Worktree {worktree.id} recycled and ready")
+
+    async def wait_until_recycled(self) -> None:
+        """Wait for all in-flight recycling to finish."""
+        while self._recycling:
+            await asyncio.gather(*list(self._recycling), return_exceptions=True)
+
+    def get_recycle_metrics(self) -> dict:
+        """
+        Get recycler metrics.
+
+        Returns:
+            Dictionary with dirty backlog depth, in-flight cleanups, totals and
+            release-to-ready latency percentiles (seconds, over recent recycles)
+        """
+        latencies = list(self._recycle_latencies)
+        return {
+            "dirty_backlog": self.num_dirty,
+            "in_flight": len(self._recycling),
+            "recycle_concurrency": self.recycle_concurrency,
+            "recycled_total": self._recycled_total,
+            "failed_total": self._recycle_failures,
+            "latency_p50_seconds": percentile(latencies, 50),
+            "latency_p95_seconds": percentile(latencies, 95),
+            "latency_max_seconds": max(latencies) if latencies else None,
+            "cleanup_timings": {
+                bucket: {
+                    "count": len(samples),
+                    "p50_seconds": percentile(samples, 50),
+                    "p95_seconds": percentile(samples, 95),
+                }
+                for bucket, samples in sorted(self._cleanup_timings.items())
+            },
+        }
 
     async def _cleanup_worktree(self, worktree: WorktreeInfo) -> None:
         """
         Clean a worktree: reset to main branch state, remove test artifacts.
 
-        Optimized version using async subprocess and combined git operations.
+        Tries the incremental path first, which only touches what changed, and
+        falls back to a full reset/clean when the tree has moved off its branch,
+        has too many changed paths, or the incremental path fails.
 
         Args:
             worktree: WorktreeInfo to clean
@@ -275,14 +1696,139 @@ class WorktreePool:
             logger.warning(f"Worktree {worktree.id} is not a git repository, skipping git cleanup")
             return
 
+        started = time.perf_counter()
+        try:
+            path_count = await self._incremental_cleanup(worktree)
+        except Exception as e:
+            logger.debug(f"Incremental cleanup failed for {worktree.id}, doing full reset: {e}")
+            path_count = None
+
+        if path_count is None:
+            await self._full_cleanup(worktree)
+            bucket = "full"
+        else:
+            bucket = _path_count_bucket(path_count)
+
+        samples = self._cleanup_timings.setdefault(bucket, deque(maxlen=256))
+        samples.append(time.perf_counter() - started)
+
+    async def _incremental_cleanup(self, worktree: WorktreeInfo) -> Optional[int]:
+        """
+        Restore only the paths that differ from the base commit.
+
+        Uses one `git status --porcelain=v2 --branch -z` to get HEAD, branch and
+        dirty paths. A pristine tree is left untouched. Commits made on the
+        worktree branch are undone with a soft reset plus a restore of just the
+        paths those commits touched.
+
+        Two things are deliberately left alone. Ignored files (dist/,
+        __pycache__/, node_modules/ and the like) are kept, as `git clean -fd`
+        in the full cleanup keeps them: they are rebuilt from tracked files,
+        and wiping them would force a reinstall on every lease when the
+        dependency cache is off. Branches a task created without checking
+        them out are kept too; refs live in the shared repository, do not
+        change this tree's checkout, and are pruned by the next full cleanup.
+
+        Returns:
+            Number of paths restored or removed, or None if a full cleanup is needed
+        """
+        returncode, stdout, stderr = await self._run_git(
+            ["status", "--porcelain=v2", "--branch", "-z"], cwd=worktree.path, timeout=30
+        )
+        if returncode != 0:
+            raise Exception(f"git status failed: {stderr.strip()}")
+
+        head, branch, tracked, untracked = parse_status_v2(stdout)
+        if branch != worktree.branch:
+            return None
+
+        # Shared dependency directories survive cleanup
+        cached = self._cached_targets()
+        untracked = [
+            path for path in untracked
+            if not any(path == t + "/" or path.startswith(t + "/") for t in cached)
+        ]
+
+        base_sha = await self._resolve_base_sha()
+        if base_sha is None:
+            return None
+
+        committed: List[str] = []
+        if head != base_sha:
+            committed = await changed_paths(worktree.path, base_sha)
+
+        to_restore = sorted(set(tracked) | set(committed))
+        path_count = len(to_restore) + len(untracked)
+
+        if path_count > self.incremental_cleanup_max_paths:
+            return None
+
+        if head == base_sha and path_count == 0:
+            logger.debug(f"Worktree {worktree.id} already pristine, skipping cleanup")
+            return 0
+
+        if head != base_sha:
+            returncode, _, stderr = await self._run_git(
+                ["reset", "-q", "--soft", base_sha], cwd=worktree.path, timeout=30
+            )
+            if returncode != 0:
+                raise Exception(f"git reset --soft failed: {stderr.strip()}")
+
+        if to_restore:
+            returncode, _, stderr = await self._run_git(
+                [
+                    "--literal-pathspecs", "restore", f"--source={base_sha}",
+                    "--staged", "--worktree",
+                    "--pathspec-from-file=-", "--pathspec-file-nul",
+                ],
+                cwd=worktree.path,
+                timeout=30,
+                stdin="\0".join(to_restore).encode(),
+            )
+            if returncode != 0:
+                raise Exception(f"git restore failed: {stderr.strip()}")
+
+        if untracked:
+            await asyncio.to_thread(self._remove_untracked, worktree.path, untracked)
+
+        logger.debug(f"Incrementally cleaned {path_count} paths in worktree {worktree.id}")
+        return path_count
+
+    def _cached_targets(self) -> List[str]:
+        """Repo-relative directories owned by the dependency cache."""
+        if self.dependency_cache is None:
+            return []
+        return [spec.target for spec in self.dependency_cache.specs]
+
+    @staticmethod
+    def _remove_untracked(root: Path, paths: List[str]) -> None:
+        """Delete untracked files and directories reported by git status."""
+        for rel in paths:
+            target = root / rel
+            if rel.endswith("/"):
+                shutil.rmtree(target, ignore_errors=True)
+            else:
+                target.unlink(missing_ok=True)
+
+    async def _full_cleanup(self, worktree: WorktreeInfo) -> None:
+        """
+        Full reset of a worktree: checkout its branch, hard reset to the pinned
+        base, clean, and delete stray local branches.
+
+        Args:
+            worktree: WorktreeInfo to clean
+        """
+        base = await self._resolve_base_sha() or f"{self.base_remote}/{self.base_branch}"
+        keep = "".join(f" -e {shlex.quote('/' + target + '/')}" for target in self._cached_targets())
+
         try:
             # Optimized: Combine git operations into a single shell command
             # This reduces subprocess overhead from 5+ calls to 1 call
             cleanup_script = f"""
                 git checkout -f {worktree.branch} && \
-                git reset --hard origin/main && \
-                git clean -fd && \
-                git branch | grep -v "{worktree.branch}" | grep -v "main" | xargs -r git branch -D
+                git reset --hard {base} && \
+                git clean -fd{keep} && \
+                git branch | grep -v "{worktree.branch}" | grep -v "{self.base_branch}" | xargs -r git branch -D
             """
 
             # Use asyncio subprocess for async execution
@@ -315,23 +1861,73 @@ class WorktreePool:
                 raise
             raise Exception(f"Git cleanup failed for {worktree.id}: {str(e)}")
 
-    async def cleanup(self) -> None:
+    async def cleanup(self, keep_on_disk: Optional[bool] = None) -> None:
         """
         Remove all worktrees from the pool.
 
-        Should be called when shutting down to clean up resources.
+        Should be called when shutting down to clean up resources. In
+        persistent mode the worktrees stay on disk for the next run to adopt.
+
+        Args:
+            keep_on_disk: Override the persistent setting for this cleanup
+                          (False frees the disk of a persistent pool)
         """
         logger.info("Cleaning up worktree pool...")
 
-        for wt_id in list(self.worktrees.keys()):
-            try:
-                await self._remove_worktree_directory(wt_id)
-                logger.info(f"✓ Removed worktree: {wt_id}")
-            except Exception as e:
-                logger.error(f"✗ Failed to remove worktree {wt_id}: {e}")
+        # Stop the background loops and any worktrees still being built or recycled
+        for loop_task in (self._healer_task, self._autoscaler_task, self._reaper_task):
+            if loop_task:
+                loop_task.cancel()
+                await asyncio.gather(loop_task, return_exceptions=True)
+        self._healer_task = None
+        self._autoscaler_task = None
+        self._reaper_task = None
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+        for task in list(self._provisioning) + list(self._recycling):
+            task.cancel()
+        await self.wait_until_provisioned()
+        await self.wait_until_recycled()
+        if self._retiring:
+            await asyncio.gather(*list(self._retiring), return_exceptions=True)
+
+        if self.dependency_cache is not None:
+            await self.dependency_cache.close()
+        for wt_id in list(self._object_readers):
+            await self._close_object_reader(wt_id)
+        await self._main_objects.close()
+
+        if keep_on_disk is None:
+            keep_on_disk = self.persistent
+        if keep_on_disk:
+            logger.info(f"Persistent pool: keeping {len(self.worktrees)} worktrees on disk")
+        else:
+            for wt_id in list(self.worktrees.keys()):
+                try:
+                    await self._remove_worktree_directory(wt_id)
+                    logger.info(f"✓ Removed worktree: {wt_id}")
+                except Exception as e:
+                    logger.error(f"✗ Failed to remove worktree {wt_id}: {e}")
+            if self.template_path.exists():
+                await self._run_git(
+                    ["worktree", "remove", "--force", str(self.template_path)], timeout=60
+                )
+                await asyncio.to_thread(shutil.rmtree, self.template_path, ignore_errors=True)
+                self._template_sha = None
 
         self.worktrees.clear()
+        self._status_counts = {status: 0 for status in WorktreeStatus}
+        self._free.clear()
         self._initialized = False
+
+        # Fail any callers still parked in acquire()
+        for queue in (self._waiters, self._affinity_waiters):
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    waiter.future.set_exception(WorktreePoolClosed("Worktree pool was cleaned up"))
+
         logger.info("Worktree pool cleanup complete")
 
     async def _remove_worktree_directory(self, wt_id: str) -> None:
@@ -343,39 +1939,470 @@ class WorktreePool:
         else:
             wt_path = info.path
 
+        await self._close_object_reader(wt_id)
         if not wt_path.exists():
             return
 
         # Remove from git worktree tracking
         try:
-            subprocess.run(
-                ["git", "worktree", "remove", str(wt_path), "--force"],
-                cwd=str(self.main_repo_path),
-                capture_output=True,
-                timeout=30,
-            )
-        except subprocess.TimeoutExpired:
+            async with self._worktree_admin_lock:
+                await self._run_git(["worktree", "remove", str(wt_path), "--force"], timeout=30)
+        except asyncio.TimeoutError:
             logger.warning(f"Timeout removing worktree {wt_id} via git")
 
         # Force delete directory if still exists
         if wt_path.exists():
-            import shutil
-            shutil.rmtree(wt_path, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, wt_path, ignore_errors=True)
 
         # Delete branch
         if info:
             try:
-                subprocess.run(
-                    ["git", "branch", "-D", info.branch],
-                    cwd=str(self.main_repo_path),
-                    capture_output=True,
-                    timeout=30,
-                )
-            except subprocess.TimeoutExpired:
+                await self._run_git(["branch", "-D", info.branch], timeout=30)
+            except asyncio.TimeoutError:
                 logger.warning(f"Timeout deleting branch {info.branch}")
 
-        if wt_id in self.worktrees:
-            del self.worktrees[wt_id]
+        self._unregister(wt_id)
+
+        try:
+            self._free.remove(wt_id)
+        except ValueError:
+            pass
+
+    @property
+    def autoscaling(self) -> bool:
+        """Whether the pool grows and shrinks between min_size and max_size."""
+        return self.max_size > self.min_size
+
+    @property
+    def capacity(self) -> int:
+        """Worktrees in the pool or being built, excluding ones being retired."""
+        live = len(self.worktrees) - self._status_counts[WorktreeStatus.RETIRING]
+        return live + len(self._provisioning_ids - self.worktrees.keys())
+
+    def _next_worktree_id(self) -> str:
+        """Lowest wt-N not in use or being provisioned."""
+        i = 1
+        while f"wt-{i}" in self.worktrees or f"wt-{i}" in self._provisioning_ids:
+            i += 1
+        return f"wt-{i}"
+
+    def _record_scale_decision(self, action: str, before: int, after: int, reason: str) -> None:
+        """Keep a short history of autoscaler decisions for get_pool_status()."""
+        self._scale_decisions.append({
+            "at": datetime.now(timezone.utc).isoformat(),
+            "action": action,
+            "from_size": before,
+            "to_size": after,
+            "reason": reason,
+        })
+        logger.info(f"Worktree autoscaler: {action} {before} -> {after} ({reason})")
+
+    async def _run_autoscaler(self) -> None:
+        """Background loop that periodically evaluates scale-up and scale-down."""
+        while True:
+            await asyncio.sleep(self.autoscale_interval_seconds)
+            try:
+                self._autoscale_once()
+            except Exception as e:
+                logger.error(f"Worktree autoscaler error: {e}", exc_info=True)
+
+    def _autoscale_once(self) -> None:
+        """
+        Make one scaling decision.
+
+        Scale up when callers are waiting and either the p95 of recent acquire
+        waits or the oldest waiter's age exceeds scale_up_wait_seconds. Scale
+        down by retiring FREE worktrees idle longer than scale_down_idle_seconds,
+        oldest first, but only while nobody is waiting.
+        """
+        waiters = self.num_waiters
+        size = self.capacity
+
+        if waiters:
+            oldest_wait = time.perf_counter() - min(
+                w.enqueued_at for w in self._waiters if not w.future.done()
+            )
+            p95_wait = percentile(self._acquire_waits, 95) or 0.0
+            if size < self.max_size and max(oldest_wait, p95_wait) >= self.scale_up_wait_seconds:
+                # Do not add more than the waiters still uncovered by in-flight builds
+                in_flight = len(self._provisioning_ids - self.worktrees.keys())
+                grow = min(waiters - in_flight, self.max_size - size, self.provision_concurrency)
+                if self.growth_budget is not None:
+                    grow = min(grow, self.growth_budget())
+                if grow > 0:
+                    for _ in range(grow):
+                        self._spawn_provision(self._next_worktree_id())
+                    self._record_scale_decision(
+                        "scale_up", size, size + grow,
+                        f"{waiters} waiters, oldest {oldest_wait:.1f}s, p95 wait {p95_wait:.1f}s",
+                    )
+            return
+
+        now = time.monotonic()
+        retire: List[str] = []
+        for wt_id in self._free:  # Oldest-freed first
+            if size - len(retire) <= self.min_size:
+                break
+            info = self.worktrees[wt_id]
+            if info.idle_since is not None and now - info.idle_since >= self.scale_down_idle_seconds:
+                retire.append(wt_id)
+
+        if not retire:
+            return
+
+        for wt_id in retire:
+            self._free.remove(wt_id)
+            self._set_status(self.worktrees[wt_id], WorktreeStatus.RETIRING)
+            task = asyncio.create_task(
+                self._retire_worktree(wt_id), name=f"worktree-retire-{wt_id}"
+            )
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+
+        self._record_scale_decision(
+            "scale_down", size, size - len(retire),
+            f"{', '.join(retire)} idle > {self.scale_down_idle_seconds:.0f}s",
+        )
+
+    async def _retire_worktree(self, wt_id: str) -> None:
+        """Remove a RETIRING worktree's directory and branch in the background."""
+        try:
+            await self._remove_worktree_directory(wt_id)
+            logger.info(f"✓ Retired worktree: {wt_id}")
+        except Exception as e:
+            logger.error(f"✗ Failed to retire worktree {wt_id}: {e}")
+            self._unregister(wt_id)
+
+    def get_autoscaling_status(self) -> dict:
+        """
+        Get autoscaler configuration, current sizing inputs and recent decisions.
+
+        Returns:
+            Dictionary describing the autoscaler state
+        """
+        return {
+            "enabled": self.autoscaling,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "size": self.capacity,
+            "provisioning": len(self._provisioning_ids),
+            "retiring": self._status_counts[WorktreeStatus.RETIRING],
+            "waiters": self.num_waiters,
+            "acquire_wait_p50_seconds": percentile(self._acquire_waits, 50),
+            "acquire_wait_p95_seconds": percentile(self._acquire_waits, 95),
+            "recent_decisions": list(self._scale_decisions),
+        }
+
+    async def _run_reaper(self) -> None:
+        """Background loop that reclaims BUSY worktrees whose lease expired."""
+        logger.info("Worktree lease reaper started")
+
+        while True:
+            await asyncio.sleep(self.reaper_interval_seconds)
+            try:
+                await self.reap_expired_leases()
+            except Exception as e:
+                logger.error(f"Reaper error: {e}", exc_info=True)
+
+    async def reap_expired_leases(self) -> int:
+        """
+        Reclaim every lease that stopped heartbeating or ran past max_lease_seconds.
+
+        Returns:
+            Number of worktrees reclaimed
+        """
+        now = time.monotonic()
+        reaped = 0
+        for info in list(self.worktrees.values()):
+            if info.status != WorktreeStatus.BUSY:
+                continue
+            if info.lease_expires_at is not None and now > info.lease_expires_at:
+                reason = "heartbeat expired"
+            elif (
+                self.max_lease_seconds is not None
+                and info.lease_started_at is not None
+                and now - info.lease_started_at > self.max_lease_seconds
+            ):
+                reason = "max lease duration exceeded"
+            else:
+                continue
+            await self._reap(info, reason)
+            reaped += 1
+        return reaped
+
+    async def _reap(self, info: WorktreeInfo, reason: str) -> None:
+        """
+        Kill a lease's process groups, record the event and recycle the worktree.
+
+        Only groups registered for the lease with register_lease_process() are
+        killed, never other processes that happen to run in the worktree.
+        """
+        lease_id = info.lease_id
+        if not self.holds_lease(info, lease_id):
+            return
+        held = time.monotonic() - info.lease_started_at if info.lease_started_at else None
+
+        killed = []
+        for pgid in sorted(info.lease_pgids):
+            # Never kill groups once the worktree has moved on to another lease
+            if not self.holds_lease(info, lease_id):
+                return
+            if pgid == os.getpgrp():
+                continue
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+                killed.append(pgid)
+            except (ProcessLookupError, PermissionError):
+                pass
+        self._killed_process_groups += len(killed)
+
+        self._reaped_total += 1
+        self.telemetry.incr("reaps")
+        self._reap_events.append({
+            "worktree_id": info.id,
+            "test": info.current_test,
+            "lease_id": lease_id,
+            "reason": reason,
+            "held_seconds": held,
+            "killed_process_groups": killed,
+            "at": datetime.now(timezone.utc).isoformat(),
+        })
+        logger.warning(
+            f"✗ Reaped worktree {info.id} from {info.current_test} ({reason}, "
+            f"held {held or 0:.0f}s, killed {len(killed)} process groups)"
+        )
+        await self.release(info, lease_id)
+
+    def get_lease_metrics(self) -> dict:
+        """
+        Get lease/reaper metrics.
+
+        Returns:
+            Dictionary with lease settings, reaped/killed/stale-release totals
+            and the most recent reap events
+        """
+        return {
+            "ttl_seconds": self.lease_ttl_seconds,
+            "max_lease_seconds": self.max_lease_seconds,
+            "reaper_running": self._reaper_task is not None and not self._reaper_task.done(),
+            "reaped_total": self._reaped_total,
+            "killed_process_groups_total": self._killed_process_groups,
+            "stale_releases_total": self._stale_releases,
+            "recent_reaps": list(self._reap_events),
+        }
+
+    def _mark_error(self, info: WorktreeInfo) -> None:
+        """Put a worktree in ERROR state and wake the healer."""
+        self._set_status(info, WorktreeStatus.ERROR)
+        info.current_test = None
+        self._heal_wakeup.set()
+
+    async def _run_healer(self) -> None:
+        """
+        Background loop that recovers ERROR worktrees.
+
+        Sleeps until a worktree is marked ERROR or the earliest backoff expires,
+        so an idle pool costs nothing.
+        """
+        logger.info("Worktree healer started")
+
+        while True:
+            self._heal_wakeup.clear()
+
+            now = time.monotonic()
+            for info in list(self.worktrees.values()):
+                if info.status == WorktreeStatus.ERROR and info.next_recovery_at <= now:
+                    try:
+                        await self._heal_worktree(info.id)
+                    except WorktreeRecoveryFailed:
+                        pass  # Logged and rescheduled by _heal_worktree
+                    except Exception as e:
+                        logger.error(f"Healer error on worktree {info.id}: {e}", exc_info=True)
+
+            pending = [
+                info.next_recovery_at
+                for info in self.worktrees.values()
+                if info.status == WorktreeStatus.ERROR
+            ]
+            timeout = max(0.0, min(pending) - time.monotonic()) if pending else None
+
+            try:
+                await asyncio.wait_for(self._heal_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _heal_worktree(self, wt_id: str) -> None:
+        """
+        Run one recovery attempt with backoff and quarantine bookkeeping.
+
+        Args:
+            wt_id: ID of the ERROR worktree
+
+        Raises:
+            WorktreeRecoveryFailed: If this attempt failed
+        """
+        async with self._lock:
+            info = self.worktrees.get(wt_id)
+            if not info or info.status != WorktreeStatus.ERROR:
+                return
+
+            attempt_started = time.perf_counter()
+            try:
+                await self._try_recover_worktree(wt_id)
+            except WorktreeRecoveryFailed as e:
+                self._recovery_failures += 1
+                self.telemetry.incr("recovery_failures")
+                self.telemetry.observe("recovery_duration", time.perf_counter() - attempt_started)
+                info.recovery_attempts += 1
+
+                if info.recovery_attempts >= self.max_recovery_attempts:
+                    self._set_status(info, WorktreeStatus.QUARANTINED)
+                    self.telemetry.incr("quarantines")
+                    logger.error(
+                        f"✗ Quarantined worktree {wt_id} after "
+                        f"{info.recovery_attempts} failed recoveries: {e}"
+                    )
+                else:
+                    backoff = min(
+                        self.recovery_backoff_max_seconds,
+                        self.recovery_backoff_seconds * 2 ** (info.recovery_attempts - 1),
+                    )
+                    info.next_recovery_at = time.monotonic() + backoff
+                    logger.warning(
+                        f"Recovery of worktree {wt_id} failed "
+                        f"(attempt {info.recovery_attempts}), retrying in {backoff:.1f}s: {e}"
+                    )
+                raise
+
+            recovered = self.worktrees[wt_id]
+            recovered.recovery_attempts = 0
+            recovered.next_recovery_at = 0.0
+            self._recovered_total += 1
+            self.telemetry.incr("recoveries")
+            self.telemetry.observe("recovery_duration", time.perf_counter() - attempt_started)
+            logger.info(f"✓ Worktree {wt_id} back in service ({self.num_waiters} waiters)")
+
+    def unquarantine(self, wt_id: str) -> bool:
+        """
+        Return a QUARANTINED worktree to the healer with a fresh attempt budget.
+
+        Args:
+            wt_id: ID of the quarantined worktree
+
+        Returns:
+            True if the worktree was quarantined and has been requeued for recovery
+        """
+        info = self.worktrees.get(wt_id)
+        if not info or info.status != WorktreeStatus.QUARANTINED:
+            return False
+
+        info.recovery_attempts = 0
+        info.next_recovery_at = 0.0
+        self._mark_error(info)
+        logger.info(f"Worktree {wt_id} released from quarantine")
+        return True
+
+    def get_healer_metrics(self) -> dict:
+        """
+        Get healer metrics.
+
+        Returns:
+            Dictionary with ERROR/QUARANTINED counts and recovery totals
+        """
+        return {
+            "running": self._healer_task is not None and not self._healer_task.done(),
+            "num_error": self.num_error,
+            "num_quarantined": self.num_quarantined,
+            "recovered_total": self._recovered_total,
+            "failed_total": self._recovery_failures,
+        }
+
+    def get_affinity_status(self) -> dict:
+        """
+        Get affinity-aware leasing statistics.
+
+        Returns:
+            Dictionary with hinted acquires, how many got a matching worktree
+            (directly or after a bounded wait) and the resulting hit rate
+        """
+        return {
+            "wait_seconds": self.affinity_wait_seconds,
+            "requests_total": self._affinity_requests,
+            "hits_total": self._affinity_hits,
+            "hit_rate": (
+                self._affinity_hits / self._affinity_requests if self._affinity_requests else None
+            ),
+            "waits_total": self._affinity_waits,
+            "wait_hits_total": self._affinity_wait_hits,
+            "waiting": sum(1 for w in self._affinity_waiters if not w.future.done()),
+        }
+
+    def get_provisioning_status(self) -> dict:
+        """
+        Get how worktrees were built and how long it took.
+
+        Returns:
+            Dictionary with the clone mode, the method chosen after probing,
+            the template's commit, and per-method counts and mean build times
+        """
+        return {
+            "clone_mode": self.clone_mode,
+            "clone_method": self._clone_method,
+            "template_sha": self._template_sha,
+            "fallbacks_total": self._clone_fallbacks,
+            "methods": {
+                method: {
+                    "built_total": count,
+                    "mean_seconds": (
+                        self._provision_seconds[method] / count if count else None
+                    ),
+                }
+                for method, count in self._provisioned.items()
+            },
+        }
+
+    def get_sparse_status(self) -> dict:
+        """
+        Get sparse-checkout settings and counters.
+
+        Returns:
+            Dictionary with the mode, always-included directories, how many
+            leases changed cone and how many fell back to a full checkout
+        """
+        return {
+            "enabled": self.sparse_checkout,
+            "always_include": self.sparse_always_include,
+            "sparse_worktrees": sum(
+                1 for info in self.worktrees.values() if info.sparse_dirs is not None
+            ),
+            "cone_changes_total": self._sparse_narrowed,
+            "fallbacks_total": self._sparse_failures,
+        }
+
+    def get_priority_status(self) -> dict:
+        """
+        Get priority-class settings and per-class wait statistics.
+
+        Returns:
+            Dictionary with the reserve size, aging period, and for each class
+            the number of waiters and p50/p95 of recent contended waits
+        """
+        classes = {}
+        for priority in LeasePriority:
+            waits = list(self._waits_by_priority[priority])
+            classes[priority.name.lower()] = {
+                "waiting": sum(
+                    1 for w in self._waiters if not w.future.done() and w.priority == priority
+                ),
+                "acquires_sampled": len(waits),
+                "p50_wait_seconds": percentile(waits, 50),
+                "p95_wait_seconds": percentile(waits, 95),
+            }
+        return {
+            "reserved_worktrees": self.reserved_worktrees,
+            "aging_seconds": self.priority_aging_seconds,
+            "classes": classes,
+        }
 
     async def _try_recover_worktree(self, wt_id: str) -> None:
         """
@@ -398,12 +2425,15 @@ class WorktreePool:
         logger.info(f"Attempting recovery of worktree {wt_id}")
 
         try:
+            # A worktree that never got built has nothing to clean
+            if not info.path.exists():
+                raise Exception(f"Worktree path {info.path} does not exist")
+
             # Try to clean the worktree
             await self._cleanup_worktree(info)
 
-            # If cleanup succeeded, mark as FREE
-            info.status = WorktreeStatus.FREE
-            info.current_test = None
+            # If cleanup succeeded, mark as FREE and wake the oldest waiter
+            self._hand_off(info)
             logger.info(f"✓ Recovered worktree {wt_id}")
 
         except Exception as e:
@@ -416,6 +2446,10 @@ class WorktreePool:
                 logger.info(f"✓ Recreated worktree {wt_id}")
 
             except Exception as recreate_error:
+                # Keep the slot registered so the healer can try again later
+                if wt_id not in self.worktrees:
+                    self._register(info)
+                self._set_status(info, WorktreeStatus.ERROR)
                 raise WorktreeRecoveryFailed(
                     f"Failed to recover worktree {wt_id}: {recreate_error}"
                 )
@@ -455,15 +2489,32 @@ class WorktreePool:
                 health["healthy"] = False
                 health["issues"].append("Worktree in ERROR state")
 
-                # Attempt recovery
+                # Attempt recovery now instead of waiting for the healer's backoff
                 try:
-                    await self._try_recover_worktree(wt_id)
+                    await self._heal_worktree(wt_id)
                     health["recovered"] = True
                     health["status"] = self.worktrees[wt_id].status.value
                 except WorktreeRecoveryFailed as e:
                     health["recovered"] = False
                     health["recovery_error"] = str(e)
 
+            if info.status == WorktreeStatus.QUARANTINED:
+                health["healthy"] = False
+                health["issues"].append(
+                    f"Worktree quarantined after {info.recovery_attempts} failed recoveries"
+                )
+
+            # Expired leases are reclaimed by the reaper on its next pass
+            if (
+                info.status == WorktreeStatus.BUSY
+                and info.lease_expires_at is not None
+                and time.monotonic() > info.lease_expires_at
+            ):
+                health["issues"].append(
+                    f"Lease expired {time.monotonic() - info.lease_expires_at:.0f}s ago "
+                    f"(awaiting reaper)"
+                )
+
             # Check for stuck BUSY worktrees (busy for > 30 minutes)
             if info.status == WorktreeStatus.BUSY and info.last_used:
                 busy_duration = (datetime.now(timezone.utc) - info.last_used).total_seconds()
@@ -476,6 +2527,43 @@ class WorktreePool:
 
         return results
 
+    def get_gauges(self) -> Dict[str, int]:
+        """Current pool occupancy, all constant time."""
+        return {
+            "size": self.capacity,
+            "free": self.num_free,
+            "busy": self.num_busy,
+            "dirty": self.num_dirty,
+            "error": self.num_error,
+            "quarantined": self.num_quarantined,
+            "queued": self._queued,
+        }
+
+    def get_telemetry(self) -> dict:
+        """
+        Get counters, latency histograms and the utilization timeline.
+
+        Unlike get_pool_status() this reads only running totals, so it is cheap to
+        poll. Comparing the acquire_wait and lease_duration histograms shows
+        how much of a task's time goes to queueing versus work.
+
+        Returns:
+            Dictionary with "gauges", "counters", "histograms" (count, sum and
+            rolling p50/p95/p99 per metric) and "timeline" (time-weighted
+            busy/size/queued per bucket, oldest first)
+        """
+        self._record_utilization()
+        return {"gauges": self.get_gauges(), **self.telemetry.snapshot()}
+
+    def get_git_helper_status(self) -> dict:
+        """Lookups served by the long-lived cat-file helpers instead of new git processes."""
+        readers = [self._main_objects, *self._object_readers.values()]
+        statuses = [reader.get_status() for reader in readers]
+        return {
+            "readers": len(readers),
+            **{key: sum(status[key] for status in statuses) for key in ("requests", "restarts", "spawns", "alive")},
+        }
+
     def get_status(self) -> Dict[str, dict]:
         """
         Get status of all worktrees in the pool.
@@ -492,21 +2580,71 @@ class WorktreePool:
                 "current_test": info.current_test,
                 "created_at": info.created_at.isoformat() if info.created_at else None,
                 "last_used": info.last_used.isoformat() if info.last_used else None,
+                "sparse_dirs": info.sparse_dirs,
+                "lease_id": info.lease_id if info.status == WorktreeStatus.BUSY else None,
+                "lease_expires_in_seconds": (
+                    info.lease_expires_at - time.monotonic()
+                    if info.status == WorktreeStatus.BUSY and info.lease_expires_at is not None
+                    else None
+                ),
             }
             for wt_id, info in self.worktrees.items()
         }
 
+    def get_pool_status(self) -> dict:
+        """
+        Get pool-wide state, grouped by subsystem.
+
+        Returns:
+            Dictionary with "autoscaling" (sizing bounds, inputs and recent
+            scale decisions), "base" (pinned base commit and fetch statistics),
+            "sparse" (sparse-checkout settings and counters), "affinity"
+            (affinity hit rate), "priorities" (reserve and per-class waits),
+            "provisioning" (clone/checkout counts and timings), "leases"
+            (heartbeat/reaper metrics), "git_helpers" (cat-file helper lookups
+            and restarts) and "dependency_cache" (shared dependency cache
+            statistics, None when disabled)
+        """
+        return {
+            "autoscaling": self.get_autoscaling_status(),
+            "base": self.get_base_status(),
+            "sparse": self.get_sparse_status(),
+            "affinity": self.get_affinity_status(),
+            "priorities": self.get_priority_status(),
+            "provisioning": self.get_provisioning_status(),
+            "leases": self.get_lease_metrics(),
+            "git_helpers": self.get_git_helper_status(),
+            "dependency_cache": (
+                self.dependency_cache.get_status() if self.dependency_cache is not None else None
+            ),
+        }
+
+    @property
+    def num_waiters(self) -> int:
+        """Get number of callers currently waiting in acquire()."""
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
     @property
     def num_free(self) -> int:
         """Get number of free worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.FREE)
+        return self._status_counts[WorktreeStatus.FREE]
 
     @property
     def num_busy(self) -> int:
         """Get number of busy worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.BUSY)
+        return self._status_counts[WorktreeStatus.BUSY]
+
+    @property
+    def num_dirty(self) -> int:
+        """Get number of released worktrees waiting to be recycled."""
+        return self._status_counts[WorktreeStatus.DIRTY]
 
     @property
     def num_error(self) -> int:
         """Get number of errored worktrees."""
-        return sum(1 for info in self.worktrees.values() if info.status == WorktreeStatus.ERROR)
+        return self._status_counts[WorktreeStatus.ERROR]
+
+    @property
+    def num_quarantined(self) -> int:
+        """Get number of quarantined worktrees."""
+        return self._status_counts[WorktreeStatus.QUARANTINED]
@@ -0,0 +1,408 @@
+"""Worktree Pool Registry - One lazily created worktree pool per project repository."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from .dependency_cache import DependencyCache
+from .worktree_pool import WorktreePool
+
+logger = logging.getLogger(__name__)
+
+
+class WorktreePoolCapacityExceeded(Exception):
+    """Raised when a new pool cannot fit under the global worktree or disk cap."""
+    pass
+
+
+@dataclass
+class _PoolEntry:
+    """A registered pool and its bookkeeping."""
+    key: str                                    # Resolved repo path
+    pool: WorktreePool
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    sessions: Set[str] = field(default_factory=set)  # Sessions pinning the pool
+    disk_bytes: Optional[int] = None            # Last measured size of the pool's base_dir
+
+
+def _disk_usage(path: Path, exclude: Iterable[Path] = ()) -> int:
+    """
+    Bytes allocated under path, counting hardlinked files once.
+
+    Worktrees hardlink their dependency directories to a shared cache, so
+    summing file sizes naively would overstate the pool several times over.
+
+    Args:
+        path: Directory to measure
+        exclude: Directories below path to skip entirely
+    """
+    skip = {str(Path(p)) for p in exclude}
+    seen: Set[tuple] = set()
+    total = 0
+    for root, dirs, files in os.walk(path, followlinks=False):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) not in skip]
+        for name in dirs + files:
+            try:
+                st = os.lstat(os.path.join(root, name))
+            except OSError:
+                continue
+            inode = (st.st_dev, st.st_ino)
+            if inode in seen:
+                continue
+            seen.add(inode)
+            total += st.st_blocks * 512
+    return total
+
+
+class WorktreePoolRegistry:
+    """
+    Routes sessions to one WorktreePool per project repository.
+
+    Pools are created on first use and share a global cap on the number of
+    worktrees (enforced on creation and through each pool's growth_budget)
+    and, optionally, on disk usage. Pools that no session is using are
+    evicted least-recently-used first when a new pool needs room, and after
+    idle_evict_seconds without use. The default repository's pool is created
+    at startup and never evicted.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        default_repo_path: str,
+        pool_options: Optional[Dict[str, Any]] = None,
+        max_total_worktrees: int = 16,
+        max_total_disk_bytes: Optional[int] = None,
+        idle_evict_seconds: Optional[float] = 1800.0,
+        monitor_interval_seconds: float = 60.0,
+        dependency_cache: bool = False,
+        dependency_cache_link_mode: str = "hardlink",
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            base_dir: Root directory for all pools; the default repository's
+                      worktrees live directly in it, others under base_dir/repos/
+            default_repo_path: Repository used when a session names no project
+            pool_options: Keyword arguments passed to every WorktreePool
+                          (sizes, sparse mode, leases, priorities, ...)
+            max_total_worktrees: Cap on worktrees across all pools
+            max_total_disk_bytes: Cap on disk used by all pools (None = no cap)
+            idle_evict_seconds: Evict a pool nobody used for this long (None = never)
+            monitor_interval_seconds: How often disk usage and idleness are checked
+            dependency_cache: Give each pool its own shared dependency cache
+            dependency_cache_link_mode: "hardlink" or "reflink"
+        """
+        self.base_dir = Path(base_dir).absolute()
+        self.default_key = self._key(default_repo_path)
+        self.pool_options = dict(pool_options or {})
+        self.max_total_worktrees = max(1, max_total_worktrees)
+        self.max_total_disk_bytes = max_total_disk_bytes
+        self.idle_evict_seconds = idle_evict_seconds
+        self.monitor_interval_seconds = monitor_interval_seconds
+        self.dependency_cache = dependency_cache
+        self.dependency_cache_link_mode = dependency_cache_link_mode
+
+        # Least recently used first
+        self._pools: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._creating: Dict[str, asyncio.Lock] = {}
+        self._starting: Dict[str, WorktreePool] = {}
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._evictions: Deque[dict] = deque(maxlen=50)
+        self._evicted_total = 0
+
+    @staticmethod
+    def _key(repo_path: str) -> str:
+        """Registry key for a repository: its resolved absolute path."""
+        return str(Path(repo_path).expanduser().resolve())
+
+    def _base_dir_for(self, key: str) -> Path:
+        """Where a repository's worktrees live."""
+        if key == self.default_key:
+            return self.base_dir
+        digest = hashlib.sha1(key.encode()).hexdigest()[:8]
+        return self.base_dir / "repos" / f"{Path(key).name}-{digest}"
+
+    def _nested_dirs(self, key: str) -> List[Path]:
+        """Directories inside a pool's base_dir that belong to other pools."""
+        # The default pool's base_dir holds every other pool (and their caches) under repos/
+        return [self.base_dir / "repos"] if key == self.default_key else []
+
+    async def start(self, min_ready: Optional[int] = None) -> WorktreePool:
+        """
+        Create the default repository's pool and start the monitor.
+
+        Args:
+            min_ready: Worktrees to wait for before returning (None = all)
+
+        Returns:
+            The default pool
+        """
+        pool = await self.get_pool(None, min_ready=min_ready)
+        if self._monitor_task is None:
+            self._monitor_task = asyncio.create_task(self._run_monitor())
+        return pool
+
+    async def get_pool(
+        self,
+        repo_path: Optional[str] = None,
+        min_ready: Optional[int] = 1,
+    ) -> WorktreePool:
+        """
+        Get the pool for a repository, creating it on first use.
+
+        Args:
+            repo_path: Repository path (None = the default repository)
+            min_ready: When creating, worktrees to wait for before returning
+
+        Returns:
+            The repository's WorktreePool
+
+        Raises:
+            WorktreePoolCapacityExceeded: If the caps leave no room for a new pool
+        """
+        key = self._key(repo_path) if repo_path else self.default_key
+
+        entry = self._touch(key)
+        if entry is not None:
+            return entry.pool
+
+        lock = self._creating.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._touch(key)
+            if entry is not None:
+                return entry.pool
+
+            if not (Path(key) / ".git").exists():
+                raise ValueError(f"Not a git repository: {key}")
+
+            min_size = self.pool_options.get("min_size") or self.pool_options.get("pool_size", 3)
+            room = await self._make_room(min_size)
+            if room < 1:
+                raise WorktreePoolCapacityExceeded(
+                    f"No room for a pool for {key}: {self.total_worktrees}/"
+                    f"{self.max_total_worktrees} worktrees in use"
+                    + (", disk cap reached" if self._disk_over_cap() else "")
+                )
+
+            pool = self._build_pool(key, min(min_size, room), min_ready)
+            # Count the pool against the cap while it builds
+            self._starting[key] = pool
+            try:
+                await pool.initialize()
+            except BaseException:
+                await pool.cleanup()
+                raise
+            finally:
+                self._starting.pop(key, None)
+            self._pools[key] = _PoolEntry(key=key, pool=pool)
+            logger.info(f"✓ Created worktree pool for {key} in {pool.base_dir}")
+            return pool
+
+    def _touch(self, key: str) -> Optional[_PoolEntry]:
+        """Mark a pool as most recently used."""
+        entry = self._pools.get(key)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            self._pools.move_to_end(key)
+        return entry
+
+    def _build_pool(self, key: str, size: int, min_ready: Optional[int]) -> WorktreePool:
+        """Construct (but do not initialize) a pool for a repository."""
+        options = dict(self.pool_options)
+        options["pool_size"] = size
+        options["min_size"] = size
+        options["max_size"] = max(size, options.get("max_size") or size)
+        options["min_ready"] = min(min_ready, size) if min_ready is not None else None
+        base_dir = self._base_dir_for(key)
+        return WorktreePool(
+            base_dir=str(base_dir),
+            main_repo_path=key,
+            dependency_cache=(
+                DependencyCache(
+                    root=base_dir / ".dependency-cache",
+                    link_mode=self.dependency_cache_link_mode,
+                )
+                if self.dependency_cache else None
+            ),
+            growth_budget=self._growth_budget,
+            **options,
+        )
+
+    def pin(self, repo_path: Optional[str], session_id: str) -> None:
+        """Keep a repository's pool from being evicted while a session runs on it."""
+        key = self._key(repo_path) if repo_path else self.default_key
+        entry = self._touch(key)
+        if entry is not None:
+            entry.sessions.add(session_id)
+
+    def unpin(self, session_id: str) -> None:
+        """Release a session's hold on its pool."""
+        for entry in self._pools.values():
+            if session_id in entry.sessions:
+                entry.sessions.discard(session_id)
+                entry.last_used = time.monotonic()
+
+    @property
+    def total_worktrees(self) -> int:
+        """Worktrees in all pools or being built, excluding ones being retired."""
+        return sum(entry.pool.capacity for entry in self._pools.values()) + sum(
+            max(pool.capacity, pool.pool_size) for pool in self._starting.values()
+        )
+
+    @property
+    def total_disk_bytes(self) -> int:
+        """Last measured disk usage of all pools."""
+        return sum(entry.disk_bytes or 0 for entry in self._pools.values())
+
+    def _disk_over_cap(self) -> bool:
+        return (
+            self.max_total_disk_bytes is not None
+            and self.total_disk_bytes >= self.max_total_disk_bytes
+        )
+
+    def _growth_budget(self) -> int:
+        """How many more worktrees any pool may build right now."""
+        if self._disk_over_cap():
+            return 0
+        return max(0, self.max_total_worktrees - self.total_worktrees)
+
+    def _is_evictable(self, entry: _PoolEntry) -> bool:
+        """A pool can go when it is not the default and nobody is using it."""
+        pool = entry.pool
+        return (
+            entry.key != self.default_key
+            and not entry.sessions
+            and pool.num_busy == 0
+            and pool.num_waiters == 0
+        )
+
+    async def _make_room(self, needed: int) -> int:
+        """
+        Evict idle pools, least recently used first, until `needed` worktrees fit.
+
+        Returns:
+            How many worktrees fit after evicting (may be less than needed)
+        """
+        for key in list(self._pools):
+            if self._growth_budget() >= needed:
+                break
+            entry = self._pools[key]
+            if self._is_evictable(entry):
+                await self.evict(key, "capacity")
+        return self._growth_budget()
+
+    async def evict(self, repo_path: str, reason: str = "manual") -> bool:
+        """
+        Shut down a repository's pool and free its worktrees.
+
+        Returns:
+            True if a pool was evicted
+        """
+        key = self._key(repo_path)
+        entry = self._pools.pop(key, None)
+        if entry is None:
+            return False
+
+        # Disk pressure only eases if the worktrees actually go away
+        await entry.pool.cleanup(keep_on_disk=False if reason == "disk" else None)
+        self._evicted_total += 1
+        self._evictions.append({
+            "at": datetime.now(timezone.utc).isoformat(),
+            "repo_path": key,
+            "reason": reason,
+            "idle_seconds": round(time.monotonic() - entry.last_used, 1),
+        })
+        logger.info(f"✓ Evicted worktree pool for {key} ({reason})")
+        return True
+
+    async def _run_monitor(self) -> None:
+        """Periodically measure disk usage and evict idle pools."""
+        while True:
+            await asyncio.sleep(self.monitor_interval_seconds)
+            try:
+                await self._monitor_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worktree pool registry monitor failed: {e}")
+
+    async def _monitor_once(self) -> None:
+        """Refresh disk measurements, then evict idle pools and any over the disk cap."""
+        for entry in list(self._pools.values()):
+            entry.disk_bytes = await asyncio.to_thread(
+                _disk_usage, entry.pool.base_dir, self._nested_dirs(entry.key)
+            )
+
+        if self.idle_evict_seconds is not None:
+            now = time.monotonic()
+            for key, entry in list(self._pools.items()):
+                if self._is_evictable(entry) and now - entry.last_used >= self.idle_evict_seconds:
+                    await self.evict(key, "idle")
+
+        for key in list(self._pools):
+            if not self._disk_over_cap():
+                break
+            if self._is_evictable(self._pools[key]):
+                await self.evict(key, "disk")
+
+    async def close(self) -> None:
+        """Stop the monitor and clean up every pool."""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            await asyncio.gather(self._monitor_task, return_exceptions=True)
+            self._monitor_task = None
+
+        for key in list(self._pools):
+            entry = self._pools.pop(key)
+            await entry.pool.cleanup()
+
+    def get_pools(self) -> Dict[str, WorktreePool]:
+        """All live pools keyed by repository path, least recently used first."""
+        return {key: entry.pool for key, entry in self._pools.items()}
+
+    def get_default_pool(self) -> Optional[WorktreePool]:
+        """Get the default repository's pool, if it has been created."""
+        entry = self._pools.get(self.default_key)
+        return entry.pool if entry is not None else None
+
+    def get_status(self) -> dict:
+        """
+        Get registry-wide usage and per-pool summaries.
+
+        Returns:
+            Dictionary with the caps, current totals, recent evictions and one
+            summary per pool, least recently used first
+        """
+        now = time.monotonic()
+        return {
+            "max_total_worktrees": self.max_total_worktrees,
+            "max_total_disk_bytes": self.max_total_disk_bytes,
+            "total_worktrees": self.total_worktrees,
+            "total_disk_bytes": self.total_disk_bytes,
+            "evicted_total": self._evicted_total,
+            "recent_evictions": list(self._evictions),
+            "pools": [
+                {
+                    "repo_path": entry.key,
+                    "base_dir": str(entry.pool.base_dir),
+                    "default": entry.key == self.default_key,
+                    "capacity": entry.pool.capacity,
+                    "num_busy": entry.pool.num_busy,
+                    "num_waiters": entry.pool.num_waiters,
+                    "sessions": sorted(entry.sessions),
+                    "disk_bytes": entry.disk_bytes,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for entry in self._pools.values()
+            ],
+        }
@@ -0,0 +1,69 @@
+"""Shared fixtures: throwaway git repositories for service tests."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run git synchronously in a test repository and return stdout."""
+    result = subprocess.run(
+        ["git", *args], cwd=str(cwd), capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch, tmp_path):
+    """Isolate git from the user's config and give commits a fixed identity."""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+    (tmp_path / "gitconfig").write_text("[init]\n\tdefaultBranch = main\n")
+
+
+@pytest.fixture
+def remote_repo(tmp_path) -> Path:
+    """An empty bare repository standing in for origin."""
+    remote = tmp_path / "remote.git"
+    git(tmp_path, "init", "--bare", "-q", str(remote))
+    return remote
+
+
+@pytest.fixture
+def repo(tmp_path, remote_repo) -> Path:
+    """A checkout with one commit on main, origin set to a relative path to remote_repo."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    (path / "README.md").write_text("hello\n")
+    git(path, "add", "README.md")
+    git(path, "commit", "-q", "-m", "initial")
+    git(path, "remote", "add", "origin", "../remote.git")
+    git(path, "push", "-q", "origin", "main")
+    return path
+
+
+@pytest.fixture
+async def make_pool(tmp_path, repo):
+    """Build initialized WorktreePools over `repo`; every pool is cleaned up afterwards."""
+    from app.services.worktree_pool import WorktreePool
+
+    pools = []
+
+    async def factory(**kwargs):
+        kwargs.setdefault("pool_size", 2)
+        kwargs.setdefault("base_dir", str(tmp_path / "worktrees"))
+        kwargs.setdefault("main_repo_path", str(repo))
+        pool = WorktreePool(**kwargs)
+        pools.append(pool)
+        await pool.initialize()
+        return pool
+
+    yield factory
+    for pool in pools:
+        await pool.cleanup()
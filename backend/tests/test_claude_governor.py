@@ -0,0 +1,103 @@
+"""Concurrency and rate limits of ClaudeGovernor."""
+
+import asyncio
+
+import pytest
+
+from app.services.claude_governor import ClaudeGovernor
+
+
+async def test_max_concurrent_is_enforced():
+    governor = ClaudeGovernor(max_concurrent=2)
+    peak = 0
+    release = asyncio.Event()
+
+    async def run():
+        nonlocal peak
+        async with governor.slot("s"):
+            peak = max(peak, governor.active)
+            await release.wait()
+
+    tasks = [asyncio.create_task(run()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    assert governor.active == 2
+    assert governor.queued == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert governor.completed == 5
+
+
+async def test_sessions_are_served_round_robin():
+    governor = ClaudeGovernor(max_concurrent=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def run(session, name):
+        async with governor.slot(session):
+            order.append(name)
+            await gate.wait()
+
+    holder = asyncio.create_task(run("a", "a0"))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(run("a", f"a{i}")) for i in (1, 2)]
+    tasks.append(asyncio.create_task(run("b", "b1")))
+    await asyncio.sleep(0.01)
+
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["a0", "a1", "b1", "a2"]
+
+
+async def test_session_cap_lets_other_sessions_through():
+    governor = ClaudeGovernor(max_concurrent=3, session_max_concurrent=1)
+    gate = asyncio.Event()
+
+    async def run(session):
+        async with governor.slot(session):
+            await gate.wait()
+
+    tasks = [asyncio.create_task(run(s)) for s in ("a", "a", "b")]
+    await asyncio.sleep(0.01)
+
+    status = governor.get_status()
+    assert status["sessions"]["a"] == {"active": 1, "queued": 1}
+    assert status["sessions"]["b"] == {"active": 1, "queued": 0}
+    gate.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_rate_limit_spaces_out_starts():
+    governor = ClaudeGovernor(max_concurrent=4, rate_per_minute=600, burst=1)  # One per 0.1s
+
+    async def run():
+        async with governor.slot() as waited:
+            return waited
+
+    waits = sorted(await asyncio.gather(*(run() for _ in range(3))))
+
+    assert waits[0] == 0.0
+    assert waits[2] >= 0.15
+
+
+async def test_cancelled_waiter_gives_up_its_place():
+    governor = ClaudeGovernor(max_concurrent=1)
+    gate = asyncio.Event()
+
+    async def hold():
+        async with governor.slot():
+            await gate.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert governor.queued == 0
+    gate.set()
+    await holder
+    assert governor.active == 0
@@ -0,0 +1,87 @@
+"""Shared dependency directories linked into pool worktrees."""
+
+from app.services.dependency_cache import CacheSpec, DependencyCache, KEY_MARKER
+from tests.conftest import git
+
+
+def _add_lockfile(repo, content="requests==2.0\n"):
+    (repo / "deps.txt").write_text(content)
+    git(repo, "add", "deps.txt")
+    git(repo, "commit", "-q", "-m", "lockfile")
+    git(repo, "push", "-q", "origin", "main")
+
+
+def _cache(tmp_path, build="mkdir -p deps && cp deps.txt deps/installed"):
+    spec = CacheSpec(name="deps", target="deps", lockfiles=["deps.txt"], build=build)
+    return DependencyCache(tmp_path / "cache", specs=[spec])
+
+
+async def test_entry_is_built_once_and_linked_into_every_worktree(make_pool, tmp_path, repo):
+    _add_lockfile(repo)
+    cache = _cache(tmp_path)
+    pool = await make_pool(pool_size=2, dependency_cache=cache)
+    first, second = pool.worktrees.values()
+
+    await cache.wait_until_built()
+    # The pool may already have linked a worktree provisioned after the build
+    assert (await cache.attach(first.path))["deps"] in ("linked", "hit")
+    assert (await cache.attach(second.path, objects=pool.objects_for(second)))["deps"] in ("linked", "hit")
+    assert await cache.attach(first.path) == {"deps": "hit"}
+
+    installed = [info.path / "deps" / "installed" for info in (first, second)]
+    assert installed[0].read_text() == "requests==2.0\n"
+    assert installed[0].stat().st_ino == installed[1].stat().st_ino
+    assert cache.get_status()["builds_total"] == 1
+    # Targets are excluded, so the worktree still looks clean to git
+    assert git(first.path, "status", "--porcelain") == ""
+    await cache.close()
+
+
+async def test_linked_directory_survives_recycling(make_pool, tmp_path, repo):
+    _add_lockfile(repo)
+    cache = _cache(tmp_path)
+    pool = await make_pool(pool_size=1, dependency_cache=cache)
+    await cache.wait_until_built()
+    info = await pool.acquire("t1")
+    await cache.attach(info.path)
+
+    await pool.release(info)
+    await pool.wait_until_recycled()
+
+    assert (info.path / "deps" / KEY_MARKER).exists()
+    await cache.close()
+
+
+async def test_failed_build_is_not_retried(tmp_path, repo):
+    _add_lockfile(repo)
+    cache = _cache(tmp_path, build="exit 1")
+
+    assert await cache.attach(repo) == {"deps": "building"}
+    await cache.wait_until_built()
+    assert await cache.attach(repo) == {"deps": "failed"}
+    assert cache.get_status()["builds_total"] == 1
+
+
+async def test_worktree_without_lockfile_is_skipped(tmp_path, repo):
+    cache = _cache(tmp_path)
+
+    assert await cache.attach(repo) == {"deps": "no-lockfile"}
+    assert await cache.attach(repo, cone=["src"]) == {"deps": "outside-cone"}
+
+
+async def test_binary_lockfile_is_copied_byte_for_byte(tmp_path, repo):
+    content = b"\xff\xfe lock \x00\x80\n"
+    (repo / "deps.lock").write_bytes(content)
+    git(repo, "add", "deps.lock")
+    git(repo, "commit", "-q", "-m", "binary lockfile")
+    spec = CacheSpec(
+        name="deps", target="deps", lockfiles=["deps.lock"],
+        build="mkdir -p deps && cp deps.lock deps/installed",
+    )
+    cache = DependencyCache(tmp_path / "cache", specs=[spec])
+
+    await cache.attach(repo)
+    await cache.wait_until_built()
+    assert await cache.attach(repo) == {"deps": "linked"}
+
+    assert (repo / "deps" / "installed").read_bytes() == content
@@ -0,0 +1,69 @@
+"""GitObjectReader helpers and the rev-parse fallback."""
+
+import asyncio
+from pathlib import Path
+
+from app.services.git_objects import GitHelperError, GitObjectReader, resolve_ref
+from tests.conftest import git
+
+
+class _BrokenReader(GitObjectReader):
+    """A reader whose helper always fails the way a stalled or dead one does."""
+
+    def __init__(self, repo_path, error):
+        super().__init__(repo_path)
+        self.error = error
+
+    async def info(self, name):
+        raise self.error
+
+
+async def test_reader_resolves_refs_and_reads_objects(repo):
+    reader = GitObjectReader(repo)
+    try:
+        head = git(repo, "rev-parse", "HEAD").strip()
+        results = await asyncio.gather(*(reader.resolve("HEAD") for _ in range(20)))
+        assert results == [head] * 20
+        assert await reader.resolve("no-such-ref") is None
+        info, content = await reader.read("HEAD:README.md")
+        assert info.type == "blob"
+        assert content == b"hello\n"
+        assert reader.get_status()["spawns"] == 2
+    finally:
+        await reader.close()
+
+
+async def test_reader_sees_commits_made_after_start(repo):
+    reader = GitObjectReader(repo)
+    try:
+        before = await reader.resolve("HEAD")
+        git(repo, "commit", "-q", "--allow-empty", "-m", "later")
+        assert await reader.resolve("HEAD") != before
+    finally:
+        await reader.close()
+
+
+async def test_resolve_ref_falls_back_to_rev_parse(repo):
+    head = git(repo, "rev-parse", "HEAD").strip()
+    for error in (asyncio.TimeoutError(), GitHelperError("died")):
+        assert await resolve_ref("HEAD", repo, _BrokenReader(repo, error)) == head
+
+
+async def test_pool_base_survives_a_failing_main_helper(make_pool, repo):
+    pool = await make_pool(pool_size=1)
+    await pool._main_objects.close()
+    pool._main_objects = _BrokenReader(repo, asyncio.TimeoutError())
+
+    sha = await pool.refresh_base()
+
+    assert sha == git(repo, "rev-parse", "origin/main").strip()
+
+
+async def test_git_dir_is_read_without_git(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = next(iter(pool.worktrees.values()))
+
+    git_dir = await pool._git_dir(info.path)
+
+    assert git_dir == Path(git(info.path, "rev-parse", "--absolute-git-dir").strip())
+
@@ -0,0 +1,79 @@
+"""Async git helpers: run_git, status parsing and the two-step commit pipeline."""
+
+import pytest
+
+from app.services.git_ops import (
+    GitError,
+    changed_paths,
+    commit_all,
+    parse_status_v2,
+    run_git,
+    worktree_git_dir,
+)
+from tests.conftest import git
+
+
+async def test_run_git_returns_output(repo):
+    returncode, stdout, _ = await run_git(["rev-parse", "HEAD"], cwd=repo)
+    assert returncode == 0
+    assert stdout.strip() == git(repo, "rev-parse", "HEAD").strip()
+
+
+async def test_commit_all_stages_and_commits_everything(repo):
+    (repo / "README.md").write_text("changed\n")
+    (repo / "new dir").mkdir()
+    (repo / "new dir" / "file with spaces.txt").write_text("x")
+    message = "subject\n\nbody with 'quotes' and $VARS"
+
+    result = await commit_all(repo, message)
+
+    assert result.sha == git(repo, "rev-parse", "HEAD").strip()
+    assert sorted(result.files) == ["README.md", "new dir/file with spaces.txt"]
+    assert git(repo, "log", "-1", "--format=%B").strip() == message
+    assert git(repo, "status", "--porcelain") == ""
+
+
+async def test_commit_all_on_detached_head(repo):
+    git(repo, "checkout", "-q", "--detach")
+    (repo / "README.md").write_text("detached\n")
+
+    result = await commit_all(repo, "detached commit")
+
+    assert result.sha == git(repo, "rev-parse", "HEAD").strip()
+    assert result.files == ["README.md"]
+
+
+async def test_commit_all_returns_none_when_clean(repo):
+    assert await commit_all(repo, "nothing") is None
+
+
+async def test_commit_all_raises_git_error(tmp_path):
+    with pytest.raises(GitError):
+        await commit_all(tmp_path, "not a repo")
+
+
+async def test_parse_status_v2_and_changed_paths(repo):
+    base = git(repo, "rev-parse", "HEAD").strip()
+    (repo / "README.md").write_text("edited\n")
+    git(repo, "mv", "README.md", "MOVED.md")
+    (repo / "untracked").mkdir()
+    (repo / "untracked" / "u.txt").write_text("u")
+    _, stdout, _ = await run_git(["status", "--porcelain=v2", "--branch", "-z"], cwd=repo)
+
+    head, branch, tracked, untracked = parse_status_v2(stdout)
+
+    assert (head, branch) == (base, "main")
+    assert set(tracked) == {"MOVED.md", "README.md"}
+    assert untracked == ["untracked/"]
+
+    git(repo, "commit", "-q", "-m", "move")
+    assert sorted(await changed_paths(repo, base)) == ["MOVED.md", "README.md"]
+
+
+def test_worktree_git_dir_follows_gitdir_file(repo, tmp_path):
+    assert worktree_git_dir(repo) == (repo / ".git").resolve()
+    linked = tmp_path / "linked"
+    git(repo, "worktree", "add", "-q", "-b", "linked", str(linked))
+    assert worktree_git_dir(linked) == (repo / ".git" / "worktrees" / "linked").resolve()
+    with pytest.raises(ValueError):
+        worktree_git_dir(tmp_path)
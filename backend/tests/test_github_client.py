@@ -0,0 +1,150 @@
+"""GitHubClient against an in-process fake GitHub (httpx.MockTransport)."""
+
+import time
+
+import httpx
+import pytest
+
+from app.services.github_client import GitHubAPIError, GitHubClient, GitHubRateLimitError
+
+
+def _client(handler, **kwargs) -> GitHubClient:
+    return GitHubClient("token", base_url="https://github.test", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def _budget(remaining: int, reset_in: float = 3600) -> dict:
+    return {
+        "x-ratelimit-limit": "5000",
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-used": str(5000 - remaining),
+        "x-ratelimit-reset": str(int(time.time() + reset_in)),
+        "x-ratelimit-resource": "core",
+    }
+
+
+async def test_not_modified_returns_cached_body():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers=_budget(4999))
+        return httpx.Response(200, json=[{"number": 7}], headers={"etag": '"v1"', **_budget(4999)})
+
+    client = _client(handler)
+    repo = client.repo("o", "r")
+    try:
+        first = await repo.find_open_pull("feature")
+        second = await repo.find_open_pull("feature")
+    finally:
+        await client.close()
+
+    assert first == second == {"number": 7}
+    assert seen == [None, '"v1"']
+    assert client.not_modified_total == 1
+    assert client.get_status()["rate_limit"]["remaining"] == 4999
+
+
+async def test_exhausted_budget_waits_for_a_near_reset():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.time())
+        headers = _budget(0, reset_in=1) if len(calls) == 1 else _budget(4999)
+        return httpx.Response(200, json={"ok": True}, headers=headers)
+
+    client = _client(handler, max_rate_limit_wait=5)
+    try:
+        await client.request("GET", "/rate")
+        assert client.rate_limit.exhausted
+        assert await client.request("GET", "/rate") == {"ok": True}
+    finally:
+        await client.close()
+
+    assert client.rate_limit_waits == 1
+    assert len(calls) == 2
+
+
+async def test_exhausted_budget_raises_when_reset_is_far():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            403, json={"message": "API rate limit exceeded"}, headers=_budget(0, reset_in=3600)
+        )
+
+    client = _client(handler, max_rate_limit_wait=5)
+    try:
+        with pytest.raises(GitHubRateLimitError):
+            await client.request("GET", "/limited")
+        with pytest.raises(GitHubRateLimitError):
+            await client.request("GET", "/limited")
+    finally:
+        await client.close()
+
+    assert len(calls) == 1  # The second call never left the process
+
+
+async def test_errors_map_to_github_api_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404, json={"message": "Not Found"})
+        if request.url.path == "/html":
+            return httpx.Response(502, text="Bad gateway")
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = _client(handler)
+    try:
+        with pytest.raises(GitHubAPIError) as missing:
+            await client.request("GET", "/missing")
+        with pytest.raises(GitHubAPIError) as html:
+            await client.request("GET", "/html")
+        with pytest.raises(GitHubAPIError) as down:
+            await client.request("GET", "/down")
+    finally:
+        await client.close()
+
+    assert (missing.value.status, missing.value.message) == (404, "Not Found")
+    assert (html.value.status, html.value.message) == (502, "Bad gateway")
+    assert down.value.status == 0
+    assert client.errors_total == 3
+
+
+async def test_wait_for_mergeable_polls_until_computed():
+    answers = iter([None, None, True])
+    state = {"etag": 0, "mergeable": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        mergeable = next(answers)
+        if mergeable == state["mergeable"] and request.headers.get("if-none-match") == f'"{state["etag"]}"':
+            return httpx.Response(304)
+        state["etag"] += 1
+        state["mergeable"] = mergeable
+        return httpx.Response(
+            200, json={"number": 3, "mergeable": mergeable}, headers={"etag": f'"{state["etag"]}"'}
+        )
+
+    client = _client(handler)
+    try:
+        pull = await client.repo("o", "r").wait_for_mergeable(3, timeout=5, interval=0.01)
+    finally:
+        await client.close()
+
+    assert pull["mergeable"] is True
+    assert client.requests_total == 3
+    assert client.not_modified_total == 1
+
+
+async def test_wait_for_mergeable_gives_up_after_timeout():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"number": 3, "mergeable": None})
+
+    client = _client(handler)
+    try:
+        pull = await client.repo("o", "r").wait_for_mergeable(3, timeout=0.05, interval=0.01)
+    finally:
+        await client.close()
+
+    assert pull["mergeable"] is None
+    assert client.requests_total >= 2
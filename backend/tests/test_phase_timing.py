@@ -0,0 +1,50 @@
+"""PhaseTimer spans and their aggregation."""
+
+import time
+
+import pytest
+
+from app.services.phase_timing import PhaseTimer, aggregate_phases
+
+
+def test_phase_records_offsets_durations_and_failures():
+    timer = PhaseTimer()
+    with timer.phase("setup"):
+        time.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        with timer.phase("push"):
+            raise RuntimeError("rejected")
+
+    setup, push = timer.to_list()
+    assert setup["phase"] == "setup" and setup["ok"] is True
+    assert setup["duration_seconds"] >= 0.01
+    assert push["phase"] == "push" and push["ok"] is False
+    assert push["start_seconds"] >= setup["start_seconds"] + setup["duration_seconds"]
+
+
+def test_to_list_returns_copies():
+    timer = PhaseTimer()
+    timer.add("commit", time.perf_counter())
+    timer.to_list()[0]["phase"] = "changed"
+    assert timer.spans[0]["phase"] == "commit"
+
+
+def test_aggregate_orders_phases_and_sums_repeats():
+    timelines = [
+        [{"phase": "claude_run", "duration_seconds": 10.0},
+         {"phase": "push", "duration_seconds": 1.0},
+         {"phase": "push", "duration_seconds": 2.0}],
+        [{"phase": "setup", "duration_seconds": 0.5},
+         {"phase": "claude_run", "duration_seconds": 20.0},
+         {"phase": "custom", "duration_seconds": 1.0}],
+        None,
+    ]
+
+    summary = aggregate_phases(timelines)
+
+    assert list(summary) == ["setup", "claude_run", "push", "custom"]
+    assert summary["push"]["count"] == 1
+    assert summary["push"]["max_seconds"] == 3.0
+    assert summary["claude_run"]["count"] == 2
+    assert summary["claude_run"]["p50_seconds"] == 20.0
+    assert summary["claude_run"]["total_seconds"] == 30.0
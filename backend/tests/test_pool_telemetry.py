@@ -0,0 +1,28 @@
+"""Pool telemetry: percentiles, histograms, timeline and Prometheus output."""
+
+from app.services.pool_telemetry import PoolTelemetry, percentile, render_prometheus
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile(range(100), 95) == 95
+    assert percentile([5.0], 99) == 5.0
+
+
+def test_telemetry_snapshot_and_prometheus_rendering():
+    telemetry = PoolTelemetry()
+    telemetry.incr("acquires", 3)
+    for seconds in (0.01, 0.2, 4.0):
+        telemetry.observe("acquire_wait", seconds)
+
+    snapshot = telemetry.snapshot()
+    text = render_prometheus({"/repo": (telemetry, {"size": 2, "busy": 1})})
+
+    assert snapshot["counters"]["acquires"] == 3
+    histogram = snapshot["histograms"]["acquire_wait"]
+    assert histogram["count"] == 3
+    assert histogram["p50_seconds"] == 0.2
+    assert 'worktree_pool_acquires_total{pool="/repo"} 3' in text
+    assert 'worktree_pool_acquire_wait_seconds_count{pool="/repo"} 3' in text
+    assert 'le="+Inf"' in text
@@ -0,0 +1,79 @@
+"""PushCoordinator against a local bare repository."""
+
+import asyncio
+
+from app.services.push_coordinator import PushCoordinator, git_common_dir
+from tests.conftest import git
+
+
+def _branch(repo, name, content):
+    git(repo, "checkout", "-q", "-b", name, "main")
+    (repo / f"{name}.txt").write_text(content)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", name)
+    git(repo, "checkout", "-q", "main")
+
+
+async def test_batch_pushes_each_ref_and_fails_only_missing_branch(repo, remote_repo):
+    for i in range(3):
+        _branch(repo, f"b{i}", str(i))
+    coordinator = PushCoordinator(git_common_dir(repo), window_seconds=0.05)
+
+    results = await asyncio.gather(*(coordinator.push(b) for b in ["b0", "b1", "b2", "nope"]))
+    by_branch = {r.branch: r for r in results}
+
+    for i in range(3):
+        assert by_branch[f"b{i}"].ok, by_branch[f"b{i}"].error
+        assert by_branch[f"b{i}"].flag == "*"
+        assert by_branch[f"b{i}"].batch_size == 3
+    assert not by_branch["nope"].ok
+    assert "does not exist" in by_branch["nope"].error
+    assert coordinator.pushes_total == 1
+    assert git(remote_repo, "branch", "--list", "b*").split() == ["b0", "b1", "b2"]
+    assert git(repo, "config", "branch.b0.remote").strip() == "origin"
+
+
+async def test_rejected_ref_does_not_fail_the_others(repo, remote_repo):
+    _branch(repo, "ok", "a")
+    _branch(repo, "diverged", "a")
+    git(repo, "push", "-q", "origin", "diverged")
+    git(repo, "checkout", "-q", "diverged")
+    git(repo, "commit", "-q", "--amend", "-m", "rewritten")
+    git(repo, "checkout", "-q", "main")
+    coordinator = PushCoordinator(git_common_dir(repo), window_seconds=0.05)
+
+    ok, diverged = await asyncio.gather(coordinator.push("ok"), coordinator.push("diverged"))
+
+    assert ok.ok
+    assert not diverged.ok
+    assert diverged.flag == "!"
+    assert "rejected" in diverged.error
+
+
+async def test_push_from_linked_worktree_resolves_relative_remote(repo, remote_repo, tmp_path):
+    worktree = tmp_path / "wt"
+    git(repo, "worktree", "add", "-q", "-b", "from-worktree", str(worktree), "main")
+    (worktree / "x.txt").write_text("x")
+    git(worktree, "add", "-A")
+    git(worktree, "commit", "-q", "-m", "x")
+    coordinator = PushCoordinator(git_common_dir(worktree), window_seconds=0.01)
+
+    result = await coordinator.push("from-worktree")
+
+    assert result.ok, result.error
+    assert "from-worktree" in git(remote_repo, "branch", "--list")
+
+
+async def test_failed_push_without_porcelain_is_retried_per_ref(repo, tmp_path):
+    _branch(repo, "a", "a")
+    _branch(repo, "b", "b")
+    coordinator = PushCoordinator(
+        git_common_dir(repo), remote=str(tmp_path / "missing.git"), window_seconds=0.05
+    )
+
+    results = await asyncio.gather(coordinator.push("a"), coordinator.push("b"))
+
+    assert not any(r.ok for r in results)
+    assert all(r.error for r in results)
+    # One batched attempt, then one push per ref
+    assert coordinator.pushes_total == 3
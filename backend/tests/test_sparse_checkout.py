@@ -0,0 +1,50 @@
+"""Sparse-checkout cones for pool worktrees."""
+
+from app.services.task_executor import TaskExecutor
+from app.services.worktree_pool import sparse_cone_dirs
+from tests.conftest import git
+
+
+def test_cone_dirs_collapse_nested_and_skip_unsafe_paths():
+    dirs = sparse_cone_dirs(
+        ["src/a/x.py", "src/a/b/y.py", "docs/", "top.py", "/abs.py", "../up.py", "src/*.py"],
+        always_include=["config/"],
+    )
+    assert dirs == ["config", "docs", "src/a"]
+
+
+async def test_widen_sparse_checkout_adds_task_dirs(repo):
+    for d in ("src/a", "src/b"):
+        (repo / d).mkdir(parents=True)
+        (repo / d / "f.py").write_text(d)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "dirs")
+    git(repo, "sparse-checkout", "set", "--cone", "src/a")
+    assert not (repo / "src/b/f.py").exists()
+
+    await TaskExecutor(repo_path=str(repo))._widen_sparse_checkout(["src/b/f.py"], repo)
+
+    assert (repo / "src/b/f.py").exists()
+    assert git(repo, "sparse-checkout", "list").split() == ["src/a", "src/b"]
+
+
+async def test_widen_is_a_no_op_on_full_checkouts(repo):
+    await TaskExecutor(repo_path=str(repo))._widen_sparse_checkout(["src/x.py"], repo)
+    assert (repo / "README.md").exists()
+
+
+async def test_sparse_pool_scopes_lease_to_task_files(make_pool, repo):
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "m.py").write_text("m")
+    (repo / "other").mkdir()
+    (repo / "other" / "o.py").write_text("o")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "layout")
+    git(repo, "push", "-q", "origin", "main")
+    pool = await make_pool(pool_size=1, sparse_checkout=True)
+
+    info = await pool.acquire("t", files=["pkg/m.py"])
+
+    assert (info.path / "pkg" / "m.py").exists()
+    assert not (info.path / "other" / "o.py").exists()
+    await pool.release(info)
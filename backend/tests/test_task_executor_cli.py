@@ -0,0 +1,91 @@
+"""Running the Claude CLI as an async subprocess in its own process group."""
+
+import asyncio
+import os
+import stat
+
+import pytest
+
+from app.services.claude_governor import ClaudeGovernor
+from app.services.phase_timing import PhaseTimer
+from app.services.task_executor import ExecutionError, TaskExecutor
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Install a `claude` shell script with the given body first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    def install(body: str) -> None:
+        script = bin_dir / "claude"
+        script.write_text("#!/bin/sh\n" + body)
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+    return install
+
+
+def _executor(repo, **kwargs):
+    return TaskExecutor(repo_path=str(repo), github_token="x", governor=ClaudeGovernor(), **kwargs)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def test_output_is_streamed_to_the_log_and_tail(fake_claude, tmp_path, repo):
+    fake_claude('echo "out $PWD"\necho err >&2\n')
+    started, exited = [], []
+    executor = _executor(
+        repo, output_tail_lines=1,
+        on_process_start=started.append, on_process_exit=exited.append,
+    )
+    log = tmp_path / "logs" / "1.1.log"
+    phases = PhaseTimer()
+
+    tail = await executor._execute_with_claude("do it", "b", exec_path=repo, log_path=log, phases=phases)
+
+    assert tail in ("err\n", f"out {repo}\n")
+    assert sorted(log.read_text().splitlines()) == sorted([f"out {repo}", "err"])
+    assert started == exited and len(started) == 1
+    assert not (repo / ".claude_prompt.md").exists()
+    assert {span["phase"] for span in phases.to_list()} >= {"claude_queue", "claude_run"}
+
+
+async def test_timeout_kills_the_whole_process_group(fake_claude, tmp_path, repo):
+    pid_file = tmp_path / "child.pid"
+    fake_claude(f"sleep 30 &\necho $! > {pid_file}\nwait\n")
+    executor = _executor(repo, claude_timeout_seconds=0.5)
+    executor.KILL_GRACE_SECONDS = 0.2
+
+    with pytest.raises(ExecutionError, match="timed out"):
+        await executor._execute_with_claude("do it", "b", exec_path=repo)
+
+    child = int(pid_file.read_text())
+    for _ in range(50):
+        if not _alive(child):
+            break
+        await asyncio.sleep(0.05)
+    assert not _alive(child)
+
+
+async def test_cancelling_the_run_stops_the_cli(fake_claude, tmp_path, repo):
+    pid_file = tmp_path / "cli.pid"
+    fake_claude(f"echo $$ > {pid_file}\nexec sleep 30\n")
+    executor = _executor(repo)
+    executor.KILL_GRACE_SECONDS = 0.2
+
+    run = asyncio.create_task(executor._execute_with_claude("do it", "b", exec_path=repo))
+    while not pid_file.exists() or not pid_file.read_text().strip():
+        await asyncio.sleep(0.02)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    assert not _alive(int(pid_file.read_text()))
+    assert executor.governor.active == 0
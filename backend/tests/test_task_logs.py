@@ -0,0 +1,78 @@
+"""Streaming capture and range reads of Claude CLI output."""
+
+import asyncio
+
+from app.services.task_logs import OutputCapture, is_being_written, read_log_range
+
+
+def _stream(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+async def test_capture_keeps_a_bounded_tail_and_spills_everything(tmp_path):
+    spill = tmp_path / "session" / "1.1.log"
+    capture = OutputCapture(spill, tail_lines=2)
+    assert is_being_written(spill)
+
+    await capture.pump(_stream(b"one\ntw", b"o\nthree\nfour"))
+    capture.close()
+
+    assert capture.tail() == "three\nfour\n"
+    assert capture.tail(1) == "four\n"
+    assert capture.tail(0) == ""
+    assert capture.lines_total == 4
+    assert spill.read_bytes() == b"one\ntwo\nthree\nfour\n"
+    assert not is_being_written(spill)
+
+
+async def test_long_lines_are_split(tmp_path):
+    capture = OutputCapture(tail_lines=10, max_line_bytes=4)
+
+    await capture.pump(_stream(b"abcdefghij\n"))
+
+    assert capture.tail() == "abcd\nefgh\nij\n"
+
+
+async def test_long_partial_lines_are_split_across_chunks(tmp_path):
+    spill = tmp_path / "task.log"
+    capture = OutputCapture(spill, tail_lines=10, max_line_bytes=4)
+
+    await capture.pump(_stream(b"abcdefghij", b"kl\nm"))
+    capture.close()
+
+    assert capture.tail() == "abcd\nefgh\nijkl\nm\n"
+    assert spill.read_bytes() == b"abcd\nefgh\nijkl\nm\n"
+
+
+async def test_split_exactly_at_a_chunk_boundary_adds_no_empty_line():
+    capture = OutputCapture(tail_lines=10, max_line_bytes=4)
+
+    await capture.pump(_stream(b"abcdefgh", b"\nx\n"))
+
+    assert capture.tail() == "abcd\nefgh\nx\n"
+
+
+def test_read_log_range_pages_through_a_log(tmp_path):
+    log = tmp_path / "task.log"
+    log.write_bytes(b"0123456789")
+
+    assert read_log_range(log, 0, 4) == (b"0123", 4, 10)
+    assert read_log_range(log, 4, 100) == (b"456789", 10, 10)
+    assert read_log_range(log, 10, 4) == (b"", 10, 10)
+    assert read_log_range(log, 50, 4) == (b"", 10, 10)
+
+
+def test_read_log_range_negative_offset_counts_from_the_end(tmp_path):
+    log = tmp_path / "task.log"
+    log.write_bytes(b"0123456789")
+
+    assert read_log_range(log, -3, 100) == (b"789", 10, 10)
+    assert read_log_range(log, -50, 2) == (b"01", 2, 10)
+
+
+def test_read_log_range_missing_log(tmp_path):
+    assert read_log_range(tmp_path / "nope.log", 0, 10) == (b"", 0, 0)
@@ -0,0 +1,48 @@
+"""Affinity-aware leasing in WorktreePool."""
+
+import asyncio
+import time
+
+from app.services.worktree_pool import AffinityHint
+
+
+async def test_matching_free_worktree_wins(make_pool):
+    pool = await make_pool(pool_size=2)
+    first = await pool.acquire("t1", affinity=AffinityHint(batch=1))
+    second = await pool.acquire("t2", affinity=AffinityHint(batch=2))
+    await pool.release(first)
+    await pool.release(second)
+    await pool.wait_until_recycled()
+
+    info = await pool.acquire("t3", affinity=AffinityHint(batch=1))
+
+    assert info.id == first.id
+    assert pool.get_affinity_status()["hits_total"] == 1
+
+
+async def test_free_worktree_is_taken_without_waiting_for_a_busy_match(make_pool):
+    pool = await make_pool(pool_size=2, affinity_wait_seconds=5.0)
+    busy = await pool.acquire("t1", affinity=AffinityHint(batch=1))
+
+    started = time.perf_counter()
+    info = await pool.acquire("t2", affinity=AffinityHint(batch=1, worktree_id=busy.id))
+
+    assert info.id != busy.id
+    assert time.perf_counter() - started < 1.0
+    assert pool.get_affinity_status()["waits_total"] == 0
+
+
+async def test_waits_for_match_only_when_nothing_is_free(make_pool):
+    pool = await make_pool(pool_size=2, affinity_wait_seconds=5.0)
+    first = await pool.acquire("t1", affinity=AffinityHint(batch=1))
+    second = await pool.acquire("t2", affinity=AffinityHint(batch=2))
+
+    waiting = asyncio.create_task(pool.acquire("t3", affinity=AffinityHint(batch=2)))
+    await asyncio.sleep(0.05)
+    await pool.release(first)  # Not a match, but nobody else wants it
+    info = await asyncio.wait_for(waiting, timeout=3.0)
+
+    assert info.id == first.id
+    assert pool.get_affinity_status()["waits_total"] == 1
+    await pool.release(info)
+    await pool.release(second)
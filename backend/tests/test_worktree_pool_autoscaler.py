@@ -0,0 +1,105 @@
+"""WorktreePool autoscaling between min_size and max_size."""
+
+import asyncio
+
+# A background autoscaler tick never fires during a test; each test drives _autoscale_once()
+NEVER = 3600.0
+
+
+async def test_scales_up_under_waiter_pressure(make_pool):
+    pool = await make_pool(
+        pool_size=1, min_size=1, max_size=3,
+        scale_up_wait_seconds=0.05, autoscale_interval_seconds=NEVER,
+    )
+    held = await pool.acquire("holder")
+    waiting = [asyncio.create_task(pool.acquire(f"w{i}", timeout=30)) for i in range(2)]
+    await asyncio.sleep(0.1)
+    assert pool.num_waiters == 2
+
+    pool._autoscale_once()
+
+    assert pool.capacity == 3
+    served = await asyncio.wait_for(asyncio.gather(*waiting), timeout=30)
+    assert {info.id for info in served} == {"wt-2", "wt-3"}
+    assert len(pool.worktrees) == 3
+    decision = pool.get_autoscaling_status()["recent_decisions"][-1]
+    assert (decision["action"], decision["from_size"], decision["to_size"]) == ("scale_up", 1, 3)
+
+    for info in (held, *served):
+        await pool.release(info)
+
+
+async def test_fresh_waiters_do_not_trigger_growth(make_pool):
+    pool = await make_pool(
+        pool_size=1, min_size=1, max_size=3,
+        scale_up_wait_seconds=NEVER, autoscale_interval_seconds=NEVER,
+    )
+    held = await pool.acquire("holder")
+    waiting = asyncio.create_task(pool.acquire("waiter", timeout=30))
+    await asyncio.sleep(0)
+
+    pool._autoscale_once()
+
+    assert pool.capacity == 1
+    assert pool.get_autoscaling_status()["recent_decisions"] == []
+    await pool.release(held)
+    await pool.release(await asyncio.wait_for(waiting, timeout=30))
+
+
+async def test_growth_stops_at_max_size(make_pool):
+    pool = await make_pool(
+        pool_size=1, min_size=1, max_size=2,
+        scale_up_wait_seconds=0.05, autoscale_interval_seconds=NEVER,
+    )
+    held = await pool.acquire("holder")
+    waiting = [asyncio.create_task(pool.acquire(f"w{i}", timeout=30)) for i in range(3)]
+    await asyncio.sleep(0.1)
+
+    pool._autoscale_once()
+    pool._autoscale_once()  # Capacity is already at the ceiling
+
+    assert pool.capacity == 2
+    decisions = pool.get_autoscaling_status()["recent_decisions"]
+    assert [(d["action"], d["to_size"]) for d in decisions] == [("scale_up", 2)]
+
+    await pool.release(held)
+    for task in waiting:
+        await pool.release(await asyncio.wait_for(task, timeout=30))
+
+
+async def test_scales_down_idle_worktrees_to_min_size(make_pool):
+    pool = await make_pool(
+        pool_size=3, min_size=1, max_size=3,
+        scale_down_idle_seconds=0.05, autoscale_interval_seconds=NEVER,
+    )
+    paths = {wt_id: info.path for wt_id, info in pool.worktrees.items()}
+    await asyncio.sleep(0.1)
+
+    pool._autoscale_once()
+
+    assert pool.capacity == 1
+    await asyncio.wait_for(asyncio.gather(*pool._retiring), timeout=30)
+    assert len(pool.worktrees) == 1
+    (kept,) = pool.worktrees
+    assert all(not path.exists() for wt_id, path in paths.items() if wt_id != kept)
+    decision = pool.get_autoscaling_status()["recent_decisions"][-1]
+    assert (decision["action"], decision["from_size"], decision["to_size"]) == ("scale_down", 3, 1)
+
+    pool._autoscale_once()  # Already at the floor
+    assert len(pool.worktrees) == 1
+    assert len(pool.get_autoscaling_status()["recent_decisions"]) == 1
+
+
+async def test_busy_worktrees_are_never_retired(make_pool):
+    pool = await make_pool(
+        pool_size=3, min_size=1, max_size=3,
+        scale_down_idle_seconds=0.05, autoscale_interval_seconds=NEVER,
+    )
+    held = await pool.acquire("holder")
+    await asyncio.sleep(0.1)
+
+    pool._autoscale_once()
+    await asyncio.wait_for(asyncio.gather(*pool._retiring), timeout=30)
+
+    assert list(pool.worktrees) == [held.id]
+    await pool.release(held)
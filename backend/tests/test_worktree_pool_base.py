@@ -0,0 +1,50 @@
+"""Pinned base commit and coalesced fetches in WorktreePool."""
+
+import asyncio
+import shutil
+
+from tests.conftest import git
+
+
+async def test_concurrent_refreshes_share_one_fetch(make_pool):
+    pool = await make_pool(pool_size=1)
+    fetches = pool.get_base_status()["fetches_total"]
+
+    shas = await asyncio.gather(*(pool.refresh_base() for _ in range(5)))
+
+    status = pool.get_base_status()
+    assert len(set(shas)) == 1
+    assert status["fetches_total"] == fetches + 1
+    assert status["refreshes_coalesced"] == 4
+
+
+async def test_new_remote_commit_starts_a_new_epoch(make_pool, tmp_path, repo):
+    pool = await make_pool(pool_size=1)
+    before = pool.get_base_status()
+
+    other = tmp_path / "other"
+    git(tmp_path, "clone", "-q", str(tmp_path / "remote.git"), str(other))
+    (other / "NEW.md").write_text("new\n")
+    git(other, "add", "NEW.md")
+    git(other, "commit", "-q", "-m", "upstream")
+    git(other, "push", "-q", "origin", "main")
+
+    sha = await pool.refresh_base()
+
+    assert sha == git(other, "rev-parse", "HEAD").strip()
+    assert pool.get_base_status()["epoch"] == before["epoch"] + 1
+    info = await pool.acquire("t1")
+    await pool.release(info)
+    await pool.wait_until_recycled()
+    assert (info.path / "NEW.md").exists()
+
+
+async def test_failed_fetch_keeps_the_local_base(make_pool, tmp_path):
+    pool = await make_pool(pool_size=1)
+    sha = pool.get_base_status()["sha"]
+    shutil.rmtree(tmp_path / "remote.git")
+
+    assert await pool.refresh_base() == sha
+    status = pool.get_base_status()
+    assert status["fetch_failures"] == 1
+    assert status["epoch"] == 1
@@ -0,0 +1,76 @@
+"""Incremental cleanup of recycled worktrees."""
+
+from tests.conftest import git
+
+
+async def test_pristine_worktree_is_left_untouched(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = next(iter(pool.worktrees.values()))
+    inode = (info.path / "README.md").stat().st_ino
+
+    assert await pool._incremental_cleanup(info) == 0
+    assert (info.path / "README.md").stat().st_ino == inode
+
+
+async def test_only_changed_paths_are_restored(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    (info.path / "keep.txt").write_text("tracked\n")
+    git(info.path, "add", "keep.txt")
+    git(info.path, "commit", "-q", "-m", "work")
+    (info.path / "README.md").write_text("edited\n")
+    (info.path / "build").mkdir()
+    (info.path / "build" / "out.o").write_text("obj\n")
+    base = pool.get_base_status()["sha"]
+
+    # keep.txt (committed), README.md (modified), build/ (untracked)
+    assert await pool._incremental_cleanup(info) == 3
+
+    assert git(info.path, "rev-parse", "HEAD").strip() == base
+    assert git(info.path, "status", "--porcelain") == ""
+    assert not (info.path / "keep.txt").exists()
+    assert not (info.path / "build").exists()
+
+
+async def test_worktree_off_its_branch_needs_a_full_cleanup(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    git(info.path, "checkout", "-q", "-b", "elsewhere")
+
+    assert await pool._incremental_cleanup(info) is None
+
+    await pool.release(info)
+    await pool.wait_until_recycled()
+    assert git(info.path, "branch", "--show-current").strip() == info.branch
+    assert "full" in pool.get_recycle_metrics()["cleanup_timings"]
+
+
+async def test_too_many_paths_fall_back_to_full_cleanup(make_pool):
+    pool = await make_pool(pool_size=1, incremental_cleanup_max_paths=1)
+    info = await pool.acquire("t1")
+    for name in ("a.txt", "b.txt"):
+        (info.path / name).write_text("x\n")
+
+    assert await pool._incremental_cleanup(info) is None
+
+
+async def test_ignored_output_and_task_branches_are_kept(make_pool, repo):
+    with open(repo / ".git" / "info" / "exclude", "a") as exclude:
+        exclude.write("dist/\n")
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    (info.path / "dist").mkdir()
+    (info.path / "dist" / "app.whl").write_text("wheel\n")
+    (info.path / "README.md").write_text("edited\n")
+    git(info.path, "branch", "task-scratch")
+
+    assert await pool._incremental_cleanup(info) == 1
+
+    assert git(info.path, "status", "--porcelain") == ""
+    assert (info.path / "dist" / "app.whl").exists()
+    assert git(info.path, "branch", "--list", "task-scratch").strip() == "task-scratch"
+
+    # The full cleanup keeps ignored files as well, but prunes stray branches
+    await pool._full_cleanup(info)
+    assert (info.path / "dist" / "app.whl").exists()
+    assert git(info.path, "branch", "--list", "task-scratch") == ""
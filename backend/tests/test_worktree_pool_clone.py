@@ -0,0 +1,78 @@
+"""Provisioning worktrees from a template checkout."""
+
+import subprocess
+
+import pytest
+
+from app.services import worktree_pool
+from app.services.worktree_pool import WorktreePool
+from tests.conftest import git
+
+
+@pytest.fixture
+def reflinks(monkeypatch, tmp_path):
+    """Pretend the filesystem has reflinks, using plain copies where it has none."""
+    if not worktree_pool._reflink_supported(tmp_path):
+        def copy_tree(src, dst):
+            for entry in src.iterdir():
+                if entry.name != ".git":
+                    subprocess.run(["cp", "-a", str(entry), str(dst)], check=True)
+
+        monkeypatch.setattr(worktree_pool, "_reflink_supported", lambda directory: True)
+        monkeypatch.setattr(worktree_pool, "_clone_tree", copy_tree)
+
+
+def _write_in_place(path, text):
+    with open(path, "r+") as f:
+        f.truncate(0)
+        f.write(text)
+
+
+async def test_in_place_edit_stays_in_its_cloned_worktree(reflinks, make_pool):
+    pool = await make_pool(pool_size=2, clone_mode="reflink")
+    first, second = pool.worktrees.values()
+    assert pool._provisioned["reflink"] == 2
+    assert git(first.path, "branch", "--show-current").strip() == first.branch
+
+    _write_in_place(first.path / "README.md", "changed\n")
+
+    assert (second.path / "README.md").read_text() == "hello\n"
+    assert (pool.template_path / "README.md").read_text() == "hello\n"
+    assert git(second.path, "status", "--porcelain") == ""
+
+
+async def test_auto_checks_out_without_reflinks(make_pool, monkeypatch):
+    monkeypatch.setattr(worktree_pool, "_reflink_supported", lambda directory: False)
+    pool = await make_pool(pool_size=2, clone_mode="auto")
+    first, second = pool.worktrees.values()
+
+    _write_in_place(first.path / "README.md", "changed\n")
+
+    assert (second.path / "README.md").read_text() == "hello\n"
+    assert pool._provisioned["checkout"] == 2
+    assert pool.get_provisioning_status()["fallbacks_total"] == 0
+    assert not pool.template_path.exists()
+
+
+async def test_recycling_a_cloned_worktree_leaves_the_template_pristine(reflinks, make_pool):
+    pool = await make_pool(pool_size=1, clone_mode="auto")
+    info = await pool.acquire("t1")
+    _write_in_place(info.path / "README.md", "changed\n")
+
+    await pool.release(info)
+    await pool.wait_until_recycled()
+
+    assert (pool.template_path / "README.md").read_text() == "hello\n"
+    assert (info.path / "README.md").read_text() == "hello\n"
+
+
+def test_hardlink_clone_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        WorktreePool(base_dir=str(tmp_path), clone_mode="hardlink")
+
+
+async def test_sparse_pools_check_out_instead_of_cloning(reflinks, make_pool):
+    pool = await make_pool(pool_size=1, clone_mode="auto", sparse_checkout=True)
+
+    assert pool._provisioned["checkout"] == 1
+    assert not pool.template_path.exists()
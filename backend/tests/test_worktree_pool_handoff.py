@@ -0,0 +1,54 @@
+"""Waiter queue and direct handoff in WorktreePool."""
+
+import asyncio
+
+import pytest
+
+from app.services.worktree_pool import WorktreeAcquisitionTimeout
+
+
+async def test_waiters_are_served_in_arrival_order(make_pool):
+    pool = await make_pool(pool_size=1)
+    held = await pool.acquire("holder")
+
+    order = []
+
+    async def wait(name):
+        info = await pool.acquire(name, timeout=10)
+        order.append(name)
+        await pool.release(info)
+
+    waiters = []
+    for name in ("a", "b", "c"):
+        waiters.append(asyncio.create_task(wait(name)))
+        await asyncio.sleep(0)  # Queue them in a known order
+    assert pool.num_waiters == 3
+
+    await pool.release(held)
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=10)
+
+    assert order == ["a", "b", "c"]
+
+
+async def test_released_worktree_goes_straight_to_a_waiter(make_pool):
+    pool = await make_pool(pool_size=1)
+    held = await pool.acquire("holder")
+    waiting = asyncio.create_task(pool.acquire("next", timeout=10))
+    await asyncio.sleep(0)
+
+    await pool.release(held)
+    info = await asyncio.wait_for(waiting, timeout=10)
+
+    assert info.id == held.id
+    assert info.current_test == "next"
+    assert pool.num_free == 0
+
+
+async def test_acquire_times_out_and_leaves_no_waiter(make_pool):
+    pool = await make_pool(pool_size=1)
+    await pool.acquire("holder")
+
+    with pytest.raises(WorktreeAcquisitionTimeout):
+        await pool.acquire("late", timeout=0.1)
+
+    assert pool.num_waiters == 0
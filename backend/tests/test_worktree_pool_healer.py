@@ -0,0 +1,52 @@
+"""Recovery and quarantine of ERROR worktrees in WorktreePool."""
+
+import asyncio
+
+from app.services.worktree_pool import WorktreeRecoveryFailed, WorktreeStatus
+
+
+async def wait_until(condition, timeout=10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def test_healer_recreates_a_broken_worktree(make_pool, monkeypatch):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    original_cleanup = pool._cleanup_worktree
+
+    async def fail_once(worktree):
+        monkeypatch.setattr(pool, "_cleanup_worktree", original_cleanup)
+        raise RuntimeError("corrupt index")
+
+    monkeypatch.setattr(pool, "_cleanup_worktree", fail_once)
+    await pool.release(info)
+
+    await wait_until(lambda: pool.num_free == 1)
+    assert pool.get_healer_metrics()["recovered_total"] == 1
+    again = await pool.acquire("t2", timeout=1)
+    assert (again.path / "README.md").read_text() == "hello\n"
+
+
+async def test_worktree_is_quarantined_after_max_attempts(make_pool, monkeypatch):
+    pool = await make_pool(pool_size=1, max_recovery_attempts=2, recovery_backoff_seconds=0.01)
+
+    async def broken(wt_id):
+        raise WorktreeRecoveryFailed(f"cannot recover {wt_id}")
+
+    monkeypatch.setattr(pool, "_try_recover_worktree", broken)
+    info = await pool.acquire("t1")
+    pool._mark_error(info)
+
+    await wait_until(lambda: info.status == WorktreeStatus.QUARANTINED)
+    assert info.recovery_attempts == 2
+    metrics = pool.get_healer_metrics()
+    assert metrics["num_quarantined"] == 1
+    assert metrics["failed_total"] == 2
+
+    monkeypatch.undo()
+    assert pool.unquarantine(info.id)
+    await wait_until(lambda: info.status == WorktreeStatus.FREE)
+    assert pool.unquarantine(info.id) is False
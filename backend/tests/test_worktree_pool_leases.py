@@ -0,0 +1,111 @@
+"""Lease heartbeats and the expired-lease reaper in WorktreePool."""
+
+import asyncio
+import subprocess
+
+from app.services.claude_governor import ClaudeGovernor
+from app.services.task_executor import TaskExecutor
+from app.services.worktree_pool import WorktreeStatus
+from tests.conftest import git
+
+
+async def test_expired_lease_is_reaped_and_recycled(make_pool):
+    pool = await make_pool(pool_size=1, lease_ttl_seconds=0.05, reaper_interval_seconds=3600)
+    info = await pool.acquire("stuck")
+    lease_id = info.lease_id
+    await asyncio.sleep(0.1)
+
+    assert await pool.reap_expired_leases() == 1
+    await pool.wait_until_recycled()
+
+    assert info.status == WorktreeStatus.FREE
+    assert pool.renew(info, lease_id) is False
+    metrics = pool.get_lease_metrics()
+    assert metrics["reaped_total"] == 1
+    assert metrics["recent_reaps"][0]["reason"] == "heartbeat expired"
+
+    # The original holder releasing late must not touch the next lease
+    again = await pool.acquire("next")
+    await pool.release(again, lease_id)
+    assert again.status == WorktreeStatus.BUSY
+    assert pool.get_lease_metrics()["stale_releases_total"] == 1
+
+
+async def test_keep_alive_renews_the_lease(make_pool):
+    pool = await make_pool(pool_size=1, lease_ttl_seconds=0.15, reaper_interval_seconds=3600)
+    info = await pool.acquire("long")
+
+    async with pool.keep_alive(info) as lease_id:
+        await asyncio.sleep(0.4)
+        assert await pool.reap_expired_leases() == 0
+
+    assert lease_id == info.lease_id
+    await pool.release(info, lease_id)
+
+
+async def test_max_lease_duration_kills_registered_processes(make_pool):
+    pool = await make_pool(
+        pool_size=1, lease_ttl_seconds=None, max_lease_seconds=0.05, reaper_interval_seconds=3600
+    )
+    info = await pool.acquire("runaway")
+    proc = subprocess.Popen(["sleep", "30"], start_new_session=True)
+    try:
+        pool.register_lease_process(info, proc.pid)
+        await asyncio.sleep(0.1)
+
+        assert await pool.reap_expired_leases() == 1
+        assert proc.wait(timeout=5) != 0
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+    await pool.wait_until_recycled()
+    assert pool.get_lease_metrics()["recent_reaps"][0]["reason"] == "max lease duration exceeded"
+
+
+async def test_reaping_leaves_unregistered_processes_alone(make_pool):
+    pool = await make_pool(pool_size=1, lease_ttl_seconds=0.05, reaper_interval_seconds=3600)
+    info = await pool.acquire("stuck")
+    # e.g. a developer's shell or editor sitting in the worktree
+    bystander = subprocess.Popen(["sleep", "30"], cwd=str(info.path), start_new_session=True)
+    try:
+        await asyncio.sleep(0.1)
+
+        assert await pool.reap_expired_leases() == 1
+        assert bystander.poll() is None
+        assert pool.get_lease_metrics()["recent_reaps"][0]["killed_process_groups"] == []
+    finally:
+        bystander.kill()
+        bystander.wait()
+    await pool.wait_until_recycled()
+
+
+async def test_executor_does_not_commit_after_its_lease_is_reaped(make_pool):
+    pool = await make_pool(pool_size=1, lease_ttl_seconds=0.05, reaper_interval_seconds=3600)
+    info = await pool.acquire("slow")
+    lease_id = info.lease_id
+    executor = TaskExecutor(
+        repo_path=str(info.path),
+        github_token="x",
+        governor=ClaudeGovernor(),
+        lease_held=lambda: pool.holds_lease(info, lease_id),
+    )
+    head = git(info.path, "rev-parse", "HEAD")
+    await asyncio.sleep(0.1)
+    await pool.reap_expired_leases()
+    assert not pool.holds_lease(info, lease_id)
+
+    result = await executor.execute_task(
+        task_number="1.1",
+        task_title="late",
+        implementation="",
+        files=["late.txt"],
+        verification_steps=[],
+        worktree_path=info.path,
+        branch_name=info.branch,
+        skip_github_ops=True,
+    )
+
+    assert not result.success
+    assert "lease was lost" in result.error
+    assert git(info.path, "rev-parse", "HEAD") == head
+    await pool.wait_until_recycled()
@@ -0,0 +1,33 @@
+"""Adoption of worktrees left by a previous run in persistent mode."""
+
+from tests.conftest import git
+
+
+async def test_restarted_pool_adopts_worktrees_in_place(make_pool, tmp_path, repo):
+    first = await make_pool(pool_size=2, persistent=True)
+    paths = {info.id: info.path for info in first.worktrees.values()}
+    inodes = {wt_id: (path / "README.md").stat().st_ino for wt_id, path in paths.items()}
+    (paths["wt-2"] / "README.md").write_text("left dirty\n")
+    (paths["wt-2"] / "stray.txt").write_text("junk\n")
+    await first.cleanup()
+    assert all(path.exists() for path in paths.values())
+
+    second = await make_pool(pool_size=2, persistent=True)
+
+    assert second.num_free == 2
+    assert {info.path for info in second.worktrees.values()} == set(paths.values())
+    # The pristine worktree was not rebuilt; the dirty one was reset
+    assert (paths["wt-1"] / "README.md").stat().st_ino == inodes["wt-1"]
+    assert (paths["wt-2"] / "README.md").read_text() == "hello\n"
+    assert not (paths["wt-2"] / "stray.txt").exists()
+    assert second._provisioned["checkout"] == 0
+
+
+async def test_non_persistent_cleanup_removes_worktrees(make_pool, repo):
+    pool = await make_pool(pool_size=1)
+    path = next(iter(pool.worktrees.values())).path
+
+    await pool.cleanup()
+
+    assert not path.exists()
+    assert str(path) not in git(repo, "worktree", "list", "--porcelain")
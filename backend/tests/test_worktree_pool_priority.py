@@ -0,0 +1,57 @@
+"""Priority classes, aging and the interactive reserve in WorktreePool."""
+
+import asyncio
+import time
+
+from app.services.worktree_pool import LeasePriority, WorktreeAcquisitionTimeout, _Waiter
+
+
+async def test_waiters_are_served_by_priority_then_arrival(make_pool):
+    pool = await make_pool(pool_size=1, priority_aging_seconds=0)
+    held = await pool.acquire("holder")
+
+    order = []
+
+    async def wait(name, priority):
+        info = await pool.acquire(name, priority=priority)
+        order.append(name)
+        await pool.release(info)
+
+    tasks = [
+        asyncio.create_task(wait("background", LeasePriority.BACKGROUND)),
+        asyncio.create_task(wait("normal-1", LeasePriority.NORMAL)),
+        asyncio.create_task(wait("interactive", LeasePriority.INTERACTIVE)),
+        asyncio.create_task(wait("normal-2", LeasePriority.NORMAL)),
+    ]
+    await asyncio.sleep(0.05)
+    await pool.release(held)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=10)
+
+    assert order == ["interactive", "normal-1", "normal-2", "background"]
+
+
+async def test_reserve_is_kept_for_interactive_callers(make_pool):
+    pool = await make_pool(pool_size=2, reserved_worktrees=1)
+    first = await pool.acquire("normal", priority=LeasePriority.NORMAL)
+
+    with_reserve = asyncio.create_task(pool.acquire("normal-2", priority=LeasePriority.NORMAL, timeout=0.2))
+    interactive = await pool.acquire("interactive", priority=LeasePriority.INTERACTIVE, timeout=1)
+
+    assert interactive.id != first.id
+    result, = await asyncio.gather(with_reserve, return_exceptions=True)
+    assert isinstance(result, WorktreeAcquisitionTimeout)
+
+
+async def test_aged_waiter_is_not_jumped_on_the_direct_path(make_pool):
+    pool = await make_pool(pool_size=1, priority_aging_seconds=1.0)
+    aged = _Waiter(
+        future=asyncio.get_running_loop().create_future(),
+        test_name="background",
+        priority=LeasePriority.BACKGROUND,
+        enqueued_at=time.perf_counter() - 10,  # Aged well past NORMAL
+    )
+    pool._waiters.append(aged)
+
+    assert pool._free
+    assert not pool._can_take_free(LeasePriority.NORMAL, use_reserved=False)
+    aged.future.cancel()
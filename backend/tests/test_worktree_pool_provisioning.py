@@ -0,0 +1,21 @@
+"""Concurrent worktree provisioning in WorktreePool."""
+
+from tests.conftest import git
+
+
+async def test_concurrent_provisioning_creates_every_worktree(make_pool, repo):
+    pool = await make_pool(pool_size=6, provision_concurrency=6)
+
+    assert pool.num_free == 6
+    registered = git(repo, "worktree", "list", "--porcelain")
+    for info in pool.worktrees.values():
+        assert f"worktree {info.path}" in registered
+        assert (info.path / "README.md").read_text() == "hello\n"
+
+
+async def test_min_ready_returns_early_and_builds_the_rest(make_pool):
+    pool = await make_pool(pool_size=4, provision_concurrency=1, min_ready=1)
+
+    assert len(pool.worktrees) >= 1
+    await pool.wait_until_provisioned()
+    assert pool.num_free == 4
@@ -0,0 +1,53 @@
+"""Background recycling of released worktrees in WorktreePool."""
+
+from app.services.worktree_pool import WorktreeStatus
+
+
+async def test_release_returns_before_cleanup(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    (info.path / "README.md").write_text("changed\n")
+    (info.path / "scratch.txt").write_text("temp\n")
+
+    await pool.release(info)
+    assert info.status == WorktreeStatus.DIRTY
+    assert pool.num_dirty == 1
+
+    await pool.wait_until_recycled()
+
+    assert info.status == WorktreeStatus.FREE
+    assert (info.path / "README.md").read_text() == "hello\n"
+    assert not (info.path / "scratch.txt").exists()
+    metrics = pool.get_recycle_metrics()
+    assert metrics["recycled_total"] == 1
+    assert metrics["dirty_backlog"] == 0
+
+
+async def test_failed_recycle_marks_worktree_error(make_pool, monkeypatch):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+
+    async def broken(worktree):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(pool, "_cleanup_worktree", broken)
+    await pool.release(info)
+    await pool.wait_until_recycled()
+
+    # The healer may already be rebuilding it; it must not have been recycled
+    metrics = pool.get_recycle_metrics()
+    assert metrics["failed_total"] == 1
+    assert metrics["recycled_total"] == 0
+
+
+async def test_stale_release_is_ignored(make_pool):
+    pool = await make_pool(pool_size=1)
+    info = await pool.acquire("t1")
+    stale = info.lease_id
+    await pool.release(info, stale)
+    await pool.wait_until_recycled()
+    again = await pool.acquire("t2")
+
+    await pool.release(again, stale)
+
+    assert again.status == WorktreeStatus.BUSY
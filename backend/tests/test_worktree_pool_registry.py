@@ -0,0 +1,54 @@
+"""WorktreePoolRegistry routing and disk accounting."""
+
+from app.services.worktree_pool_registry import WorktreePoolRegistry, _disk_usage
+from tests.conftest import git
+
+
+def _make_repo(path):
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    (path / "f.txt").write_text("x")
+    git(path, "add", "-A")
+    git(path, "commit", "-q", "-m", "init")
+    return path
+
+
+def test_disk_usage_skips_excluded_dirs_and_counts_hardlinks_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "big").write_bytes(b"x" * 65536)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "link").hardlink_to(tmp_path / "a" / "big")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "other").write_bytes(b"y" * 65536)
+
+    everything = _disk_usage(tmp_path)
+    without_nested = _disk_usage(tmp_path, [tmp_path / "nested"])
+
+    assert everything - without_nested >= 65536
+    assert without_nested < 2 * 65536
+
+
+async def test_default_pool_does_not_count_other_pools(tmp_path, repo):
+    other_repo = _make_repo(tmp_path / "other")
+    registry = WorktreePoolRegistry(
+        base_dir=str(tmp_path / "pools"),
+        default_repo_path=str(repo),
+        pool_options={"pool_size": 1, "base_max_age_seconds": None},
+        max_total_worktrees=4,
+    )
+    try:
+        default = await registry.start()
+        other = await registry.get_pool(str(other_repo))
+        assert other.base_dir.is_relative_to(default.base_dir)
+        (other.base_dir / "ballast").write_bytes(b"z" * 1024 * 1024)
+
+        await registry._monitor_once()
+
+        status = {p["repo_path"]: p["disk_bytes"] for p in registry.get_status()["pools"]}
+        default_bytes = status[registry.default_key]
+        other_bytes = status[registry._key(str(other_repo))]
+        assert other_bytes >= 1024 * 1024
+        assert default_bytes < 1024 * 1024
+        assert registry.total_disk_bytes == default_bytes + other_bytes
+    finally:
+        await registry.close()
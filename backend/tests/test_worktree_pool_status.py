@@ -0,0 +1,26 @@
+"""WorktreePool status reporting."""
+
+
+async def test_get_status_keeps_flat_worktree_shape(make_pool):
+    pool = await make_pool(pool_size=2)
+    info = await pool.acquire("t1")
+
+    status = pool.get_status()
+
+    assert set(status) == set(pool.worktrees)
+    assert status[info.id]["status"] == "busy"
+    assert status[info.id]["current_test"] == "t1"
+    await pool.release(info)
+
+
+async def test_pool_status_sections(make_pool):
+    pool = await make_pool(pool_size=2, min_size=1, max_size=3)
+
+    details = pool.get_pool_status()
+
+    assert {"autoscaling", "base", "sparse", "affinity", "priorities", "provisioning",
+            "leases", "git_helpers", "dependency_cache"} <= set(details)
+    autoscaling = details["autoscaling"]
+    assert autoscaling["enabled"] is True
+    assert (autoscaling["min_size"], autoscaling["max_size"], autoscaling["size"]) == (1, 3, 2)
+    assert autoscaling["retiring"] == 0
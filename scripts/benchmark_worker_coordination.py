@@ -6,10 +6,15 @@ Tests task acquisition, locking, and worker pool efficiency without
 requiring actual task execution (no Claude CLI, no PRs).
 
 Focus: Worker coordination overhead and parallel efficiency
+
+Run with `handoff` as the only argument to benchmark just the worktree
+handoff latency (event-driven FIFO handoff vs. legacy 1s sleep polling).
 """
 
 import asyncio
+import statistics
 import sys
+import tempfile
 import time
 from pathlib import Path
 from datetime import datetime, timezone
@@ -29,7 +34,53 @@ from app.models.autonomous import (
     BatchStatus,
     SessionStatus,
 )
-from app.services.worktree_pool import WorktreePool
+from app.services.worktree_pool import (
+    WorktreePool,
+    WorktreeInfo,
+    WorktreeStatus,
+    WorktreeAcquisitionTimeout,
+)
+
+
+class InMemoryWorktreePool(WorktreePool):
+    """WorktreePool with git operations stubbed out, to isolate handoff cost."""
+
+    async def _fetch_base(self):
+        return None
+
+    async def _create_worktree(self, wt_id: str) -> None:
+        info = WorktreeInfo(
+            id=wt_id,
+            path=self.base_dir / wt_id,
+            branch=f"worktree-{wt_id}",
+            status=WorktreeStatus.FREE,
+            created_at=datetime.now(timezone.utc),
+        )
+        self._register(info)
+        self._hand_off(info)
+
+    async def _cleanup_worktree(self, worktree: WorktreeInfo) -> None:
+        return None
+
+
+class LegacyPollingWorktreePool(InMemoryWorktreePool):
+    """In-memory pool using the pre-FIFO acquire loop (scan + 1s sleep)."""
+
+    async def acquire(self, test_name=None, timeout: float = 300.0) -> WorktreeInfo:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            async with self._lock:
+                for wt_id, info in self.worktrees.items():
+                    if info.status == WorktreeStatus.FREE:
+                        if wt_id in self._free:
+                            self._free.remove(wt_id)
+                        return self._lease(wt_id, test_name)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(1.0, remaining))
+        raise WorktreeAcquisitionTimeout(f"No worktree available within {timeout}s")
+
 
 
 async def cleanup_previous_runs():
@@ -285,6 +336,74 @@ async def run_benchmark(num_tasks: int, num_workers: int, task_duration_ms: int)
     return efficiency
 
 
+async def run_handoff_benchmark(
+    pool_cls,
+    pool_size: int = 3,
+    num_acquirers: int = 24,
+    hold_ms: int = 50,
+) -> List[float]:
+    """
+    Measure release-to-acquire handoff latency under contention.
+
+    Every acquirer that has to wait records the time between the previous
+    holder calling release() and its own acquire() returning.
+
+    Returns:
+        Handoff latencies in milliseconds
+    """
+    released_at = {}
+    latencies = []
+
+    async def acquirer(i: int):
+        worktree = await pool.acquire(test_name=f"handoff-{i}", timeout=120.0)
+        acquired = time.perf_counter()
+        if worktree.id in released_at:
+            latencies.append((acquired - released_at[worktree.id]) * 1000)
+        await asyncio.sleep(hold_ms / 1000.0)
+        released_at[worktree.id] = time.perf_counter()
+        await pool.release(worktree)
+
+    with tempfile.TemporaryDirectory(prefix="handoff-bench-") as base_dir:
+        pool = pool_cls(pool_size=pool_size, base_dir=base_dir)
+        try:
+            await pool.initialize()
+            await asyncio.gather(*(acquirer(i) for i in range(num_acquirers)))
+        finally:
+            await pool.cleanup()
+    return latencies
+
+
+def print_latency_distribution(label: str, latencies: List[float]):
+    """Print p50/p90/p99/max of a latency sample."""
+    if not latencies:
+        print(f"  {label}: no contended handoffs")
+        return
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    print(
+        f"  {label}: n={len(ordered)}  "
+        f"p50={pct(50):.3f}ms  p90={pct(90):.3f}ms  p99={pct(99):.3f}ms  "
+        f"max={ordered[-1]:.3f}ms  mean={statistics.mean(ordered):.3f}ms"
+    )
+
+
+async def handoff_main():
+    """Compare handoff latency of legacy polling vs. FIFO handoff."""
+    print("="*70)
+    print("WORKTREE HANDOFF LATENCY (3 worktrees, 24 acquirers, 50ms hold)")
+    print("="*70)
+
+    before = await run_handoff_benchmark(LegacyPollingWorktreePool)
+    after = await run_handoff_benchmark(InMemoryWorktreePool)
+
+    print_latency_distribution("Before (1s polling)", before)
+    print_latency_distribution("After  (FIFO handoff)", after)
+    print("="*70)
+
+
 async def main():
     """Run coordination benchmarks."""
     print("="*70)
@@ -321,6 +440,10 @@ async def main():
     eff3 = await run_benchmark(6, 3, 500)
     results.append(("6 tasks, 3 workers", eff3))
 
+    # Benchmark 4: worktree handoff latency, no DB involved
+    print("\n🔥 TEST 4: Worktree handoff latency")
+    await handoff_main()
+
     # Summary
     print("\n" + "="*70)
     print("FINAL SUMMARY")
@@ -347,4 +470,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.argv[1:] == ["handoff"]:
+        asyncio.run(handoff_main())
+    else:
+        asyncio.run(main())